@@ -7,11 +7,16 @@ A streamlined version combining ManimCE's API with ManimGL's performance.
 __version__ = "0.1.0"
 __author__ = "maniml Contributors"
 
+import sys
+
 # Fix spinning cursor issue - disable debug GL in pyglet
 # This must be set before pyglet is imported by ManimGL
 try:
     import pyglet
     pyglet.options['debug_gl'] = False
+    # Headless renders may have no display to host pyglet's hidden shadow window
+    if '--render' in sys.argv or '--headless' in sys.argv:
+        pyglet.options['shadow_window'] = False
 except ImportError:
     pass
 
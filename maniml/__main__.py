@@ -16,15 +16,24 @@ Usage: maniml [file] [Scene] [options]
 Options:
   --help           Show this help message
   -p, --preview    Preview animation after rendering
+  --render         Render straight to a movie file without opening a window
+                   (alias: --headless)
+  -j, --processes N
+                   With --render, render the scene in N worker processes
+  --cache_segments Reuse movie segments of animations which haven't
+                   changed since the last render
 
 Examples:
   maniml example.py MyScene
   maniml example.py MyScene -p
+  maniml example.py MyScene --render
+  maniml example.py MyScene --render -j 8
 """)
         sys.exit(0)
     
     # Get the file and scene name
     script_file = sys.argv[1]
+    headless = '--render' in sys.argv or '--headless' in sys.argv
     
     if not os.path.exists(script_file):
         print(f"Error: File '{script_file}' not found")
@@ -44,10 +53,21 @@ Examples:
             if hasattr(module, scene_name):
                 scene_class = getattr(module, scene_name)
                 if callable(scene_class):
-                    # Always create window for preview mode (default)
-                    from maniml.manimgl_core.window import Window
-                    window = Window()
-                    scene = scene_class(window=window)
+                    from maniml.manimgl_core.config import manim_config
+                    n_processes = manim_config.run.processes
+                    if headless and n_processes > 1:
+                        from maniml.scene.parallel_render import render_in_parallel
+                        render_in_parallel(script_file, scene_name, scene_class, n_processes)
+                        return
+                    if headless:
+                        # No window: the camera falls back to a standalone
+                        # context and frames go straight to the movie file
+                        scene = scene_class()
+                    else:
+                        # Create window for preview mode (default)
+                        from maniml.manimgl_core.window import Window
+                        window = Window()
+                        scene = scene_class(window=window)
                     # Pass the actual script file path to the scene
                     scene._scene_filepath = os.path.abspath(script_file)
                     scene.run()
@@ -44,6 +44,8 @@ class LaggedStartMap(GLLaggedStartMap):
 class Wait(maniml.manimgl_core.animation.animation.Animation):
     """CE-compatible Wait animation."""
     
+    alpha_only_interpolation = True
+    
     def __init__(self, duration=1.0, stop_condition=None, **kwargs):
         # Create a dummy mobject
         from maniml.manimgl_core.mobject.mobject import Mobject
@@ -70,6 +72,8 @@ class Wait(maniml.manimgl_core.animation.animation.Animation):
 class EmptyAnimation(maniml.manimgl_core.animation.animation.Animation):
     """CE-compatible EmptyAnimation - does nothing."""
     
+    alpha_only_interpolation = True
+    
     def __init__(self, mobject=None, **kwargs):
         if mobject is None:
             from maniml.manimgl_core.mobject.mobject import Mobject
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from copy import deepcopy
 
+import numpy as np
+
 from maniml.manimgl_core.mobject.mobject import _AnimationBuilder
 from maniml.manimgl_core.mobject.mobject import Mobject
 from maniml.manimgl_core.utils.iterables import remove_list_redundancies
+from maniml.manimgl_core.utils.rate_functions import evaluate_rate_func
 from maniml.manimgl_core.utils.rate_functions import smooth
 from maniml.manimgl_core.utils.simple_functions import clip
 
@@ -18,9 +21,18 @@ if TYPE_CHECKING:
 
 DEFAULT_ANIMATION_RUN_TIME = 1.0
 DEFAULT_ANIMATION_LAG_RATIO = 0
+# Families smaller than this have their sub-alphas computed one by one,
+# which for so few is quicker than the fixed overhead of numpy calls
+MIN_FAMILY_SIZE_FOR_ARRAY_SUB_ALPHAS = 16
 
 
 class Animation(object):
+    # Set in the body of a class whose interpolation methods leave the
+    # mobjects in a state that depends on alpha alone, and not on other
+    # mobjects or on earlier calls. It isn't inherited by subclasses
+    # which override those methods; see depends_only_on_alpha.
+    alpha_only_interpolation: bool = True
+
     def __init__(
         self,
         mobject: Mobject,
@@ -138,6 +150,20 @@ class Animation(object):
     def interpolate(self, alpha: float) -> None:
         self.interpolate_mobject(alpha)
 
+    def depends_only_on_alpha(self) -> bool:
+        """
+        Whether interpolate(alpha) always leaves the mobjects in the same
+        state for a given alpha, so that once the animation rests at 0 or 1
+        it needn't be interpolated again. That holds when every class
+        defining one of the interpolation methods sets alpha_only_interpolation
+        itself, which rules out user subclasses and the likes of UpdateFromFunc.
+        """
+        for name in ["interpolate", "interpolate_mobject", "interpolate_submobject"]:
+            owner = next(cls for cls in type(self).__mro__ if name in vars(cls))
+            if not vars(owner).get("alpha_only_interpolation", False):
+                return False
+        return True
+
     def update(self, alpha: float) -> None:
         """
         This method shouldn't exist, but it's here to
@@ -152,8 +178,8 @@ class Animation(object):
         return alpha
 
     def interpolate_mobject(self, alpha: float) -> None:
-        for i, mobs in enumerate(self.families):
-            sub_alpha = self.get_sub_alpha(self.time_spanned_alpha(alpha), i, len(self.families))
+        sub_alphas = self.get_sub_alphas(self.time_spanned_alpha(alpha), len(self.families))
+        for mobs, sub_alpha in zip(self.families, sub_alphas):
             self.interpolate_submobject(*mobs, sub_alpha)
 
     def interpolate_submobject(
@@ -181,6 +207,23 @@ class Animation(object):
         raw_sub_alpha = clip((value - lower), 0, 1)
         return self.rate_func(raw_sub_alpha)
 
+    def get_sub_alphas(self, alpha: float, num_submobjects: int) -> np.ndarray:
+        """
+        Array of get_sub_alpha(alpha, index, num_submobjects) for each index
+        """
+        if num_submobjects < MIN_FAMILY_SIZE_FOR_ARRAY_SUB_ALPHAS \
+                or type(self).get_sub_alpha is not Animation.get_sub_alpha:
+            return np.array([
+                self.get_sub_alpha(alpha, index, num_submobjects)
+                for index in range(num_submobjects)
+            ], dtype=float)
+        lag_ratio = self.lag_ratio
+        full_length = (num_submobjects - 1) * lag_ratio + 1
+        value = alpha * full_length
+        lowers = np.arange(num_submobjects) * lag_ratio
+        raw_sub_alphas = np.clip(value - lowers, 0, 1)
+        return evaluate_rate_func(self.rate_func, raw_sub_alphas)
+
     # Getters and setters
     def set_run_time(self, run_time: float):
         self.run_time = run_time
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from maniml.manimgl_core.animation.animation import Animation
 from maniml.manimgl_core.animation.animation import prepare_animation
 from maniml.manimgl_core.mobject.mobject import _AnimationBuilder
@@ -25,6 +27,8 @@ DEFAULT_LAGGED_START_LAG_RATIO = 0.05
 
 
 class AnimationGroup(Animation):
+    alpha_only_interpolation: bool = True
+
     def __init__(
         self,
         *args: AnimationType | Iterable[AnimationType],
@@ -64,6 +68,24 @@ class AnimationGroup(Animation):
         self.group.set_animating_status(True)
         for anim in self.animations:
             anim.begin()
+        # Each animation's begin leaves it interpolated to 0
+        self.last_time = 0
+        # Those whose interpolation may depend on more than alpha, like
+        # UpdateFromFunc, are interpolated on every call
+        self.always_interpolated = np.array([
+            index for index, anim in enumerate(self.animations)
+            if not anim.depends_only_on_alpha()
+        ], dtype=int)
+        # Animations of a shared mobject each set it afresh from their own
+        # starting state, so whenever one of them is interpolated, all are
+        self.shared_indices = self.get_shared_indices()
+        # Updating does nothing for animations without any updaters,
+        # while nested groups filter their own animations
+        self.anims_to_update = [
+            anim for anim in self.animations
+            if isinstance(anim, AnimationGroup)
+            or any(mob.has_updaters() for mob in anim.get_all_mobjects_to_update())
+        ]
         # self.init_run_time()
 
     def finish(self) -> None:
@@ -76,9 +98,14 @@ class AnimationGroup(Animation):
             anim.clean_up_from_scene(scene)
 
     def update_mobjects(self, dt: float) -> None:
-        for anim in self.animations:
+        for anim in self.anims_to_update:
             anim.update_mobjects(dt)
 
+    def depends_only_on_alpha(self) -> bool:
+        return super().depends_only_on_alpha() and all(
+            anim.depends_only_on_alpha() for anim in self.animations
+        )
+
     def calculate_max_end_time(self) -> None:
         self.max_end_time = max(
             (awt[2] for awt in self.anims_with_timings),
@@ -104,6 +131,58 @@ class AnimationGroup(Animation):
             curr_time = interpolate(
                 start_time, end_time, lag_ratio
             )
+        self.build_timing_table()
+
+    def build_timing_table(self) -> None:
+        """
+        Sorts the animations' windows by start time, so that those
+        overlapping a given stretch of time can be found by bisection
+        """
+        self.start_times = np.array([awt[1] for awt in self.anims_with_timings], dtype=float)
+        self.end_times = np.array([awt[2] for awt in self.anims_with_timings], dtype=float)
+        self.start_order = np.argsort(self.start_times, kind="stable")
+        self.sorted_start_times = self.start_times[self.start_order]
+        self.max_anim_time = max(self.end_times - self.start_times, default=0)
+
+    def get_changing_indices(self, time1: float, time2: float) -> np.ndarray:
+        """
+        Indices, in order, of the animations whose sub-alpha can differ
+        between time1 and time2, i.e. those whose window overlaps the
+        stretch between them. All others are resting at 0 or 1.
+        """
+        low, high = min(time1, time2), max(time1, time2)
+        # A window ending after low can't start much before low - max_anim_time,
+        # with some slack for rounding
+        lower_index = np.searchsorted(self.sorted_start_times, low - 1.001 * self.max_anim_time)
+        upper_index = np.searchsorted(self.sorted_start_times, high)
+        candidates = self.start_order[lower_index:upper_index]
+        return np.sort(candidates[self.end_times[candidates] > low])
+
+    def get_shared_indices(self) -> list[np.ndarray]:
+        """
+        For each animation, the indices, in order, of all those linked to it
+        through mobjects their families share, or an empty array if it
+        shares none.
+        """
+        parents = list(range(len(self.animations)))
+
+        def find(index):
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+
+        owners = dict()
+        for index, anim in enumerate(self.animations):
+            for mob in anim.mobject.get_family():
+                parents[find(owners.setdefault(id(mob), index))] = find(index)
+        roots = np.array([find(index) for index in range(len(parents))], dtype=int)
+        counts = np.bincount(roots, minlength=len(parents))
+        no_indices = np.zeros(0, dtype=int)
+        return [
+            np.flatnonzero(roots == root) if counts[root] > 1 else no_indices
+            for root in roots
+        ]
 
     def interpolate(self, alpha: float) -> None:
         # Note, if the run_time of AnimationGroup has been
@@ -111,17 +190,32 @@ class AnimationGroup(Animation):
         # times might not correspond to actual times,
         # e.g. of the surrounding scene.  Instead they'd
         # be a rescaled version.  But that's okay!
+        # Of the animations depending only on alpha, just those whose window
+        # overlaps the time since the last call need interpolating, which
+        # includes a final call for those which have just finished, along
+        # with any sharing a mobject with them.
         time = alpha * self.max_end_time
-        for anim, start_time, end_time in self.anims_with_timings:
+        indices = self.get_changing_indices(self.last_time, time)
+        shared = [self.shared_indices[index] for index in indices]
+        shared = [sub_indices for sub_indices in shared if len(sub_indices) > 0]
+        if len(shared) > 0:
+            indices = np.union1d(indices, np.concatenate(shared))
+        if len(self.always_interpolated) > 0:
+            indices = np.union1d(indices, self.always_interpolated)
+        for index in indices:
+            anim, start_time, end_time = self.anims_with_timings[index]
             anim_time = end_time - start_time
             if anim_time == 0:
                 sub_alpha = 0
             else:
                 sub_alpha = clip((time - start_time) / anim_time, 0, 1)
             anim.interpolate(sub_alpha)
+        self.last_time = time
 
 
 class Succession(AnimationGroup):
+    alpha_only_interpolation: bool = True
+
     def __init__(
         self,
         *animations: Animation,
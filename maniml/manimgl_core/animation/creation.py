@@ -26,6 +26,8 @@ class ShowPartial(Animation, ABC):
     """
     Abstract class for ShowCreation and ShowPassingFlash
     """
+    alpha_only_interpolation: bool = True
+
     def __init__(self, mobject: Mobject, should_match_start: bool = False, **kwargs):
         self.should_match_start = should_match_start
         super().__init__(mobject, **kwargs)
@@ -72,6 +74,8 @@ class Uncreate(ShowCreation):
 
 
 class DrawBorderThenFill(Animation):
+    alpha_only_interpolation: bool = True
+
     def __init__(
         self,
         vmobject: VMobject,
@@ -175,6 +179,8 @@ class Write(DrawBorderThenFill):
 
 
 class ShowIncreasingSubsets(Animation):
+    alpha_only_interpolation: bool = True
+
     def __init__(
         self,
         group: Mobject,
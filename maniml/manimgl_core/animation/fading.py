@@ -151,6 +151,8 @@ class VFadeIn(Animation):
     """
     VFadeIn and VFadeOut only work for VMobjects,
     """
+    alpha_only_interpolation: bool = True
+
     def __init__(self, vmobject: VMobject, suspend_mobject_updating: bool = False, **kwargs):
         super().__init__(
             vmobject,
@@ -173,6 +175,8 @@ class VFadeIn(Animation):
 
 
 class VFadeOut(VFadeIn):
+    alpha_only_interpolation: bool = True
+
     def __init__(
         self,
         vmobject: VMobject,
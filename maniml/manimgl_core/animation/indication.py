@@ -192,6 +192,8 @@ class ShowPassingFlash(ShowPartial):
 
 
 class VShowPassingFlash(Animation):
+    alpha_only_interpolation: bool = True
+
     def __init__(
         self,
         vmobject: VMobject,
@@ -399,10 +401,7 @@ class TurnInsideOut(Transform):
         super().__init__(mobject, path_arc=path_arc, **kwargs)
 
     def create_target(self) -> Mobject:
-        result = self.mobject.copy().reverse_points()
-        if isinstance(result, VMobject):
-            result.refresh_triangulation()
-        return result
+        return self.mobject.copy().reverse_points()
 
 
 class FlashyFadeIn(AnimationGroup):
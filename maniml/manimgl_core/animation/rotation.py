@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 
 class Rotating(Animation):
+    alpha_only_interpolation: bool = True
+
     def __init__(
         self,
         mobject: Mobject,
@@ -45,6 +47,7 @@ class Rotating(Animation):
             self.starting_mobject.family_members_with_points(),
         )
         for sm1, sm2 in pairs:
+            sm1.unshare_data()
             for key in sm1.pointlike_data_keys:
                 sm1.data[key][:] = sm2.data[key]
         self.mobject.rotate(
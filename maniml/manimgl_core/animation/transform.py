@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import itertools as it
 
 import numpy as np
 
@@ -21,8 +22,14 @@ if TYPE_CHECKING:
     from maniml.manimgl_core.typing import ManimColor
 
 
+# Packing a family's data costs more per frame than it saves
+# for families smaller than this
+MIN_FAMILY_SIZE_FOR_PACKING = 3
+
+
 class Transform(Animation):
     replace_mobject_with_target_in_scene: bool = False
+    alpha_only_interpolation: bool = True
 
     def __init__(
         self,
@@ -37,6 +44,7 @@ class Transform(Animation):
         self.path_arc = path_arc
         self.path_arc_axis = path_arc_axis
         self.path_func = path_func
+        self.packs = []
         super().__init__(mobject, **kwargs)
         self.init_path_func()
 
@@ -64,16 +72,91 @@ class Transform(Animation):
             # change the structure of both arguments
             self.target_copy = self.target_mobject.copy()
         self.mobject.align_data_and_family(self.target_copy)
+        self.packs = []
         super().begin()
         if not self.mobject.has_updaters():
             self.mobject.lock_matching_data(
                 self.starting_mobject,
                 self.target_copy,
             )
+            self.pack_families()
 
     def finish(self) -> None:
         super().finish()
         self.mobject.unlock_data()
+        self.packs = []
+
+    def pack_families(self) -> None:
+        """
+        Gather the data of all family members which would be interpolated
+        with Mobject.interpolate along a straight path into a few contiguous
+        arrays, one per data dtype, so that each frame can interpolate them
+        all at once rather than member by member.
+        """
+        if len(self.families) < MIN_FAMILY_SIZE_FOR_PACKING \
+                or self.path_func is not straight_path \
+                or type(self).interpolate_submobject is not Transform.interpolate_submobject \
+                or self.target_copy.has_updaters():
+            return
+
+        id_counts = dict()
+        for sm, _, _ in self.families:
+            id_counts[id(sm)] = id_counts.get(id(sm), 0) + 1
+
+        indices_by_dtype = dict()
+        for index, (sm, start, target) in enumerate(self.families):
+            if type(sm).interpolate is not Mobject.interpolate or id_counts[id(sm)] > 1:
+                continue
+            if not sm.data.dtype == start.data.dtype == target.data.dtype:
+                continue
+            if not len(sm.data) == len(start.data) == len(target.data):
+                continue
+            if not sm.locked_data_keys:
+                # Mobject.interpolate already does these in place, all at once
+                continue
+            indices_by_dtype.setdefault(sm.data.dtype, []).append(index)
+
+        self.packs = [
+            _PackedFamilyData([self.families[i] for i in indices], indices)
+            for indices in indices_by_dtype.values()
+        ]
+        packed = set(it.chain(*(pack.indices for pack in self.packs)))
+        self.unpacked_indices = [i for i in range(len(self.families)) if i not in packed]
+
+        # Anything with a changed submobject gets noted as changed, as with
+        # the recursion in Mobject.note_changed_data
+        family_ids = set(id_counts)
+        to_note = dict()
+        to_visit = list(it.chain(*(pack.changed_mobjects for pack in self.packs)))
+        while to_visit:
+            mob = to_visit.pop()
+            if id(mob) in to_note or id(mob) not in family_ids:
+                continue
+            to_note[id(mob)] = mob
+            to_visit.extend(mob.parents)
+        self.mobjects_to_note = list(to_note.values())
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if self.packs and not all(pack.is_intact() for pack in self.packs):
+            # Something reassigned the data of a packed family member
+            self.packs = []
+        if not self.packs:
+            super().interpolate_mobject(alpha)
+            return
+
+        alpha = self.time_spanned_alpha(alpha)
+        n_members = len(self.families)
+        sub_alphas = self.get_sub_alphas(alpha, n_members)
+        for pack in self.packs:
+            pack.interpolate(sub_alphas[pack.indices])
+        for mob in self.mobjects_to_note:
+            mob.note_changed_data(recurse_up=False)
+        if self.mobjects_to_note:
+            self.mobject.note_changed_data()
+
+        for i in self.unpacked_indices:
+            sub_alpha = self.get_sub_alpha(alpha, i, n_members)
+            self.interpolate_submobject(*self.families[i], sub_alpha)
 
     def create_target(self) -> Mobject:
         # Has no meaningful effect here, but may be useful
@@ -329,3 +412,84 @@ class CyclicReplace(Transform):
 class Swap(CyclicReplace):
     """Alternate name for CyclicReplace"""
     pass
+
+
+class _PackedFamilyData(object):
+    """
+    Data of Transform family members sharing a dtype, concatenated so that
+    they can all be interpolated together. Each member's data and bounding
+    box are reassigned to views into the packed arrays.
+    """
+    def __init__(
+        self,
+        families: list[tuple[Mobject, Mobject, Mobject]],
+        indices: list[int],
+    ):
+        self.indices = np.array(indices, dtype=int)
+        self.mobjects = [sm for sm, _, _ in families]
+        self.lengths = np.array([len(sm.data) for sm in self.mobjects], dtype=int)
+        ends = np.cumsum(self.lengths)
+        starts = ends - self.lengths
+
+        self.data = np.concatenate([sm.data for sm in self.mobjects])
+        self.bounding_boxes = np.array([sm.bounding_box for sm in self.mobjects])
+        self.start_bounding_boxes = np.array([start.bounding_box for _, start, _ in families])
+        self.target_bounding_boxes = np.array([target.bounding_box for _, _, target in families])
+        for sm, start, end, bounding_box in zip(self.mobjects, starts, ends, self.bounding_boxes):
+            sm.data = self.data[start:end]
+            sm.bounding_box = bounding_box
+        self.datas = [(sm.data, sm.bounding_box) for sm in self.mobjects]
+
+        # For each key, which rows to interpolate, and their start and target values
+        self.key_to_rows = dict()
+        for key in self.data.dtype.names:
+            unlocked = np.array([key not in sm.locked_data_keys for sm in self.mobjects])
+            if not unlocked.any():
+                continue
+            rows = np.repeat(unlocked, self.lengths)
+            start_data = np.concatenate([start.data[key] for _, start, _ in families])
+            target_data = np.concatenate([target.data[key] for _, _, target in families])
+            if rows.all():
+                rows = slice(None)
+            self.key_to_rows[key] = (rows, start_data[rows], target_data[rows])
+
+        self.uniform_tuples = [
+            (index, sm.uniforms, key, start.uniforms, target.uniforms)
+            for index, (sm, start, target) in enumerate(families)
+            for key in sm.uniforms
+            if key not in sm.locked_uniform_keys
+            if key in start.uniforms and key in target.uniforms
+        ]
+        # Those with only uniforms changing are noted too, so as to keep
+        # their content versions current
+        uniform_indices = set(index for index, *_ in self.uniform_tuples)
+        self.changed_mobjects = [
+            sm for index, sm in enumerate(self.mobjects)
+            if index in uniform_indices
+            or any(key not in sm.locked_data_keys for key in sm.data.dtype.names)
+        ]
+
+    def is_intact(self) -> bool:
+        return all(
+            sm.data is data and sm.bounding_box is bounding_box
+            for sm, (data, bounding_box) in zip(self.mobjects, self.datas)
+        )
+
+    def interpolate(self, alphas: np.ndarray) -> None:
+        row_alphas = np.repeat(alphas, self.lengths)
+        for key, (rows, start_data, target_data) in self.key_to_rows.items():
+            row_alpha = row_alphas[rows].reshape(-1, *(1 for _ in start_data.shape[1:]))
+            self.data[key][rows] = (1 - row_alpha) * start_data + row_alpha * target_data
+
+        # As straight_path does with out, lerp from whichever end is nearer
+        box_alphas = alphas[:, np.newaxis, np.newaxis]
+        box_diffs = self.target_bounding_boxes - self.start_bounding_boxes
+        self.bounding_boxes[:] = np.where(
+            box_alphas < 0.5,
+            self.start_bounding_boxes + box_diffs * box_alphas,
+            self.target_bounding_boxes + box_diffs * (box_alphas - 1),
+        )
+
+        for index, uniforms, key, start_uniforms, target_uniforms in self.uniform_tuples:
+            alpha = alphas[index]
+            uniforms[key] = (1 - alpha) * start_uniforms[key] + alpha * target_uniforms[key]
@@ -71,7 +71,12 @@ class Camera(object):
 
     def init_context(self) -> None:
         if self.window is None:
-            self.ctx: moderngl.Context = moderngl.create_standalone_context()
+            try:
+                self.ctx: moderngl.Context = moderngl.create_standalone_context()
+            except Exception:
+                # No display server to attach to (e.g. a headless render
+                # box), so ask for an EGL context instead
+                self.ctx: moderngl.Context = moderngl.create_standalone_context(backend="egl")
         else:
             self.ctx: moderngl.Context = self.window.ctx
 
@@ -146,6 +151,20 @@ class Camera(object):
             dtype=dtype,
         )
 
+    def read_raw_fbo_data_into(self, buffer, dtype: str = 'f1') -> None:
+        """
+        Like get_raw_fbo_data, but reads into an existing buffer. When that
+        buffer is a moderngl.Buffer, the read goes through a pixel pack
+        buffer and returns without waiting for the GPU
+        """
+        self.blit(self.fbo, self.draw_fbo)
+        self.draw_fbo.read_into(
+            buffer,
+            viewport=self.draw_fbo.viewport,
+            components=self.n_channels,
+            dtype=dtype,
+        )
+
     def get_image(self) -> Image.Image:
         return Image.frombytes(
             'RGBA',
@@ -154,13 +173,48 @@ class Camera(object):
             'raw', 'RGBA', 0, -1
         )
 
-    def get_pixel_array(self) -> np.ndarray:
-        raw = self.get_raw_fbo_data(dtype='f4')
-        flat_arr = np.frombuffer(raw, dtype='f4')
-        arr = flat_arr.reshape([*reversed(self.draw_fbo.size), self.n_channels])
-        arr = arr[::-1]
-        # Convert from float
-        return (self.rgb_max_val * arr).astype(self.pixel_array_dtype)
+    def get_pixel_array_shape(self) -> tuple[int, int, int]:
+        width, height = self.draw_fbo.size
+        return (height, width, self.n_channels)
+
+    def get_pixel_array_buffer(self) -> np.ndarray:
+        """
+        Allocate an array which get_pixel_array can read frames into
+        """
+        return np.empty(self.get_pixel_array_shape(), dtype=self.pixel_array_dtype)
+
+    def get_pixel_array(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Return the current frame as a (height, width, n_channels) array,
+        top row first.
+
+        If out is given (e.g. from get_pixel_array_buffer), the frame is
+        written into it, and the returned array is a vertically flipped view
+        of out.  For uint8 pixels, the framebuffer is read straight into it
+        with no intermediate copies, so reusing one buffer across frames
+        avoids any per-frame allocation.
+        """
+        if out is None:
+            out = self.get_pixel_array_buffer()
+        elif out.shape != self.get_pixel_array_shape() \
+                or out.dtype != self.pixel_array_dtype \
+                or not out.flags.c_contiguous:
+            raise ValueError(
+                "Pixel array buffer must be a C-contiguous "
+                f"{np.dtype(self.pixel_array_dtype)} array "
+                f"of shape {self.get_pixel_array_shape()}"
+            )
+
+        if self.pixel_array_dtype != np.uint8:
+            raw = self.get_raw_fbo_data(dtype='f4')
+            flat_arr = np.frombuffer(raw, dtype='f4')
+            arr = flat_arr.reshape([*reversed(self.draw_fbo.size), self.n_channels])
+            # Convert from float
+            out[:] = self.rgb_max_val * arr
+        else:
+            self.read_raw_fbo_data_into(out)
+        # OpenGL rows run bottom to top
+        return out[::-1]
 
     # Needed?
     def get_texture(self) -> moderngl.Texture:
@@ -50,6 +50,7 @@ class CameraFrame(Mobject):
 
     def set_orientation(self, rotation: Rotation):
         self.uniforms["orientation"][:] = rotation.as_quat()
+        self.note_changed_uniforms()
         return self
 
     def get_orientation(self):
@@ -70,6 +70,18 @@ def parse_cli():
             action="store_true",
             help="Render the scene as a movie file",
         )
+        parser.add_argument(
+            "--render", "--headless",
+            dest="render",
+            action="store_true",
+            help="Render the scene as a movie file without opening a window",
+        )
+        parser.add_argument(
+            "-j", "--processes",
+            type=int,
+            help="With --render, split the scene by play() call and render " + \
+                 "the pieces in this many worker processes",
+        )
         parser.add_argument(
             "-s", "--skip_animations",
             action="store_true",
@@ -150,6 +162,12 @@ def parse_cli():
             help="Divide the output animation into individual movie files " +
                  "for each animation",
         )
+        parser.add_argument(
+            "--cache_segments",
+            action="store_true",
+            help="Cache the movie segment rendered for each animation, and " +
+                 "reuse those whose inputs are unchanged on later renders",
+        )
         parser.add_argument(
             "--file_name",
             help="Name for the movie or image file",
@@ -225,7 +243,7 @@ def parse_cli():
                  "across different files",
         )
         args = parser.parse_args()
-        args.write_file = any([args.write_file, args.open, args.finder])
+        args.write_file = any([args.write_file, args.open, args.finder, args.render])
         return args
     except argparse.ArgumentError as err:
         log.error(str(err))
@@ -270,6 +288,7 @@ def update_file_writer_config(config: Dict, args: Namespace):
     file_writer_config.update(
         write_to_movie=(not args.skip_animations and args.write_file),
         subdivide_output=args.subdivide,
+        cache_segments=args.cache_segments,
         save_last_frame=(args.skip_animations and args.write_file),
         png_mode=("RGBA" if args.transparent else "RGB"),
         movie_file_extension=(get_file_ext(args)),
@@ -321,7 +340,9 @@ def update_run_config(config: Dict, args: Namespace):
         scene_names=args.scene_names,
         quiet=args.quiet or args.write_all,
         write_all=args.write_all,
-        show_in_window=not args.write_file
+        show_in_window=not args.write_file,
+        headless=args.render,
+        processes=args.processes or 1,
     )
 
 
@@ -187,12 +187,16 @@ class CoordinateSystem(ABC):
         **kwargs
     ) -> ParametricCurve:
         x_range = x_range or self.x_range
-        t_range = np.ones(3)
-        t_range[:len(x_range)] = x_range
-        # For axes, the third coordinate of x_range indicates
-        # tick frequency.  But for functions, it indicates a
-        # sample frequency
-        t_range[2] /= self.num_sampled_graph_points_per_tick
+        if len(x_range) == 2:
+            # With no step given, the curve samples itself adaptively
+            t_range = np.array(x_range, dtype=float)
+        else:
+            t_range = np.ones(3)
+            t_range[:len(x_range)] = x_range
+            # For axes, the third coordinate of x_range indicates
+            # tick frequency.  But for functions, it indicates a
+            # sample frequency
+            t_range[2] /= self.num_sampled_graph_points_per_tick
 
         def parametric_function(t: float) -> Vect3:
             return self.c2p(t, function(t))
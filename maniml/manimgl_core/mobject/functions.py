@@ -3,6 +3,7 @@ from __future__ import annotations
 from isosurfaces import plot_isoline
 import numpy as np
 
+from maniml.manimgl_core.constants import DEFAULT_PIXEL_WIDTH, FRAME_WIDTH
 from maniml.manimgl_core.constants import FRAME_X_RADIUS, FRAME_Y_RADIUS
 from maniml.manimgl_core.constants import YELLOW
 from maniml.manimgl_core.mobject.types.vectorized_mobject import VMobject
@@ -11,18 +12,28 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable, Sequence, Tuple
-    from maniml.manimgl_core.typing import ManimColor, Vect3
+    from maniml.manimgl_core.typing import ManimColor, Vect3, Vect3Array
 
 
 class ParametricCurve(VMobject):
     def __init__(
         self,
         t_func: Callable[[float], Sequence[float] | Vect3],
-        t_range: Tuple[float, float, float] = (0, 1, 0.1),
+        # If no step is given, i.e. t_range = (t_min, t_max), samples are
+        # chosen adaptively, more densely where the curve bends more
+        t_range: Tuple[float, float, float] | Tuple[float, float] = (0, 1, 0.1),
         epsilon: float = 1e-8,
         # TODO, automatically figure out discontinuities
         discontinuities: Sequence[float] = [],
         use_smoothing: bool = True,
+        # For adaptive sampling, how far (in pixels, at the default
+        # resolution and frame size) the curve may stray from the
+        # straight line between two neighboring samples
+        pixel_tolerance: float = 0.5,
+        # For adaptive sampling, the number of evenly spaced intervals to
+        # begin with, and how many times each may then be halved
+        n_initial_samples: int = 32,
+        max_refinement_depth: int = 10,
         **kwargs
     ):
         self.t_func = t_func
@@ -30,21 +41,95 @@ class ParametricCurve(VMobject):
         self.epsilon = epsilon
         self.discontinuities = discontinuities
         self.use_smoothing = use_smoothing
+        self.pixel_tolerance = pixel_tolerance
+        self.n_initial_samples = n_initial_samples
+        self.max_refinement_depth = max_refinement_depth
+        # Whether t_func can be called on an array of t values. None
+        # means this has yet to be checked.
+        self.t_func_is_vectorized: bool | None = None
         super().__init__(**kwargs)
 
     def get_point_from_function(self, t: float) -> Vect3:
         return np.array(self.t_func(t))
 
+    def get_points_from_function(self, t_values: Sequence[float]) -> Vect3Array:
+        """
+        Evaluate t_func at each of the given t values, calling it once on
+        the whole array when t_func supports that, and once per value
+        otherwise
+        """
+        t_values = np.asarray(t_values, dtype=float)
+        if self.t_func_is_vectorized is not False and len(t_values) > 2:
+            points = self.get_points_from_vectorized_function(t_values)
+            self.t_func_is_vectorized = points is not None
+            if points is not None:
+                return points
+        return np.array([self.t_func(t) for t in t_values])
+
+    def get_points_from_vectorized_function(self, t_values: np.ndarray) -> Vect3Array | None:
+        # The result of calling t_func on an array may be an array of
+        # points, or one array (or scalar) per coordinate. Either way, it
+        # only counts if it agrees with calling t_func on the endpoints.
+        ends = np.array([self.t_func(t_values[0]), self.t_func(t_values[-1])], dtype=float)
+        try:
+            result = self.t_func(t_values)
+            candidates = []
+            if isinstance(result, np.ndarray) and result.shape == (len(t_values), ends.shape[1]):
+                candidates.append(result)
+            if len(result) == ends.shape[1]:
+                candidates.append(np.stack(np.broadcast_arrays(*result, t_values)[:-1], axis=-1))
+        except Exception:
+            return None
+        for points in candidates:
+            if points.shape == (len(t_values), ends.shape[1]) and \
+                    np.allclose(points[[0, -1]], ends, equal_nan=True):
+                return points.astype(float)
+        return None
+
+    def get_adaptive_samples(self, t1: float, t2: float) -> tuple[np.ndarray, Vect3Array]:
+        """
+        Sample t_func between t1 and t2, repeatedly halving any interval
+        whose midpoint lands further than the tolerance from the chord
+        between its ends. Returns the sample times and the points there.
+        """
+        tolerance = self.pixel_tolerance * FRAME_WIDTH / DEFAULT_PIXEL_WIDTH
+        ts = np.linspace(t1, t2, self.n_initial_samples + 1)
+        points = self.get_points_from_function(ts)
+        # Indices of the intervals [ts[i], ts[i + 1]] still to be checked
+        to_check = np.arange(len(ts) - 1)
+        for _ in range(self.max_refinement_depth):
+            if len(to_check) == 0:
+                break
+            mid_ts = 0.5 * (ts[to_check] + ts[to_check + 1])
+            mid_points = self.get_points_from_function(mid_ts)
+            chord_mids = 0.5 * (points[to_check] + points[to_check + 1])
+            errors = np.linalg.norm(mid_points - chord_mids, axis=1)
+            # Non-finite values (e.g. near an asymptote) also mean refining
+            to_split = ~(errors <= tolerance)
+
+            insert_at = to_check[to_split] + 1
+            ts = np.insert(ts, insert_at, mid_ts[to_split])
+            points = np.insert(points, insert_at, mid_points[to_split], axis=0)
+            # Each split interval becomes two, at new indices shifted by the
+            # number of samples inserted before them
+            new_starts = to_check[to_split] + np.arange(to_split.sum())
+            to_check = np.array([new_starts, new_starts + 1]).T.flatten()
+        return ts, points
+
     def init_points(self):
-        t_min, t_max, step = self.t_range
+        t_min, t_max = self.t_range[:2]
+        step = self.t_range[2] if len(self.t_range) > 2 else None
 
         jumps = np.array(self.discontinuities)
         jumps = jumps[(jumps > t_min) & (jumps < t_max)]
         boundary_times = [t_min, t_max, *(jumps - self.epsilon), *(jumps + self.epsilon)]
         boundary_times.sort()
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
-            t_range = [*np.arange(t1, t2, step), t2]
-            points = np.array([self.t_func(t) for t in t_range])
+            if step is None:
+                points = self.get_adaptive_samples(t1, t2)[1]
+            else:
+                t_range = [*np.arange(t1, t2, step), t2]
+                points = self.get_points_from_function(t_range)
             self.start_new_path(points[0])
             self.add_points_as_corners(points[1:])
         if self.use_smoothing:
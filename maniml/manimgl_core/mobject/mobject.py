@@ -30,14 +30,17 @@ from maniml.manimgl_core.utils.color import get_colormap_list
 from maniml.manimgl_core.utils.color import rgb_to_hex
 from maniml.manimgl_core.utils.iterables import arrays_match
 from maniml.manimgl_core.utils.iterables import array_is_constant
+from maniml.manimgl_core.utils.iterables import flat_record_view
 from maniml.manimgl_core.utils.iterables import batch_by_property
 from maniml.manimgl_core.utils.iterables import list_update
 from maniml.manimgl_core.utils.iterables import listify
+from maniml.manimgl_core.utils.iterables import read_only_view
 from maniml.manimgl_core.utils.iterables import resize_array
 from maniml.manimgl_core.utils.iterables import resize_preserving_order
 from maniml.manimgl_core.utils.iterables import resize_with_interpolation
 from maniml.manimgl_core.utils.bezier import integer_interpolate
 from maniml.manimgl_core.utils.bezier import interpolate
+from maniml.manimgl_core.utils.paths import path_func_accepts_out
 from maniml.manimgl_core.utils.paths import straight_path
 from maniml.manimgl_core.utils.shaders import get_colormap_code
 from maniml.manimgl_core.utils.space_ops import angle_of_vector
@@ -75,6 +78,14 @@ class Mobject(object):
     ])
     aligned_data_keys = ['point']
     pointlike_data_keys = ['point']
+    # Source of the _data_version and _content_version stamps, which are
+    # bumped (to a value no other mobject has had) with every change to a
+    # mobject's data, and for _content_version to its uniforms, or to the
+    # data or uniforms of anything in its family. Caches and scene states
+    # rely on them to spot changes, so data is only ever changed by methods
+    # which note it (see affects_data): get_points and the like give
+    # read-only views, and get_writable_points is for writing in place
+    _data_versions: Iterator[int] = it.count()
 
     def __init__(
         self,
@@ -109,6 +120,8 @@ class Mobject(object):
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
         self._data_has_changed: bool = True
+        self._data_version: int = next(Mobject._data_versions)
+        self._content_version: int = self._data_version
         self.shader_code_replacements: dict[str, str] = dict()
 
         self.init_data()
@@ -157,6 +170,7 @@ class Mobject(object):
             if isinstance(value, np.ndarray):
                 value = value.copy()
             self.uniforms[key] = value
+        self.note_changed_uniforms()
         return self
 
     @property
@@ -204,15 +218,35 @@ class Mobject(object):
 
     def note_changed_data(self, recurse_up: bool = True) -> Self:
         self._data_has_changed = True
+        self._data_version = next(Mobject._data_versions)
+        self._content_version = self._data_version
         if recurse_up:
             for mob in self.parents:
                 mob.note_changed_data()
         return self
 
+    def note_changed_uniforms(self, recurse_up: bool = True) -> Self:
+        self._content_version = next(Mobject._data_versions)
+        if recurse_up:
+            for mob in self.parents:
+                mob.note_changed_uniforms()
+        return self
+
+    def unshare_data(self) -> Self:
+        """
+        A copy shares its data array with the mobject it was copied from,
+        marked read-only, until one of the two changes it. This gives the
+        mobject its own, writable, data to change in place.
+        """
+        if not self.data.flags.writeable:
+            self.data = self.data.copy()
+        return self
+
     @staticmethod
     def affects_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            self.unshare_data()
             result = func(self, *args, **kwargs)
             self.note_changed_data()
             return result
@@ -222,6 +256,8 @@ class Mobject(object):
     def affects_family_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            for mob in self.get_family():
+                mob.unshare_data()
             result = func(self, *args, **kwargs)
             for mob in self.family_members_with_points():
                 mob.note_changed_data()
@@ -314,6 +350,21 @@ class Mobject(object):
     # Others related to points
 
     def get_points(self) -> Vect3Array:
+        """
+        The points, read-only. Change them through set_points and the like,
+        or in place through get_writable_points, so that whatever depends
+        on them knows they've changed.
+        """
+        return read_only_view(self.data["point"])
+
+    @affects_data
+    def get_writable_points(self) -> Vect3Array:
+        """
+        The points, to be changed in place. They count as changed as soon
+        as they're handed out, so write into them before anything else
+        reads them, e.g. before the next frame or saved state.
+        """
+        self.refresh_bounding_box()
         return self.data["point"]
 
     def clear_points(self) -> Self:
@@ -321,7 +372,7 @@ class Mobject(object):
         return self
 
     def get_num_points(self) -> int:
-        return len(self.get_points())
+        return len(self.data)
 
     def get_all_points(self) -> Vect3Array:
         if self.submobjects:
@@ -330,7 +381,7 @@ class Mobject(object):
             return self.get_points()
 
     def has_points(self) -> bool:
-        return len(self.get_points()) > 0
+        return len(self.data) > 0
 
     def get_bounding_box(self) -> Vect3Array:
         if self._needs_new_bounding_box:
@@ -687,7 +738,7 @@ class Mobject(object):
         # Similarly, instead of calling match_updaters, since we know the status
         # won't have changed, just directly match.
         result.updaters = list(self.updaters)
-        result._data_has_changed = True
+        result.note_changed_data(recurse_up=False)
         result.shader_wrapper = None
 
         family = self.get_family()
@@ -695,8 +746,17 @@ class Mobject(object):
             if isinstance(value, Mobject) and value is not self:
                 if value in family:
                     setattr(result, attr, result.family[family.index(value)])
-            elif isinstance(value, np.ndarray):
+            elif isinstance(value, np.ndarray) and attr != "data":
                 setattr(result, attr, value.copy())
+
+        # The data array is shared until either mobject changes it, see
+        # unshare_data. Marking a view (e.g. into the arrays a Transform
+        # interpolates in bulk) read-only wouldn't stop writes to what it
+        # views, so those are still copied
+        if self.data.flags.owndata:
+            self.data.flags.writeable = False
+        else:
+            result.data = self.data.copy()
         return result
 
     def generate_target(self, use_deepcopy: bool = False) -> Self:
@@ -750,16 +810,25 @@ class Mobject(object):
                 return False
             if not m1.data.dtype == m2.data.dtype:
                 return False
-            for key in m1.data.dtype.names:
-                if not np.isclose(m1.data[key], m2.data[key]).all():
-                    return False
+            # Data which is exactly the same, as it most often is, is far
+            # quicker to spot than data which is close
+            if m1.data is not m2.data and m1.data.tobytes() != m2.data.tobytes():
+                for key in m1.data.dtype.names:
+                    if not np.isclose(m1.data[key], m2.data[key]).all():
+                        return False
             if set(m1.uniforms).difference(m2.uniforms):
                 return False
             for key in m1.uniforms:
                 value1 = m1.uniforms[key]
                 value2 = m2.uniforms[key]
-                if isinstance(value1, np.ndarray) and isinstance(value2, np.ndarray) and not value1.size == value2.size:
-                    return False
+                if isinstance(value1, np.ndarray) and isinstance(value2, np.ndarray):
+                    if not value1.size == value2.size:
+                        return False
+                    if value1.tobytes() == value2.tobytes():
+                        continue
+                elif not isinstance(value1, np.ndarray) and not isinstance(value2, np.ndarray):
+                    if value1 == value2:
+                        continue
                 if not np.isclose(value1, value2).all():
                     return False
         return True
@@ -1398,7 +1467,7 @@ class Mobject(object):
         return float(self.data["rgba"][0, 3])
 
     def get_opacities(self) -> float:
-        return self.data["rgba"][:, 3]
+        return read_only_view(self.data["rgba"][:, 3])
 
     def set_color_by_gradient(self, *colors: ManimColor) -> Self:
         if self.has_points():
@@ -1804,17 +1873,36 @@ class Mobject(object):
     ) -> Self:
         keys = [k for k in self.data.dtype.names if k not in self.locked_data_keys]
         if keys:
+            self.unshare_data()
             self.note_changed_data()
-        for key in keys:
-            md1 = mobject1.data[key]
-            md2 = mobject2.data[key]
-            if key in self.const_data_keys:
-                md1 = md1[0]
-                md2 = md2[0]
-            if key in self.pointlike_data_keys:
-                self.data[key] = path_func(md1, md2, alpha)
-            else:
-                self.data[key] = (1 - alpha) * md1 + alpha * md2
+        else:
+            self.note_changed_uniforms()
+        # When every field is interpolated along a straight path, do so in
+        # place over the whole of the data at once, so that no temporary
+        # arrays are allocated on every frame
+        flat_data = [None]
+        if path_func is straight_path and len(keys) == len(self.data.dtype.names) \
+                and self.data.dtype == mobject1.data.dtype == mobject2.data.dtype \
+                and len(self.data) == len(mobject1.data) == len(mobject2.data):
+            flat_data = [flat_record_view(mob.data) for mob in (mobject1, mobject2, self)]
+        if all(fd is not None for fd in flat_data):
+            flat_data1, flat_data2, out = flat_data
+            straight_path(flat_data1, flat_data2, alpha, out=out)
+        else:
+            # Key by key, the fields are strided views, which ufuncs only
+            # write into through buffers of their own. Passing out= here is
+            # slower than allocating the results (~560us against ~230us for
+            # 4000 points), so this path allocates, as do the uniforms below
+            for key in keys:
+                md1 = mobject1.data[key]
+                md2 = mobject2.data[key]
+                if key in self.const_data_keys:
+                    md1 = md1[0]
+                    md2 = md2[0]
+                if key in self.pointlike_data_keys:
+                    self.data[key] = path_func(md1, md2, alpha)
+                else:
+                    self.data[key] = (1 - alpha) * md1 + alpha * md2
 
         for key in self.uniforms:
             if key in self.locked_uniform_keys:
@@ -1822,7 +1910,10 @@ class Mobject(object):
             if key not in mobject1.uniforms or key not in mobject2.uniforms:
                 continue
             self.uniforms[key] = (1 - alpha) * mobject1.uniforms[key] + alpha * mobject2.uniforms[key]
-        self.bounding_box[:] = path_func(mobject1.bounding_box, mobject2.bounding_box, alpha)
+        if path_func_accepts_out(path_func):
+            path_func(mobject1.bounding_box, mobject2.bounding_box, alpha, out=self.bounding_box)
+        else:
+            self.bounding_box[:] = path_func(mobject1.bounding_box, mobject2.bounding_box, alpha)
         return self
 
     def pointwise_become_partial(self, mobject, a, b) -> Self:
@@ -1906,6 +1997,8 @@ class Mobject(object):
     def set_uniform(self, recurse: bool = True, **new_uniforms) -> Self:
         for mob in self.get_family(recurse):
             mob.uniforms.update(new_uniforms)
+            mob.note_changed_uniforms(recurse_up=False)
+        self.note_changed_uniforms()
         return self
 
     @affects_shader_info_id
@@ -1944,10 +2037,13 @@ class Mobject(object):
                 submob.uniforms["clip_plane"][:3] = vect
             if threshold is not None:
                 submob.uniforms["clip_plane"][3] = threshold
+            submob.note_changed_uniforms(recurse_up=False)
+        self.note_changed_uniforms()
         return self
 
     def deactivate_clip_plane(self) -> Self:
         self.uniforms["clip_plane"][:] = 0
+        self.note_changed_uniforms()
         return self
 
     # Shader code manipulation
@@ -2034,7 +2130,9 @@ class Mobject(object):
         for submobs, sid in batches:
             shader_wrapper = submobs[0].shader_wrapper
             data_list = [sm.get_shader_data() for sm in submobs]
-            shader_wrapper.read_in(data_list)
+            # Versions are read after get_shader_data, which may itself
+            # refresh derived data like joint angles
+            shader_wrapper.read_in(data_list, [sm._data_version for sm in submobs])
             result.append(shader_wrapper)
         return result
 
@@ -2043,7 +2141,7 @@ class Mobject(object):
         if indices is not None:
             return self.data[indices]
         else:
-            return self.data
+            return read_only_view(self.data)
 
     def get_uniforms(self):
         return self.uniforms
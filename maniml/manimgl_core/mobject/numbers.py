@@ -203,6 +203,8 @@ class DecimalNumber(VMobject):
         self.set_style(**style)
         for submob in self.get_family():
             submob.uniforms.update(self.uniforms)
+            submob.note_changed_uniforms(recurse_up=False)
+        self.note_changed_uniforms()
         return self
 
     def _handle_scale_side_effects(self, scale_factor: float) -> Self:
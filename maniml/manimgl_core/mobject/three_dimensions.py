@@ -99,6 +99,7 @@ class Sphere(Surface):
         radius: float = 1.0,
         true_normals: bool = True,
         clockwise=False,
+        vectorized: bool = True,
         **kwargs,
     ):
         self.radius = radius
@@ -107,6 +108,7 @@ class Sphere(Surface):
             u_range=u_range,
             v_range=v_range,
             resolution=resolution,
+            vectorized=vectorized,
             **kwargs
         )
         # Add bespoke normal specification to avoid issue at poles
@@ -116,9 +118,9 @@ class Sphere(Surface):
     def uv_func(self, u: float, v: float) -> np.ndarray:
         sign = -1 if self.clockwise else +1
         return self.radius * np.array([
-            math.cos(sign * u) * math.sin(v),
-            math.sin(sign * u) * math.sin(v),
-            -math.cos(v)
+            np.cos(sign * u) * np.sin(v),
+            np.sin(sign * u) * np.sin(v),
+            -np.cos(v)
         ])
 
 
@@ -129,6 +131,7 @@ class Torus(Surface):
         v_range: Tuple[float, float] = (0, TAU),
         r1: float = 3.0,
         r2: float = 1.0,
+        vectorized: bool = True,
         **kwargs,
     ):
         self.r1 = r1
@@ -136,12 +139,17 @@ class Torus(Surface):
         super().__init__(
             u_range=u_range,
             v_range=v_range,
+            vectorized=vectorized,
             **kwargs,
         )
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        P = np.array([math.cos(u), math.sin(u), 0])
-        return (self.r1 - self.r2 * math.cos(v)) * P - self.r2 * math.sin(v) * OUT
+        radius = self.r1 - self.r2 * np.cos(v)
+        return np.array([
+            radius * np.cos(u),
+            radius * np.sin(u),
+            -self.r2 * np.sin(v),
+        ])
 
 
 class Cylinder(Surface):
@@ -153,6 +161,7 @@ class Cylinder(Surface):
         height: float = 2,
         radius: float = 1,
         axis: Vect3 = OUT,
+        vectorized: bool = True,
         **kwargs,
     ):
         self.height = height
@@ -162,6 +171,7 @@ class Cylinder(Surface):
             u_range=u_range,
             v_range=v_range,
             resolution=resolution,
+            vectorized=vectorized,
             **kwargs
         )
 
@@ -7,6 +7,7 @@ from maniml.manimgl_core.constants import GREY_C, YELLOW
 from maniml.manimgl_core.constants import ORIGIN, NULL_POINTS
 from maniml.manimgl_core.mobject.mobject import Mobject
 from maniml.manimgl_core.mobject.types.point_cloud_mobject import PMobject
+from maniml.manimgl_core.utils.iterables import read_only_view
 from maniml.manimgl_core.utils.iterables import resize_with_interpolation
 
 from typing import TYPE_CHECKING
@@ -105,7 +106,7 @@ class DotCloud(PMobject):
         return self
 
     def get_radii(self) -> np.ndarray:
-        return self.data["radius"]
+        return read_only_view(self.data["radius"])
 
     @Mobject.affects_data
     def set_radius(self, radius: float) -> Self:
@@ -123,6 +124,7 @@ class DotCloud(PMobject):
 
     def set_glow_factor(self, glow_factor: float) -> Self:
         self.uniforms["glow_factor"] = glow_factor
+        self.note_changed_uniforms()
         return self
 
     def get_glow_factor(self) -> float:
@@ -5,6 +5,7 @@ import numpy as np
 
 from maniml.manimgl_core.constants import GREY
 from maniml.manimgl_core.constants import OUT
+from maniml.manimgl_core.logger import log
 from maniml.manimgl_core.mobject.mobject import Mobject
 from maniml.manimgl_core.utils.bezier import integer_interpolate
 from maniml.manimgl_core.utils.bezier import interpolate
@@ -52,6 +53,15 @@ class Surface(Mobject):
         # Step off the surface to a new point which will
         # be used to determine the normal direction
         normal_nudge: float = 1e-3,
+        # If True, uv_func is called once with arrays of all u and v values
+        # on the grid, and should return the x, y and z coordinates as
+        # arrays (or scalars) of that same shape. Should that call fail,
+        # uv_func is instead called point by point.
+        vectorized: bool = False,
+        # If True, normals come from finite differences between neighboring
+        # points on the grid, rather than from evaluating uv_func again at
+        # points nudged by epsilon in u and in v
+        grid_normals: bool = False,
         **kwargs
     ):
         self.u_range = u_range
@@ -60,6 +70,8 @@ class Surface(Mobject):
         self.prefered_creation_axis = prefered_creation_axis
         self.epsilon = epsilon
         self.normal_nudge = normal_nudge
+        self.vectorized = vectorized
+        self.grid_normals = grid_normals
 
         super().__init__(
             **kwargs,
@@ -79,29 +91,44 @@ class Surface(Mobject):
         nu, nv = self.resolution
         u_range = np.linspace(*self.u_range, nu)
         v_range = np.linspace(*self.v_range, nv)
+        u_grid, v_grid = np.meshgrid(u_range, v_range, indexing="ij")
 
-        # Get three lists:
-        # - Points generated by pure uv values
-        # - Those generated by values nudged by du
-        # - Those generated by values nudged by dv
-        uv_grid = np.array([[[u, v] for v in v_range] for u in u_range])
-        uv_plus_du = uv_grid.copy()
-        uv_plus_du[:, :, 0] += self.epsilon
-        uv_plus_dv = uv_grid.copy()
-        uv_plus_dv[:, :, 1] += self.epsilon
-
-        points, du_points, dv_points = [
-            np.apply_along_axis(
-                lambda p: self.uv_func(*p), 2, grid
-            ).reshape((nu * nv, dim))
-            for grid in (uv_grid, uv_plus_du, uv_plus_dv)
-        ]
-        crosses = cross(du_points - points, dv_points - points)
+        point_grid = self.get_uv_point_grid(u_grid, v_grid)
+        points = point_grid.reshape((nu * nv, dim))
+
+        if self.grid_normals and nu > 1 and nv > 1:
+            du_vects = np.gradient(point_grid, axis=0).reshape((nu * nv, dim))
+            dv_vects = np.gradient(point_grid, axis=1).reshape((nu * nv, dim))
+        else:
+            # Compare against points generated by values nudged by du and dv
+            du_points = self.get_uv_point_grid(u_grid + self.epsilon, v_grid)
+            dv_points = self.get_uv_point_grid(u_grid, v_grid + self.epsilon)
+            du_vects = du_points.reshape((nu * nv, dim)) - points
+            dv_vects = dv_points.reshape((nu * nv, dim)) - points
+        crosses = cross(du_vects, dv_vects)
         normals = normalize_along_axis(crosses, 1)
 
         self.set_points(points)
         self.data['d_normal_point'] = points + self.normal_nudge * normals
 
+    def get_uv_point_grid(self, u_grid: np.ndarray, v_grid: np.ndarray) -> np.ndarray:
+        """
+        Evaluate uv_func over a grid of u and v values, returning an array
+        with one more axis than the grids, holding the resulting points
+        """
+        if self.vectorized:
+            try:
+                coords = self.uv_func(u_grid, v_grid)
+                if len(coords) != self.dim:
+                    raise ValueError(f"uv_func returned {len(coords)} coordinates")
+                return np.stack(np.broadcast_arrays(*coords, u_grid)[:self.dim], axis=-1)
+            except Exception as err:
+                log.debug(f"Evaluating uv_func on arrays failed ({err}), evaluating it point by point")
+                self.vectorized = False
+        return np.apply_along_axis(
+            lambda p: self.uv_func(*p), -1, np.stack([u_grid, v_grid], axis=-1)
+        )
+
     def uv_to_point(self, u, v):
         nu, nv = self.resolution
         uv_grid = np.reshape(self.get_points(), (nu, nv, self.dim))
@@ -250,10 +277,13 @@ class ParametricSurface(Surface):
         uv_func: Callable[[float, float], Iterable[float]],
         u_range: tuple[float, float] = (0, 1),
         v_range: tuple[float, float] = (0, 1),
+        # Set to True if uv_func works on arrays of u and v values, e.g.
+        # lambda u, v: (np.cos(u), np.sin(u), v), to evaluate it in one call
+        vectorized: bool = False,
         **kwargs
     ):
         self.passed_uv_func = uv_func
-        super().__init__(u_range=u_range, v_range=v_range, **kwargs)
+        super().__init__(u_range=u_range, v_range=v_range, vectorized=vectorized, **kwargs)
 
     def uv_func(self, u, v):
         return self.passed_uv_func(u, v)
@@ -25,10 +25,12 @@ from maniml.manimgl_core.utils.bezier import inverse_interpolate
 from maniml.manimgl_core.utils.bezier import find_intersection
 from maniml.manimgl_core.utils.bezier import outer_interpolate
 from maniml.manimgl_core.utils.bezier import partial_quadratic_bezier_points
+from maniml.manimgl_core.utils.bezier import subdivide_quadratic_path
 from maniml.manimgl_core.utils.bezier import quadratic_bezier_points_for_arc
 from maniml.manimgl_core.utils.color import color_gradient
 from maniml.manimgl_core.utils.color import rgb_to_hex
 from maniml.manimgl_core.utils.iterables import make_even
+from maniml.manimgl_core.utils.iterables import read_only_view
 from maniml.manimgl_core.utils.iterables import resize_array
 from maniml.manimgl_core.utils.iterables import resize_with_interpolation
 from maniml.manimgl_core.utils.iterables import resize_preserving_order
@@ -50,9 +52,10 @@ from typing import Generic, TypeVar, Iterable
 SubVmobjectType = TypeVar('SubVmobjectType', bound='VMobject')
 
 if TYPE_CHECKING:
-    from typing import Callable, Tuple, Any, Optional
+    from typing import Callable, Tuple, Any, Optional, Sequence
     from maniml.manimgl_core.typing import ManimColor, Vect3, Vect4, Vect3Array, Self
     from moderngl.context import Context
+    from maniml.manimgl_core.shader_wrapper import ShaderWrapper
 
 
 class VMobject(Mobject):
@@ -116,6 +119,8 @@ class VMobject(Mobject):
         self.needs_new_unit_normal = True
         self.subpath_end_indices = None
         self.outer_vert_indices = np.zeros(0, dtype=int)
+        self.arc_length_table: np.ndarray | None = None
+        self.arc_length_table_version: int | None = None
 
         super().__init__(**kwargs)
 
@@ -328,7 +333,7 @@ class VMobject(Mobject):
         ]
 
     def get_fill_opacities(self) -> np.ndarray:
-        return self.data['fill_rgba'][:, 3]
+        return read_only_view(self.data['fill_rgba'][:, 3])
 
     def get_stroke_colors(self) -> list[str]:
         return [
@@ -337,10 +342,10 @@ class VMobject(Mobject):
         ]
 
     def get_stroke_opacities(self) -> np.ndarray:
-        return self.data['stroke_rgba'][:, 3]
+        return read_only_view(self.data['stroke_rgba'][:, 3])
 
     def get_stroke_widths(self) -> np.ndarray:
-        return self.data['stroke_width'][:, 0]
+        return read_only_view(self.data['stroke_width'][:, 0])
 
     # TODO, it's weird for these to return the first of various lists
     # rather than the full information
@@ -410,6 +415,8 @@ class VMobject(Mobject):
     def set_joint_type(self, joint_type: str, recurse: bool = True) -> Self:
         for mob in self.get_family(recurse):
             mob.uniforms["joint_type"] = self.joint_type_map[joint_type]
+            mob.note_changed_uniforms(recurse_up=False)
+        self.note_changed_uniforms()
         return self
 
     def get_joint_type(self) -> float:
@@ -447,7 +454,8 @@ class VMobject(Mobject):
             self.clear_points()
             return self
         assert len(anchors) == len(handles) + 1
-        points = resize_array(self.get_points(), 2 * len(anchors) - 1)
+        self.unshare_data()
+        points = resize_array(self.data["point"], 2 * len(anchors) - 1)
         points[0::2] = anchors
         points[1::2] = handles
         self.set_points(points)
@@ -635,8 +643,16 @@ class VMobject(Mobject):
         return self
 
     def add_points_as_corners(self, points: Iterable[Vect3]) -> Self:
-        for point in points:
-            self.add_line_to(point)
+        # Equivalent to calling add_line_to on each point, but appending
+        # all the new points at once
+        points = np.array(points, dtype=float).reshape((-1, self.dim))
+        if len(points) == 0:
+            return self
+        self.throw_error_if_no_points()
+        starts = np.vstack([self.get_last_point(), points[:-1].astype(self.data_dtype["point"].base)])
+        alphas = np.linspace(0, 1, 5 if self.long_lines else 3)[1:, np.newaxis]
+        new_points = (1 - alphas) * starts[:, np.newaxis, :] + alphas * points[:, np.newaxis, :]
+        self.append_points(new_points.reshape((-1, self.dim)))
         return self
 
     def set_points_as_corners(self, points: Iterable[Vect3]) -> Self:
@@ -744,8 +760,7 @@ class VMobject(Mobject):
         # curves in a row, we also check that the following
         # anchor is genuinely distinct
         is_end = (a0 == h).all(1) & (abs(h - a1) > atol).any(1)
-        end_indices = (2 * n for n, end in enumerate(is_end) if end)
-        return np.array([*end_indices, len(points) - 1])
+        return np.array([*2 * np.flatnonzero(is_end), len(points) - 1])
 
     def get_subpath_end_indices(self) -> np.ndarray:
         if self.subpath_end_indices is None:
@@ -781,6 +796,23 @@ class VMobject(Mobject):
         curve_func = self.get_nth_curve_function(n)
         return curve_func(residue)
 
+    def get_arc_length_table(self) -> np.ndarray:
+        """
+        Cumulative lengths along the path up to each anchor, approximating
+        each curve by the straight line from its start to its end, and
+        counting null curves as having no length. Kept until the data
+        version next changes, which points only do through methods which
+        bump it, get_writable_points included.
+        """
+        if self.arc_length_table_version != self._data_version:
+            a0, h, a1 = self.get_anchors_and_handles()
+            lengths = np.linalg.norm(a1 - a0, axis=1).astype(np.float64)
+            # Don't consider null curves
+            lengths[(abs(h - a0) < self.tolerance_for_point_equality).all(1)] = 0
+            self.arc_length_table = np.hstack([0, np.cumsum(lengths)])
+            self.arc_length_table_version = self._data_version
+        return self.arc_length_table
+
     def curve_and_prop_of_partial_point(self, alpha) -> Tuple[int, float]:
         """
         If you want a point a proportion alpha along the curve, this
@@ -789,23 +821,12 @@ class VMobject(Mobject):
         """
         if alpha == 0:
             return (0, 0.0)
-        partials: list[float] = [0]
-        for tup in self.get_bezier_tuples():
-            if self.consider_points_equal(tup[0], tup[1]):
-                # Don't consider null curves
-                arclen = 0
-            else:
-                # Approximate length with straight line from start to end
-                arclen = get_norm(tup[2] - tup[0])
-            partials.append(partials[-1] + arclen)
+        partials = self.get_arc_length_table()
         full = partials[-1]
         if full == 0:
             return len(partials), 1.0
         # First index where the partial length is more than alpha times the full length
-        index = next(
-            (i for i, x in enumerate(partials) if x >= full * alpha),
-            len(partials) - 1  # Default
-        )
+        index = min(int(np.searchsorted(partials, full * alpha)), len(partials) - 1)
         residue = float(inverse_interpolate(
             partials[index - 1] / full, partials[index] / full, alpha
         ))
@@ -821,6 +842,34 @@ class VMobject(Mobject):
         index, residue = self.curve_and_prop_of_partial_point(alpha)
         return self.get_nth_curve_function(index)(residue)
 
+    def points_from_proportions(self, alphas: Iterable[float]) -> Vect3Array:
+        """
+        Equivalent to [self.point_from_proportion(a) for a in alphas],
+        but with one lookup into the arc length table for all of them
+        """
+        alphas = np.array(alphas, dtype=float)
+        if self.get_num_points() == 0:
+            return np.repeat([self.get_center()], len(alphas), axis=0)
+        partials = self.get_arc_length_table()
+        full = partials[-1]
+        result = np.repeat([self.get_end()], len(alphas), axis=0).astype(np.float64)
+        result[alphas <= 0] = self.get_start()
+        inner = (0 < alphas) & (alphas < 1)
+        if full == 0 or not inner.any():
+            return result
+
+        inner_alphas = alphas[inner]
+        indices = np.searchsorted(partials, full * inner_alphas).clip(1, len(partials) - 1)
+        residues = inverse_interpolate(
+            partials[indices - 1] / full, partials[indices] / full, inner_alphas
+        )[:, np.newaxis]
+        points = self.get_points()
+        a0 = points[2 * indices - 2]
+        h = points[2 * indices - 1]
+        a1 = points[2 * indices]
+        result[inner] = (1 - residues)**2 * a0 + 2 * (1 - residues) * residues * h + residues**2 * a1
+        return result
+
     def get_anchors_and_handles(self) -> list[Vect3]:
         """
         returns anchors1, handles, anchors2,
@@ -884,7 +933,7 @@ class VMobject(Mobject):
             return OUT
 
         if not self.needs_new_unit_normal and not refresh:
-            return self.data["base_normal"][1, :]
+            return read_only_view(self.data["base_normal"][1, :])
 
         area_vect = self.get_area_vector()
         area = get_norm(area_vect)
@@ -893,6 +942,7 @@ class VMobject(Mobject):
         else:
             p = self.get_points()
             normal = get_unit_normal(p[1] - p[0], p[2] - p[1])
+        self.unshare_data()
         self.data["base_normal"][1::2] = normal
         self.needs_new_unit_normal = False
         return normal
@@ -936,10 +986,7 @@ class VMobject(Mobject):
         subpaths1 = self.get_subpaths()
         subpaths2 = vmobject.get_subpaths()
         for subpaths in [subpaths1, subpaths2]:
-            subpaths.sort(key=lambda sp: -sum(
-                get_norm(p2 - p1)
-                for p1, p2 in zip(sp, sp[1:])
-            ))
+            subpaths.sort(key=lambda sp: -poly_line_length(sp))
         n_subpaths = max(len(subpaths1), len(subpaths2))
 
         # Start building new ones
@@ -982,33 +1029,56 @@ class VMobject(Mobject):
     def insert_n_curves_to_point_list(self, n: int, points: Vect3Array) -> Vect3Array:
         if len(points) == 1:
             return np.repeat(points, 2 * n + 1, 0)
+        if n == 0:
+            return points.copy()
 
-        bezier_tuples = list(self.get_bezier_tuples_from_points(points))
+        a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
         atol = self.tolerance_for_point_equality
-        norms = [
-            0 if get_norm(tup[1] - tup[0]) < atol else get_norm(tup[2] - tup[0])
-            for tup in bezier_tuples
-        ]
-        # Calculate insertions per curve (ipc)
-        ipc = np.zeros(len(bezier_tuples), dtype=int)
-        for _ in range(n):
-            index = np.argmax(norms)
-            ipc[index] += 1
-            norms[index] *= ipc[index] / (ipc[index] + 1)
-
-        new_points = [points[0]]
-        for tup, n_inserts in zip(bezier_tuples, ipc):
-            # What was once a single quadratic curve defined
-            # by "tup" will now be broken into n_inserts + 1
-            # smaller quadratic curves
-            alphas = np.linspace(0, 1, n_inserts + 2)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points.extend(partial_quadratic_bezier_points(tup, a1, a2)[1:])
-        return np.vstack(new_points)
+        norms = ((a1 - a0)**2).sum(1)**0.5
+        norms[((h - a0)**2).sum(1)**0.5 < atol] = 0
+        # Insertions per curve (ipc)
+        ipc = self.get_insertions_per_curve(n, norms)
+        # What was once a single quadratic curve will now
+        # be broken into n_inserts + 1 smaller quadratic curves
+        return subdivide_quadratic_path(points, ipc + 1)
+
+    @staticmethod
+    def get_insertions_per_curve(n: int, norms: np.ndarray) -> np.ndarray:
+        """
+        Share n insertions among curves with the given lengths, such that
+        the longest piece left afterwards is as short as possible. That is,
+        give each insertion in turn to the curve whose pieces are currently
+        longest, which amounts to taking the n largest of all the values
+        norms[i] / k for k = 1, 2, 3, ...
+        """
+        ipc = np.zeros(len(norms), dtype=int)
+        total = norms.sum()
+        if n <= 0:
+            return ipc
+        if total == 0:
+            ipc[0] = n
+            return ipc
+        # Each curve gets at least its proportional share, rounded down, and
+        # at most its share of n + len(norms), so only the values norms[i] / k
+        # between those bounds compete for the remaining insertions
+        ipc[:] = np.floor(n * norms / total)
+        max_ipc = np.floor((n + len(norms)) * norms / total).astype(int) + 1
+        n_candidates = np.maximum(max_ipc - ipc, 0)
+        candidates = np.repeat(np.arange(len(norms)), n_candidates)
+        ks = ipc[candidates] + 1 + (
+            np.arange(len(candidates))
+            - np.repeat(np.cumsum(n_candidates) - n_candidates, n_candidates)
+        )
+        # Largest values first, with ties going to earlier curves
+        order = np.lexsort((ks, candidates, -norms[candidates] / ks))
+        chosen = candidates[order[:n - ipc.sum()]]
+        ipc += np.bincount(chosen, minlength=len(norms))
+        return ipc
 
     def pointwise_become_partial(self, vmobject: VMobject, a: float, b: float) -> Self:
         assert isinstance(vmobject, VMobject)
         vm_points = vmobject.get_points()
+        self.unshare_data()
         self.data["joint_angle"] = vmobject.data["joint_angle"]
         if a <= 0 and b >= 1:
             self.set_points(vm_points, refresh=False)
@@ -1067,6 +1137,8 @@ class VMobject(Mobject):
     # Data for shaders that may need refreshing
 
     def get_triangulation(self) -> np.ndarray:
+        # Fills are drawn by accumulating winding on the fill canvas, so no
+        # rendering path calls this, and it is worked out afresh on each call.
         # Figure out how to triangulate the interior to know
         # how to send the points as to the vertex shader.
         # First triangles come directly from the points
@@ -1126,47 +1198,78 @@ class VMobject(Mobject):
         product between tangent vectors at a joint
         """
         if not self.needs_new_joint_angles and not refresh:
-            return self.data["joint_angle"][:, 0]
+            return read_only_view(self.data["joint_angle"][:, 0])
 
         if "joint_angle" in self.locked_data_keys:
-            return self.data["joint_angle"][:, 0]
+            return read_only_view(self.data["joint_angle"][:, 0])
 
-        self.needs_new_joint_angles = False
-        self._data_has_changed = True
+        self.compute_joint_angles([self])
+        return read_only_view(self.data["joint_angle"][:, 0])
 
-        # Rotate points such that positive z direction is the normal
-        points = self.get_points() @ rotation_between_vectors(OUT, self.get_unit_normal())
+    def update_family_joint_angles(self, recurse: bool = True, refresh: bool = False) -> Self:
+        """
+        Recompute the joint angles of every family member which needs
+        them (or of all of them, if refresh is True) in one batch
+        """
+        self.compute_joint_angles([
+            mob for mob in self.get_family(recurse)
+            if (mob.needs_new_joint_angles or refresh)
+            and "joint_angle" not in mob.locked_data_keys
+        ])
+        return self
 
-        if len(points) < 3:
-            return self.data["joint_angle"][:, 0]
+    @staticmethod
+    def compute_joint_angles(vmobjects: Sequence[VMobject]) -> None:
+        """
+        Fill in the joint angles of the given vmobjects, with the points of
+        all of them concatenated so that the work happens in a fixed number
+        of array operations, however many vmobjects and subpaths there are
+        """
+        for vmob in vmobjects:
+            vmob.needs_new_joint_angles = False
+            vmob.note_changed_data(recurse_up=False)
+        vmobjects = [vmob for vmob in vmobjects if vmob.get_num_points() >= 3]
+        if not vmobjects:
+            return
 
-        # Find all the unit tangent vectors at each joint
-        a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
-        a0_to_h = h - a0
-        h_to_a1 = a1 - h
+        lengths = [vmob.get_num_points() for vmob in vmobjects]
+        offsets = np.cumsum([0, *lengths[:-1]])
 
-        # Tangent vectors into each vertex
+        # Rotate points such that positive z direction is the normal
+        points = np.vstack([vmob.get_points() for vmob in vmobjects]).astype(np.float64)
+        for vmob, offset, length in zip(vmobjects, offsets, lengths):
+            normal = vmob.get_unit_normal()
+            if not (normal == OUT).all():
+                piece = points[offset:offset + length]
+                piece[:] = piece @ rotation_between_vectors(OUT, normal)
+
+        # Tangent vectors into each vertex, and out of each vertex. Those
+        # which would straddle two vmobjects are all at the start or end of
+        # a subpath, so get overwritten below.
         v_in = np.zeros(points.shape)
-        # Tangent vectors out of each vertex
         v_out = np.zeros(points.shape)
-
-        v_in[1::2] = a0_to_h
-        v_in[2::2] = h_to_a1
-        v_out[0:-1:2] = a0_to_h
-        v_out[1::2] = h_to_a1
+        v_in[1:] = np.diff(points, axis=0)
+        v_out[:-1] = v_in[1:]
 
         # Joint up closed loops, or mark unclosed paths as such
-        ends = self.get_subpath_end_indices()
-        starts = [0, *(e + 2 for e in ends[:-1])]
-        for start, end in zip(starts, ends):
-            if start == end:
-                continue
-            if (points[start] == points[end]).all():
-                v_in[start] = v_out[end - 1]
-                v_out[end] = v_in[start + 1]
-            else:
-                v_in[start] = v_out[start]
-                v_out[end] = v_in[end]
+        end_lists = [vmob.get_subpath_end_indices() for vmob in vmobjects]
+        ends = np.hstack([
+            end_list + offset
+            for end_list, offset in zip(end_lists, offsets)
+        ])
+        # Each subpath starts two after the previous one ends, except the
+        # first subpath of each vmobject
+        starts = np.hstack([[0], ends[:-1] + 2])
+        first_subpaths = np.cumsum([0, *map(len, end_lists[:-1])])
+        starts[first_subpaths] = offsets
+        non_empty = starts != ends
+        starts = starts[non_empty]
+        ends = ends[non_empty]
+        closed = (points[starts] == points[ends]).all(1)
+        new_v_in = np.where(closed[:, np.newaxis], v_out[ends - 1], v_out[starts])
+        new_v_out = np.where(closed[:, np.newaxis], v_in[starts + 1], v_in[ends])
+        v_in[starts] = new_v_in
+        v_out[ends] = new_v_out
 
         # Find the angles between vectors into each vertex, and out of it
         angles_in = np.arctan2(v_in[:, 1], v_in[:, 0])
@@ -1174,8 +1277,9 @@ class VMobject(Mobject):
         angle_diffs = angles_out - angles_in
         angle_diffs[angle_diffs < -PI] += TAU
         angle_diffs[angle_diffs > PI] -= TAU
-        self.data["joint_angle"][:, 0] = angle_diffs
-        return self.data["joint_angle"][:, 0]
+        for vmob, offset, length in zip(vmobjects, offsets, lengths):
+            vmob.unshare_data()
+            vmob.data["joint_angle"][:, 0] = angle_diffs[offset:offset + length]
 
     def lock_matching_data(self, vmobject1: VMobject, vmobject2: VMobject) -> Self:
         for mob in [self, vmobject1, vmobject2]:
@@ -1204,6 +1308,12 @@ class VMobject(Mobject):
         assert len(points) % 2 == 0
         return super().append_points(points)
 
+    def get_writable_points(self) -> Vect3Array:
+        self.subpath_end_indices = None
+        self.refresh_joint_angles()
+        self.refresh_unit_normal()
+        return super().get_writable_points()
+
     def reverse_points(self, recurse: bool = True) -> Self:
         # This will reset which anchors are
         # considered path ends
@@ -1211,6 +1321,7 @@ class VMobject(Mobject):
             if not mob.has_points():
                 continue
             inner_ends = mob.get_subpath_end_indices()[:-1]
+            mob.unshare_data()
             mob.data["point"][inner_ends + 1] = mob.data["point"][inner_ends + 2]
             mob.data["base_normal"][1::2] *= -1  # Invert normal vector
             self.subpath_end_indices = None
@@ -1260,8 +1371,7 @@ class VMobject(Mobject):
 
     def set_animating_status(self, is_animating: bool, recurse: bool = True):
         super().set_animating_status(is_animating, recurse)
-        for submob in self.get_family(recurse):
-            submob.get_joint_angles(refresh=True)
+        self.update_family_joint_angles(recurse, refresh=True)
         return self
 
     # For shaders
@@ -1283,10 +1393,19 @@ class VMobject(Mobject):
         super().refresh_shader_wrapper_id()
         return self
 
+    def get_shader_wrapper_list(self, ctx: Context) -> list[ShaderWrapper]:
+        # Rather than leaving get_shader_data to compute joint
+        # angles one submobject at a time, do them all at once
+        self.update_family_joint_angles()
+        return super().get_shader_wrapper_list(ctx)
+
     def get_shader_data(self) -> np.ndarray:
         # Do we want this elsewhere? Say whenever points are refreshed or something?
         self.get_joint_angles()
-        self.data["base_normal"][0::2] = self.data["point"][0]
+        # Only unshare data which this would change
+        if (self.data["base_normal"][0::2] != self.data["point"][0]).any():
+            self.unshare_data()
+            self.data["base_normal"][0::2] = self.data["point"][0]
         return super().get_shader_data()
 
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+import hashlib
 import platform
 import random
 import time
@@ -28,6 +29,7 @@ from maniml.manimgl_core.mobject.types.vectorized_mobject import VMobject
 from maniml.manimgl_core.scene.scene_embed import InteractiveSceneEmbed
 from maniml.manimgl_core.scene.scene_embed import CheckpointManager
 from maniml.manimgl_core.scene.scene_file_writer import SceneFileWriter
+from maniml.manimgl_core.scene.segment_cache import get_segment_key
 from maniml.manimgl_core.utils.dict_ops import merge_dicts_recursively
 from maniml.manimgl_core.utils.family_ops import extract_mobject_family_members
 from maniml.manimgl_core.utils.family_ops import recursive_mobject_remove
@@ -55,6 +57,9 @@ class Scene(object):
     scroll_sensitivity: float = 20
     drag_to_pan: bool = True
     max_num_saved_states: int = 50
+    # Skip re-rendering frames whose render state matches the previous
+    # frame, e.g. during a wait with no updaters
+    reuse_static_frames: bool = True
     default_camera_config: dict = dict()
     default_file_writer_config: dict = dict()
     samples = 0
@@ -116,6 +121,9 @@ class Scene(object):
         self.file_writer = SceneFileWriter(self, **self.file_writer_config)
         self.mobjects: list[Mobject] = [self.camera.frame]
         self.render_groups: list[Mobject] = []
+        self.last_frame_key: bytes | None = None
+        self.last_emitted_frame_key: bytes | None = None
+        self.reusing_segment: bool = False
         self.id_to_mobject_map: dict[int, Mobject] = dict()
         self.num_plays: int = 0
         self.time: float = 0
@@ -236,7 +244,7 @@ class Scene(object):
     def update_frame(self, dt: float = 0, force_draw: bool = False) -> None:
         self.increment_time(dt)
         self.update_mobjects(dt)
-        if self.skip_animations and not force_draw:
+        if (self.skip_animations or self.reusing_segment) and not force_draw:
             return
 
         if self.is_window_closing():
@@ -248,7 +256,25 @@ class Scene(object):
             self.window._window.dispatch_events()
             return
 
-        self.camera.capture(*self.render_groups)
+        frame_key = self.get_frame_key() if self.reuse_static_frames else None
+        frame_is_unchanged = (
+            not force_draw
+            and frame_key is not None
+            and frame_key == self.last_frame_key
+            and not (self.window and self.window.has_undrawn_event())
+        )
+        if frame_is_unchanged:
+            # The last rendered frame is still on screen, and still in the
+            # file writer, so just keep listening for events
+            if self.window:
+                self.window._window.dispatch_events()
+        else:
+            self.camera.capture(*self.render_groups)
+            # Rendering fills in data derived from points, like joint angles,
+            # so the key is taken again as of what was rendered
+            if frame_key is not None:
+                frame_key = self.get_frame_key()
+            self.last_frame_key = frame_key
 
         if self.window and not self.skip_animations:
             vt = self.time - self.virtual_animation_start_time
@@ -256,8 +282,43 @@ class Scene(object):
             time.sleep(max(vt - rt, 0))
 
     def emit_frame(self) -> None:
-        if not self.skip_animations:
-            self.file_writer.write_frame(self.camera)
+        if not self.skip_animations and not self.reusing_segment:
+            # Frames captured while previewing are not all written, so
+            # compare against the last frame which actually was
+            frame_key = self.last_frame_key
+            self.file_writer.write_frame(
+                self.camera,
+                reuse_last_frame=(frame_key is not None and frame_key == self.last_emitted_frame_key),
+            )
+            self.last_emitted_frame_key = frame_key
+
+    def get_frame_key(self) -> bytes:
+        """
+        Digest of everything that determines how the next frame renders:
+        the camera's uniforms, the order of the render groups, and the
+        data, uniforms and shader settings of each mobject within them
+        """
+        camera = self.camera
+        camera.refresh_uniforms()
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(repr((
+            sorted(camera.uniforms.items()),
+            camera.background_rgba,
+            camera.fbo.size,
+        )).encode())
+        for group in self.render_groups:
+            hasher.update(repr(id(group)).encode())
+            for mob in group.family_members_with_points():
+                hasher.update(repr((
+                    id(mob),
+                    sorted(mob.uniforms.items()),
+                    mob.shader_folder,
+                    mob.depth_test,
+                    mob.render_primitive,
+                    mob.shader_code_replacements,
+                )).encode())
+                hasher.update(np.ascontiguousarray(mob.data))
+        return hasher.digest()
 
     # Related to updating
 
@@ -529,9 +590,41 @@ class Scene(object):
             self.virtual_animation_start_time = self.time
             self.real_animation_start_time = time.time()
 
+    def begin_segment(self, *inputs, cacheable: bool = True) -> None:
+        """
+        When the file writer caches segments, look up the segment for the
+        play or wait call about to run, keyed by the scene's current state
+        and the given inputs. If it's cached, the call still runs through
+        every frame, to leave the scene in the same state, but nothing is
+        rendered or written.
+        """
+        file_writer = self.file_writer
+        if self.skip_animations or not (file_writer.cache_segments and file_writer.write_to_movie):
+            return
+        key = None
+        # A window shows what's rendered, so never skip rendering with one
+        if cacheable and self.window is None:
+            camera = self.camera
+            key = get_segment_key(
+                self,
+                inputs,
+                camera.fbo.size,
+                camera.fps,
+                camera.background_rgba,
+                camera.samples,
+                camera.light_source,
+                file_writer.movie_file_extension,
+                file_writer.video_codec,
+                file_writer.pixel_format,
+                file_writer.saturation,
+                file_writer.gamma,
+            )
+        self.reusing_segment = file_writer.begin_segment(key)
+
     def post_play(self):
         if not self.skip_animations:
             self.file_writer.end_animation()
+        self.reusing_segment = False
 
         if self.preview_while_skipping and self.skip_animations and self.window is not None:
             # Show some quick frames along the way
@@ -589,6 +682,7 @@ class Scene(object):
             anim.update_rate_info(run_time, rate_func, lag_ratio)
         self.pre_play()
         self.begin_animations(animations)
+        self.begin_segment("play", animations)
         self.progress_through_animations(animations)
         self.finish_animations(animations)
         self.post_play()
@@ -604,6 +698,8 @@ class Scene(object):
             duration = self.default_wait_time
         self.pre_play()
         self.update_mobjects(dt=0)  # Any problems with this?
+        holds = self.presenter_mode and not ignore_presenter_mode
+        self.begin_segment("wait", duration, cacheable=(stop_condition is None and not holds))
         if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
             if note:
                 log.info(note)
@@ -880,7 +976,14 @@ class Scene(object):
 
 
 class SceneState():
-    def __init__(self, scene: Scene, ignore: list[Mobject] | None = None):
+    def __init__(
+        self,
+        scene: Scene,
+        ignore: list[Mobject] | None = None,
+        # State whose copies to reuse for mobjects which haven't changed
+        # since, by default the last one saved for undo
+        last_state: SceneState | None = None,
+    ):
         self.time = scene.time
         self.num_plays = scene.num_plays
         self.mobjects_to_copies = OrderedDict.fromkeys(scene.mobjects)
@@ -888,14 +991,27 @@ class SceneState():
             for mob in ignore:
                 self.mobjects_to_copies.pop(mob, None)
 
-        last_m2c = scene.undo_stack[-1].mobjects_to_copies if scene.undo_stack else dict()
+        if last_state is None and scene.undo_stack:
+            last_state = scene.undo_stack[-1]
+        last_m2c = last_state.mobjects_to_copies if last_state else dict()
+        last_versions = last_state.content_versions if last_state else dict()
+        # Content version of each mobject as of its copy, against which
+        # later states can tell whether it has changed since
+        self.content_versions = dict()
         for mob in self.mobjects_to_copies:
             # If it hasn't changed since the last state, just point to the
             # same copy as before
-            if mob in last_m2c and last_m2c[mob].looks_identical(mob):
+            if mob not in last_m2c:
+                unchanged = False
+            elif mob in last_versions:
+                unchanged = last_versions[mob] == mob._content_version
+            else:
+                unchanged = last_m2c[mob].looks_identical(mob)
+            if unchanged:
                 self.mobjects_to_copies[mob] = last_m2c[mob]
             else:
                 self.mobjects_to_copies[mob] = mob.copy()
+            self.content_versions[mob] = mob._content_version
 
     def __eq__(self, state: SceneState):
         return all((
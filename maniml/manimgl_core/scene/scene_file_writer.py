@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import os
 import platform
+import queue
 import shutil
 import subprocess as sp
 import sys
+import threading
 
 import numpy as np
 from pydub import AudioSegment
@@ -13,6 +15,8 @@ from pathlib import Path
 
 from maniml.manimgl_core.logger import log
 from maniml.manimgl_core.mobject.mobject import Mobject
+from maniml.manimgl_core.scene.segment_cache import get_segment_cache_dir
+from maniml.manimgl_core.scene.segment_cache import prune_segment_cache
 from maniml.manimgl_core.utils.file_ops import guarantee_existence
 from maniml.manimgl_core.utils.sounds import get_full_sound_file_path
 
@@ -48,6 +52,16 @@ class SceneFileWriter(object):
         pixel_format: str = "yuv420p",
         saturation: float = 1.0,
         gamma: float = 1.0,
+        # Number of frames which can be waiting to be piped into ffmpeg, so
+        # that rendering one frame overlaps with encoding the ones before.
+        # Set to 0 to read back and write each frame synchronously.
+        frame_queue_size: int = 8,
+        # Frames are read back from the GPU through this many pixel pack
+        # buffers used in rotation, so a read need not wait on the GPU
+        n_pixel_buffers: int = 3,
+        # Write each play and wait call to its own movie segment, stored in
+        # an on-disk cache so that unchanged segments are reused next time
+        cache_segments: bool = False,
     ):
         self.scene: Scene = scene
         self.write_to_movie = write_to_movie
@@ -67,12 +81,27 @@ class SceneFileWriter(object):
         self.pixel_format = pixel_format
         self.saturation = saturation
         self.gamma = gamma
+        self.frame_queue_size = frame_queue_size
+        self.n_pixel_buffers = n_pixel_buffers
+        self.cache_segments = cache_segments
 
         # State during file writing
         self.writing_process: sp.Popen | None = None
         self.progress_display: ProgressDisplay | None = None
         self.ended_with_interrupt: bool = False
 
+        # State for the asynchronous frame pipeline
+        self.frame_queue: queue.Queue | None = None
+        self.writer_thread: threading.Thread | None = None
+        self.writer_error: Exception | None = None
+        self.pixel_buffers: list = []
+        self.last_frame_bytes: bytes | None = None
+        self.n_frames_read: int = 0
+        self.pipeline_stats: dict[str, int] = dict()
+
+        # Movie segments making up the final movie, with cache_segments
+        self.segment_paths: list[Path] = []
+
         self.init_output_directories()
         self.init_audio()
 
@@ -82,7 +111,7 @@ class SceneFileWriter(object):
             self.image_file_path = self.init_image_file_path()
         if self.write_to_movie:
             self.movie_file_path = self.init_movie_file_path()
-        if self.subdivide_output:
+        if self.subdivide_output or self.cache_segments:
             self.partial_movie_directory = self.init_partial_movie_directory()
 
     def init_image_file_path(self) -> Path:
@@ -175,24 +204,72 @@ class SceneFileWriter(object):
         self.add_audio_segment(new_segment, time, gain_to_background)
 
     # Writers
+    def writes_segments(self) -> bool:
+        return self.subdivide_output or self.cache_segments
+
     def begin(self) -> None:
-        if not self.subdivide_output and self.write_to_movie:
+        if not self.writes_segments() and self.write_to_movie:
             self.open_movie_pipe(self.get_movie_file_path())
 
     def begin_animation(self) -> None:
-        if self.subdivide_output and self.write_to_movie:
+        # With cache_segments, the pipe is only opened by begin_segment,
+        # once it is known whether the segment needs rendering
+        if self.subdivide_output and not self.cache_segments and self.write_to_movie:
             self.open_movie_pipe(self.get_next_partial_movie_path())
 
+    def begin_segment(self, key: str | None) -> bool:
+        """
+        With cache_segments, begin the movie segment for the current play or
+        wait call. If a segment with this key was cached by an earlier
+        render, it's reused and True is returned, meaning no frames need
+        to be written. A key of None means the segment can't be cached.
+        """
+        if key is not None:
+            cached_path = Path(get_segment_cache_dir(), key).with_suffix(self.movie_file_extension)
+            self.segment_paths.append(cached_path)
+            if cached_path.exists():
+                # Mark it as recently used, for prune_segment_cache
+                os.utime(cached_path)
+                return True
+            self.open_movie_pipe(str(cached_path))
+        else:
+            partial_path = self.get_next_partial_movie_path()
+            self.segment_paths.append(Path(partial_path))
+            self.open_movie_pipe(partial_path)
+        return False
+
     def end_animation(self) -> None:
-        if self.subdivide_output and self.write_to_movie:
+        if not self.write_to_movie:
+            return
+        if self.cache_segments:
+            if self.writing_process is not None:
+                self.close_movie_pipe()
+                self.writing_process = None
+            if self.subdivide_output and self.segment_paths:
+                segment_path = self.segment_paths[-1]
+                partial_path = Path(self.get_next_partial_movie_path())
+                if segment_path != partial_path and segment_path.exists():
+                    shutil.copyfile(segment_path, partial_path)
+        elif self.subdivide_output:
             self.close_movie_pipe()
 
     def finish(self) -> None:
-        if not self.subdivide_output and self.write_to_movie:
+        if self.cache_segments and not self.subdivide_output and self.write_to_movie:
+            if self.writing_process is not None:
+                self.close_movie_pipe()
+                self.writing_process = None
+            file_path = self.get_movie_file_path()
+            self.concatenate_movie_files(self.segment_paths, file_path)
+            if self.includes_sound:
+                self.add_sound_to_video()
+            self.print_file_ready_message(file_path)
+        elif not self.subdivide_output and self.write_to_movie:
             self.close_movie_pipe()
             if self.includes_sound:
                 self.add_sound_to_video()
             self.print_file_ready_message(self.get_movie_file_path())
+        if self.cache_segments and self.write_to_movie:
+            prune_segment_cache()
         if self.save_last_frame:
             self.scene.update_frame(force_draw=True)
             self.save_final_image(self.scene.get_image())
@@ -228,6 +305,7 @@ class SceneFileWriter(object):
             command += ['-pix_fmt', self.pixel_format]
         command += [self.temp_file_path]
         self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+        self.open_frame_pipeline()
 
         if not self.quiet:
             self.progress_display = ProgressDisplay(
@@ -281,14 +359,125 @@ class SceneFileWriter(object):
             full_desc += " " * (desc_len - len(full_desc))
         self.progress_display.set_description(full_desc)
 
-    def write_frame(self, camera: Camera) -> None:
+    # Frame pipeline
+    def open_frame_pipeline(self) -> None:
+        self.pipeline_stats = dict(frames=0, stalls=0, max_queue_depth=0)
+        if self.frame_queue_size <= 0:
+            return
+
+        camera = self.scene.camera
+        width, height = camera.draw_fbo.size
+        frame_size = width * height * camera.n_channels
+        if not self.pixel_buffers or self.pixel_buffers[0].size != frame_size:
+            for buffer in self.pixel_buffers:
+                buffer.release()
+            self.pixel_buffers = [
+                camera.ctx.buffer(reserve=frame_size)
+                for _ in range(max(self.n_pixel_buffers, 1))
+            ]
+        self.n_frames_read = 0
+
+        self.writer_error = None
+        self.frame_queue = queue.Queue(maxsize=self.frame_queue_size)
+        self.writer_thread = threading.Thread(
+            target=self.pipe_queued_frames,
+            args=(self.writing_process.stdin, self.frame_queue),
+            daemon=True,
+        )
+        self.writer_thread.start()
+
+    def pipe_queued_frames(self, stdin, frame_queue: queue.Queue) -> None:
+        # Runs on the writer thread. After a failed write, keep draining
+        # the queue so the render loop never blocks on a full queue.
+        while (raw_bytes := frame_queue.get()) is not None:
+            if self.writer_error is not None:
+                continue
+            try:
+                stdin.write(raw_bytes)
+            except Exception as err:
+                self.writer_error = err
+
+    def queue_frame(self, raw_bytes: bytes) -> None:
+        if self.writer_error is not None:
+            raise self.writer_error
+        stats = self.pipeline_stats
+        if self.frame_queue.full():
+            stats["stalls"] += 1
+        self.frame_queue.put(raw_bytes)
+        self.last_frame_bytes = raw_bytes
+        stats["frames"] += 1
+        stats["max_queue_depth"] = max(stats["max_queue_depth"], self.frame_queue.qsize())
+
+    def flush_pixel_buffers(self) -> None:
+        n_buffers = len(self.pixel_buffers)
+        for index in range(max(self.n_frames_read - n_buffers, 0), self.n_frames_read):
+            self.queue_frame(self.pixel_buffers[index % n_buffers].read())
+        self.n_frames_read = 0
+
+    def close_frame_pipeline(self) -> None:
+        if self.frame_queue is None:
+            return
+        try:
+            self.flush_pixel_buffers()
+        finally:
+            self.frame_queue.put(None)
+            self.writer_thread.join()
+            self.frame_queue = None
+            self.writer_thread = None
+        log.debug(
+            "Frame pipeline: %d frames, %d stalls, max queue depth %d of %d",
+            self.pipeline_stats["frames"],
+            self.pipeline_stats["stalls"],
+            self.pipeline_stats["max_queue_depth"],
+            self.frame_queue_size,
+        )
+        if self.writer_error is not None:
+            raise self.writer_error
+
+    def get_frame_pipeline_stats(self) -> dict[str, int]:
+        """
+        Counters for the frame pipeline of the current (or last) movie pipe:
+        frames queued, how often the render loop had to wait on a full
+        queue, and the deepest the queue got
+        """
+        return dict(
+            **self.pipeline_stats,
+            queue_size=self.frame_queue_size,
+            queue_depth=(self.frame_queue.qsize() if self.frame_queue else 0),
+        )
+
+    def write_frame(self, camera: Camera, reuse_last_frame: bool = False) -> None:
+        """
+        Pipe the camera's current frame into ffmpeg. With reuse_last_frame,
+        the caller vouches that the frame is the same as the last one
+        written, so its bytes are written again without any readback
+        """
         if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
-            self.writing_process.stdin.write(raw_bytes)
+            if reuse_last_frame and self.frame_queue is not None:
+                # The last frame may still be sitting in a pixel buffer
+                self.flush_pixel_buffers()
+            if reuse_last_frame and self.last_frame_bytes is not None:
+                if self.frame_queue is None:
+                    self.writing_process.stdin.write(self.last_frame_bytes)
+                else:
+                    self.queue_frame(self.last_frame_bytes)
+            elif self.frame_queue is None:
+                raw_bytes = camera.get_raw_fbo_data()
+                self.writing_process.stdin.write(raw_bytes)
+                self.last_frame_bytes = raw_bytes
+            else:
+                # Before a pixel buffer is reused, hand the frame it still
+                # holds (read back a few frames ago) to the writer thread
+                buffer = self.pixel_buffers[self.n_frames_read % len(self.pixel_buffers)]
+                if self.n_frames_read >= len(self.pixel_buffers):
+                    self.queue_frame(buffer.read())
+                camera.read_raw_fbo_data_into(buffer)
+                self.n_frames_read += 1
             if self.progress_display is not None:
                 self.progress_display.update()
 
     def close_movie_pipe(self) -> None:
+        self.close_frame_pipeline()
         self.writing_process.stdin.close()
         self.writing_process.wait()
         self.writing_process.terminate()
@@ -300,6 +489,40 @@ class SceneFileWriter(object):
         else:
             self.movie_file_path = self.temp_file_path
 
+    def get_partial_movie_paths(self, n_plays: int) -> list[Path]:
+        return [
+            Path(self.partial_movie_directory, f"{index:05}").with_suffix(self.movie_file_extension)
+            for index in range(n_plays)
+        ]
+
+    def combine_partial_movie_files(self, n_plays: int) -> None:
+        """
+        Stitch the partial movie files for the first n_plays animations
+        into the full movie, copying streams rather than re-encoding
+        """
+        file_path = self.init_movie_file_path()
+        self.concatenate_movie_files(self.get_partial_movie_paths(n_plays), file_path)
+        self.movie_file_path = file_path
+        self.print_file_ready_message(file_path)
+
+    def concatenate_movie_files(self, paths: list[Path], file_path: str | Path) -> None:
+        list_file_path = Path(self.partial_movie_directory, "partial_movie_files.txt")
+        with open(list_file_path, "w") as fp:
+            for path in paths:
+                if path.exists():
+                    fp.write(f"file '{path.absolute()}'\n")
+        commands = [
+            self.ffmpeg_bin,
+            '-y',  # overwrite output file if it exists
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(list_file_path),
+            '-c', 'copy',
+            '-loglevel', 'error',
+            str(file_path),
+        ]
+        sp.call(commands)
+
     def add_sound_to_video(self) -> None:
         movie_file_path = self.get_movie_file_path()
         stem, ext = os.path.splitext(movie_file_path)
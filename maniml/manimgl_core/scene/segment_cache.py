@@ -0,0 +1,269 @@
+"""
+Keys for the on-disk cache of rendered movie segments.
+
+When a scene writes with cache_segments, the movie segment for each
+play or wait call is stored under a digest of everything it depends
+on: the state of every mobject in the scene, the animations (with their
+rate functions, updaters and target mobjects), and the camera and
+encoder settings. Re-rendering a scene after editing one animation then
+only re-renders the segments whose inputs changed.
+
+Functions are described by their code, defaults, closures and the
+values of the globals they read, following any functions and classes
+those lead to. Code compiled from the files of the standard library,
+installed packages and maniml itself is described by name only, as it
+changes only with the installed version. Objects without a stable
+description (e.g. whose repr holds a memory address, or a module of the
+user's own) make their segment's key unique to this run. So an unknown
+input can cause a cache miss but not a stale segment, short of an input
+changing in a way its description misses, such as a C extension's
+internal state.
+
+The cache directory is kept under SEGMENT_CACHE_MAX_SIZE by deleting the
+least recently used segments once a render finishes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import site
+import sys
+import sysconfig
+import types
+
+import numpy as np
+
+from maniml.manimgl_core.animation.animation import Animation
+from maniml.manimgl_core.mobject.mobject import Mobject
+from maniml.manimgl_core.utils.directories import get_cache_dir
+from maniml.manimgl_core.utils.file_ops import guarantee_existence
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+    from maniml.manimgl_core.scene.scene import Scene
+
+
+# Bump whenever the way segments are rendered or keyed changes
+SEGMENT_CACHE_VERSION = 2
+
+# Data fields which rendering fills in lazily from the points, so whether
+# or not a mobject has been rendered yet mustn't change its key
+DERIVED_DATA_FIELDS = ("joint_angle", "base_normal")
+
+# Segments beyond this many bytes are deleted, least recently used first
+SEGMENT_CACHE_MAX_SIZE = 2 * 1024**3
+
+# Mixed into the description of anything without a stable one, so that
+# it can't match a segment cached by another run
+RUN_NONCE = os.urandom(16).hex()
+
+# Modules loaded from these directories are treated as library code
+LIBRARY_DIRS = tuple(
+    os.path.join(os.path.realpath(path), "")
+    for path in {
+        *(sysconfig.get_paths()[key] for key in ("stdlib", "platstdlib", "purelib", "platlib")),
+        *site.getsitepackages(),
+        site.getusersitepackages(),
+        str(Path(__file__).parents[2]),
+    }
+)
+
+_library_files: dict[str, bool] = dict()
+
+
+def get_segment_cache_dir() -> str:
+    return guarantee_existence(os.path.join(get_cache_dir(), "segments"))
+
+
+def prune_segment_cache(max_size: int = SEGMENT_CACHE_MAX_SIZE) -> None:
+    """
+    Delete the least recently used segments until the cache takes up at
+    most max_size bytes. Reusing a segment bumps its modification time,
+    which therefore tracks its last use.
+    """
+    entries = []
+    with os.scandir(get_segment_cache_dir()) as scan:
+        for entry in scan:
+            if entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
+
+
+def is_library_file(path: str) -> bool:
+    """
+    Whether code from the file at path (as in a code object's co_filename)
+    is part of the standard library, an installed package or maniml,
+    rather than of the user's own files
+    """
+    if path not in _library_files:
+        if path.startswith("<frozen "):
+            result = True
+        else:
+            result = os.path.isabs(path) \
+                and os.path.realpath(path).startswith(LIBRARY_DIRS)
+        _library_files[path] = result
+    return _library_files[path]
+
+
+def is_library_module(module: types.ModuleType) -> bool:
+    path = getattr(module, "__file__", None)
+    if path is None:
+        spec = getattr(module, "__spec__", None)
+        return module.__name__ in sys.builtin_module_names \
+            or getattr(spec, "origin", None) == "frozen"
+    return is_library_file(path)
+
+
+def is_library_class(cls: type) -> bool:
+    """
+    Whether cls is defined by library code, going by the file its methods
+    were compiled from. Those without methods go by their module, except
+    for __main__, which under `python -m maniml` is maniml's own rather
+    than the scene file which defines them.
+    """
+    for attr in vars(cls).values():
+        func = getattr(attr, "__func__", attr)
+        if isinstance(func, types.FunctionType):
+            return is_library_file(func.__code__.co_filename)
+    module = sys.modules.get(cls.__module__)
+    if module is None or cls.__module__ == "__main__":
+        return False
+    return is_library_module(module)
+
+
+def get_global_names(code: types.CodeType) -> set[str]:
+    """
+    Names which code, or any code nested in it, may look up as globals
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(get_global_names(const))
+    return names
+
+
+def get_segment_key(scene: Scene, *inputs: Any) -> str:
+    """
+    Digest of the scene's mobjects together with the given inputs. Updaters
+    often close over the scene itself, which is described by its class and
+    current time, its mobjects being hashed in full anyway.
+    """
+    hasher = hashlib.sha256(repr(SEGMENT_CACHE_VERSION).encode())
+    stand_ins = {id(scene): f"<{type(scene).__qualname__} at t={scene.time!r}>"}
+    for obj in (scene.mobjects, *inputs):
+        update_digest(hasher, obj, stand_ins)
+    return hasher.hexdigest()[:32]
+
+
+def update_digest(hasher, obj: Any, stand_ins: dict[int, str]) -> None:
+    """
+    Feed a description of obj into hasher. The stand_ins map ids to short
+    descriptions to use instead, and gets each mobject and animation added
+    once described, so shared references are only described once.
+    """
+    if id(obj) in stand_ins:
+        hasher.update(stand_ins[id(obj)].encode())
+        return
+    if isinstance(obj, (Mobject, Animation, types.FunctionType, type)):
+        stand_ins[id(obj)] = f"<{len(stand_ins)}>"
+
+    if isinstance(obj, Mobject):
+        update_digest(hasher, type(obj), stand_ins)
+        for name in obj.data.dtype.names:
+            if name not in DERIVED_DATA_FIELDS:
+                hasher.update(name.encode())
+                hasher.update(np.ascontiguousarray(obj.data[name]))
+        for value in (
+            obj.uniforms,
+            obj.shader_folder,
+            obj.depth_test,
+            obj.render_primitive,
+            obj.shader_code_replacements,
+            obj.texture_paths,
+            obj.updaters,
+            obj.submobjects,
+        ):
+            update_digest(hasher, value, stand_ins)
+    elif isinstance(obj, Animation):
+        update_digest(hasher, type(obj), stand_ins)
+        update_digest(hasher, vars(obj), stand_ins)
+    elif isinstance(obj, dict):
+        hasher.update(f"dict{len(obj)}".encode())
+        for key in sorted(obj, key=repr):
+            update_digest(hasher, key, stand_ins)
+            update_digest(hasher, obj[key], stand_ins)
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for item in obj:
+            update_digest(hasher, item, stand_ins)
+    elif isinstance(obj, np.ndarray):
+        hasher.update(repr((obj.dtype, obj.shape)).encode())
+        hasher.update(np.ascontiguousarray(obj))
+    elif isinstance(obj, types.MethodType):
+        update_digest(hasher, obj.__func__, stand_ins)
+        update_digest(hasher, obj.__self__, stand_ins)
+    elif isinstance(obj, types.FunctionType):
+        hasher.update(f"{obj.__module__}.{obj.__qualname__}".encode())
+        update_digest(hasher, obj.__defaults__, stand_ins)
+        update_digest(hasher, obj.__kwdefaults__, stand_ins)
+        for cell in obj.__closure__ or ():
+            try:
+                update_digest(hasher, cell.cell_contents, stand_ins)
+            except ValueError:
+                # Empty cell
+                hasher.update(b"<empty>")
+        if not is_library_file(obj.__code__.co_filename):
+            update_code_digest(hasher, obj.__code__)
+            for name in sorted(get_global_names(obj.__code__)):
+                # Names not found are attributes or builtins
+                if name in obj.__globals__:
+                    hasher.update(name.encode())
+                    update_digest(hasher, obj.__globals__[name], stand_ins)
+    elif isinstance(obj, type):
+        hasher.update(repr(obj).encode())
+        if not is_library_class(obj):
+            update_digest(hasher, obj.__bases__, stand_ins)
+            attrs = vars(obj)
+            for name in sorted(attrs):
+                if name not in ("__dict__", "__weakref__"):
+                    hasher.update(name.encode())
+                    update_digest(hasher, attrs[name], stand_ins)
+    elif isinstance(obj, (classmethod, staticmethod)):
+        hasher.update(type(obj).__name__.encode())
+        update_digest(hasher, obj.__func__, stand_ins)
+    elif isinstance(obj, property):
+        hasher.update(b"property")
+        update_digest(hasher, (obj.fget, obj.fset, obj.fdel), stand_ins)
+    elif isinstance(obj, types.ModuleType):
+        hasher.update(repr(obj).encode())
+        if not is_library_module(obj):
+            # Which of its contents matter isn't known
+            hasher.update(RUN_NONCE.encode())
+    else:
+        description = repr(obj)
+        hasher.update(description.encode())
+        if " at 0x" in description:
+            hasher.update(RUN_NONCE.encode())
+
+
+def update_code_digest(hasher, code: types.CodeType) -> None:
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            update_code_digest(hasher, const)
+        else:
+            hasher.update(repr(const).encode())
@@ -19,7 +19,7 @@ from maniml.manimgl_core.utils.shaders import set_program_uniform
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Optional, Tuple, Iterable
+    from typing import Optional, Tuple, Iterable, Sequence
     from maniml.manimgl_core.typing import UniformDict
     from moderngl.vertex_array import VertexArray
     from moderngl.framebuffer import Framebuffer
@@ -44,7 +44,9 @@ class ShaderWrapper(object):
         code_replacements: dict[str, str] = dict(),
     ):
         self.ctx = ctx
-        self.vert_data = vert_data
+        # Data gets read into vert_data in place, so it mustn't be the
+        # (possibly shared, see Mobject.copy) data of the mobject itself
+        self.vert_data = vert_data.copy()
         self.vert_attributes = vert_data.dtype.names
         self.shader_folder = shader_folder
         self.depth_test = depth_test
@@ -98,6 +100,9 @@ class ShaderWrapper(object):
 
     def init_vertex_objects(self):
         self.vbo = None
+        # Lengths and versions of the arrays last read into the vbo
+        self.data_lengths: list[int] = []
+        self.data_versions: list[Optional[int]] = []
         self.vaos = []
 
     def add_texture(self, name: str, texture: moderngl.Texture):
@@ -150,11 +155,29 @@ class ShaderWrapper(object):
 
     # Adding data
 
-    def read_in(self, data_list: Iterable[np.ndarray]):
-        total_len = sum(map(len, data_list))
+    def read_in(
+        self,
+        data_list: Iterable[np.ndarray],
+        data_versions: Optional[Sequence[int]] = None,
+    ):
+        """
+        Concatenate data_list into the vbo. If data_versions is given, with one
+        stamp per array that changes whenever its contents do, then when the
+        arrays have the same lengths as last time, only those whose stamps
+        changed are rewritten.
+        """
+        data_list = list(data_list)
+        lengths = list(map(len, data_list))
+        total_len = sum(lengths)
         if total_len == 0:
             if self.vbo is not None:
                 self.vbo.clear()
+            self.data_lengths = []
+            self.data_versions = []
+            return
+
+        if data_versions is not None and self.vbo is not None and lengths == self.data_lengths:
+            self.write_changed_data(data_list, data_versions)
             return
 
         # If possible, read concatenated data into existing list
@@ -172,6 +195,32 @@ class ShaderWrapper(object):
             self.generate_vaos()
         else:
             self.vbo.write(self.vert_data)
+        self.data_lengths = lengths
+        self.data_versions = list(data_versions) if data_versions is not None else [None] * len(lengths)
+
+    def write_changed_data(self, data_list: list[np.ndarray], data_versions: Sequence[int]):
+        """
+        Copy the arrays whose versions differ from those last read in over
+        their slots of vert_data, then write each run of adjacent changed
+        slots to the vbo in one go.
+        """
+        ends = np.cumsum(self.data_lengths)
+        starts = ends - self.data_lengths
+        run_start = None
+        for i, (data, version) in enumerate(zip(data_list, data_versions)):
+            changed = version is None or version != self.data_versions[i]
+            if changed:
+                self.vert_data[starts[i]:ends[i]] = data
+                self.data_versions[i] = version
+                if run_start is None:
+                    run_start = starts[i]
+            if run_start is not None and (not changed or i == len(data_list) - 1):
+                run_end = ends[i] if changed else starts[i]
+                self.vbo.write(
+                    self.vert_data[run_start:run_end],
+                    offset=int(run_start) * self.vert_data.itemsize,
+                )
+                run_start = None
 
     def generate_vaos(self):
         # Vertex array object
@@ -305,11 +354,10 @@ class VShaderWrapper(ShaderWrapper):
         self.fill_depth_vert_attributes = ['point', 'base_normal']
 
     def init_vertex_objects(self):
-        self.vbo = None
+        super().init_vertex_objects()
         self.stroke_vao = None
         self.fill_vao = None
         self.fill_border_vao = None
-        self.vaos = []
 
     def generate_vaos(self):
         self.stroke_vao = self.ctx.vertex_array(
@@ -91,6 +91,45 @@ def partial_quadratic_bezier_points(
     return [h0, h1, h2]
 
 
+def subdivide_quadratic_path(points: VectNArray, n_pieces: Sequence[int]) -> VectNArray:
+    """
+    Takes the points of a path of quadratic bezier curves, the i-th being
+    points[2 * i:2 * i + 3], and splits the i-th curve into n_pieces[i]
+    curves, each covering an equal share of its parameter range. This gives
+    the same result as applying partial_quadratic_bezier_points to each pair
+    of consecutive values of np.linspace(0, 1, n_pieces[i] + 1), but handles
+    all curves and pieces at once.
+    """
+    n_pieces = np.asarray(n_pieces, dtype=int)
+    curve_indices = np.repeat(np.arange(len(n_pieces)), n_pieces)
+    piece_counts = n_pieces[curve_indices]
+    # Which piece of its curve each new curve is
+    piece_indices = np.arange(len(curve_indices)) - np.repeat(np.cumsum(n_pieces) - n_pieces, n_pieces)
+
+    steps = 1.0 / piece_counts
+    a = (piece_indices * steps)[:, np.newaxis]
+    b = np.where(
+        piece_indices + 1 == piece_counts, 1.0, (piece_indices + 1) * steps
+    )[:, np.newaxis]
+    p0 = points[0:-1:2][curve_indices]
+    p1 = points[1::2][curve_indices]
+    p2 = points[2::2][curve_indices]
+
+    def curve(t):
+        return p0 * (1 - t) * (1 - t) + 2 * p1 * t * (1 - t) + p2 * t * t
+    h0 = np.where(a > 0, curve(a), p0)
+    h2 = np.where(b < 1, curve(b), p2)
+    h1_prime = (1 - a) * p1 + a * p2
+    end_prop = (b - a) / (1. - a)
+    h1 = (1 - end_prop) * h0 + end_prop * h1_prime
+
+    result = np.zeros((2 * len(h2) + 1, points.shape[1]), dtype=h2.dtype)
+    result[0] = points[0]
+    result[1::2] = h1
+    result[2::2] = h2
+    return result
+
+
 # Linear interpolation variants
 
 
@@ -143,6 +143,33 @@ def array_is_constant(arr: np.ndarray) -> bool:
     return len(arr) > 0 and (arr == arr[0]).all()
 
 
+def read_only_view(arr: np.ndarray) -> np.ndarray:
+    """
+    View of arr which can't be written through, leaving arr as it is
+    """
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
+def flat_record_view(arr: np.ndarray) -> np.ndarray | None:
+    """
+    View of a contiguous structured array as one flat array of
+    the scalar type shared by all its fields, or None if there
+    is no such type.
+    """
+    fields = arr.dtype.fields
+    if fields is None or not arr.flags.c_contiguous:
+        return None
+    field_dtypes = [field[0] for field in fields.values()]
+    base = field_dtypes[0].base
+    if any(dtype.base != base for dtype in field_dtypes):
+        return None
+    if sum(dtype.itemsize for dtype in field_dtypes) != arr.dtype.itemsize:
+        return None
+    return arr.view(base)
+
+
 def cartesian_product(*arrays: np.ndarray):
     """
     Copied from https://stackoverflow.com/a/11146645
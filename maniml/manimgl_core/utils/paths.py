@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import math
 
 import numpy as np
 
 from maniml.manimgl_core.constants import OUT
 from maniml.manimgl_core.utils.bezier import interpolate
+from maniml.manimgl_core.utils.simple_functions import get_parameters
 from maniml.manimgl_core.utils.space_ops import get_norm
 from maniml.manimgl_core.utils.space_ops import rotation_matrix_transpose
 
@@ -22,15 +24,35 @@ STRAIGHT_PATH_THRESHOLD = 0.01
 def straight_path(
     start_points: np.ndarray,
     end_points: np.ndarray,
-    alpha: float
+    alpha: float,
+    out: np.ndarray | None = None
 ) -> np.ndarray:
     """
     Same function as interpolate, but renamed to reflect
     intent of being used to determine how a set of points move
     to another set.  For instance, it should be a specific case
     of path_along_arc
+
+    If out is given, the result is written into it without
+    allocating any temporary arrays.
     """
-    return interpolate(start_points, end_points, alpha)
+    if out is None:
+        return interpolate(start_points, end_points, alpha)
+    if np.ndim(alpha) > 0 or np.may_share_memory(out, start_points) \
+            or np.may_share_memory(out, end_points):
+        out[...] = interpolate(start_points, end_points, alpha)
+        return out
+    # Lerp from whichever end is nearer, so that alpha = 0 and
+    # alpha = 1 land exactly on the start and end points. The
+    # factor takes out's dtype, so that no ufunc needs casting buffers
+    np.subtract(end_points, start_points, out=out)
+    if alpha < 0.5:
+        np.multiply(out, out.dtype.type(alpha), out=out)
+        np.add(start_points, out, out=out)
+    else:
+        np.multiply(out, out.dtype.type(alpha - 1), out=out)
+        np.add(end_points, out, out=out)
+    return out
 
 
 def path_along_arc(
@@ -47,17 +69,29 @@ def path_along_arc(
         axis = OUT
     unit_axis = axis / get_norm(axis)
 
-    def path(start_points, end_points, alpha):
+    def path(start_points, end_points, alpha, out=None):
         vects = end_points - start_points
         centers = start_points + 0.5 * vects
         if arc_angle != np.pi:
             centers += np.cross(unit_axis, vects / 2.0) / math.tan(arc_angle / 2)
         rot_matrix_T = rotation_matrix_transpose(alpha * arc_angle, unit_axis)
-        return centers + np.dot(start_points - centers, rot_matrix_T)
+        return np.add(centers, np.dot(start_points - centers, rot_matrix_T), out=out)
 
     return path
 
 
+@lru_cache(maxsize=64)
+def path_func_accepts_out(path_func: Callable) -> bool:
+    """
+    Whether path_func can write its result into an out buffer,
+    as the path functions defined here can
+    """
+    try:
+        return "out" in get_parameters(path_func)
+    except (TypeError, ValueError):
+        return False
+
+
 def clockwise_path() -> Callable[[Vect3Array, Vect3Array, float], Vect3Array]:
     return path_along_arc(-np.pi)
 
@@ -10,10 +10,34 @@ if TYPE_CHECKING:
     from typing import Callable
 
 
+def elementwise(func: Callable[[float], float]) -> Callable[[float], float]:
+    """
+    Marks a rate function as also accepting an array of alphas,
+    to each of which it is applied
+    """
+    func.elementwise = True
+    return func
+
+
+def evaluate_rate_func(
+    rate_func: Callable[[float], float],
+    alphas: np.ndarray
+) -> np.ndarray:
+    """
+    Applies rate_func to each of alphas, all at once if it's
+    marked as elementwise, and one at a time otherwise
+    """
+    if getattr(rate_func, "elementwise", False):
+        return np.array(rate_func(alphas), dtype=float)
+    return np.array([rate_func(alpha) for alpha in alphas], dtype=float)
+
+
+@elementwise
 def linear(t: float) -> float:
     return t
 
 
+@elementwise
 def smooth(t: float) -> float:
     # Zero first and second derivatives at t=0 and t=1.
     # Equivalent to bezier([0, 0, 0, 1, 1, 1])
@@ -21,32 +45,49 @@ def smooth(t: float) -> float:
     return (t**3) * (10 * s * s + 5 * s * t + t * t)
 
 
+@elementwise
 def rush_into(t: float) -> float:
     return 2 * smooth(0.5 * t)
 
 
+@elementwise
 def rush_from(t: float) -> float:
     return 2 * smooth(0.5 * (t + 1)) - 1
 
 
+@elementwise
 def slow_into(t: float) -> float:
     return np.sqrt(1 - (1 - t) * (1 - t))
 
 
+@elementwise
 def double_smooth(t: float) -> float:
+    if isinstance(t, np.ndarray):
+        return np.where(t < 0.5, 0.5 * smooth(2 * t), 0.5 * (1 + smooth(2 * t - 1)))
     if t < 0.5:
         return 0.5 * smooth(2 * t)
     else:
         return 0.5 * (1 + smooth(2 * t - 1))
 
 
+@elementwise
 def there_and_back(t: float) -> float:
-    new_t = 2 * t if t < 0.5 else 2 * (1 - t)
+    if isinstance(t, np.ndarray):
+        new_t = np.where(t < 0.5, 2 * t, 2 * (1 - t))
+    else:
+        new_t = 2 * t if t < 0.5 else 2 * (1 - t)
     return smooth(new_t)
 
 
+@elementwise
 def there_and_back_with_pause(t: float, pause_ratio: float = 1. / 3) -> float:
     a = 2. / (1. - pause_ratio)
+    if isinstance(t, np.ndarray):
+        return np.select(
+            [t < 0.5 - pause_ratio / 2, t < 0.5 + pause_ratio / 2],
+            [smooth(a * t), 1],
+            smooth(a - a * t),
+        )
     if t < 0.5 - pause_ratio / 2:
         return smooth(a * t)
     elif t < 0.5 + pause_ratio / 2:
@@ -55,10 +96,12 @@ def there_and_back_with_pause(t: float, pause_ratio: float = 1. / 3) -> float:
         return smooth(a - a * t)
 
 
+@elementwise
 def running_start(t: float, pull_factor: float = -0.5) -> float:
     return bezier([0, 0, pull_factor, pull_factor, 1, 1, 1])(t)
 
 
+@elementwise
 def overshoot(t: float, pull_factor: float = 1.5) -> float:
     return bezier([0, 0, pull_factor, pull_factor, 1, 1])(t)
 
@@ -69,9 +112,12 @@ def not_quite_there(
 ) -> Callable[[float], float]:
     def result(t):
         return proportion * func(t)
+    if getattr(func, "elementwise", False):
+        elementwise(result)
     return result
 
 
+@elementwise
 def wiggle(t: float, wiggles: float = 2) -> float:
     return there_and_back(t) * np.sin(wiggles * np.pi * t)
 
@@ -82,6 +128,14 @@ def squish_rate_func(
     b: float = 0.6
 ) -> Callable[[float], float]:
     def result(t):
+        if isinstance(t, np.ndarray):
+            if a == b:
+                return np.full(t.shape, a, dtype=float)
+            return np.select(
+                [t < a, t > b],
+                [func(0), func(1)],
+                func(np.clip((t - a) / (b - a), 0, 1)),
+            )
         if a == b:
             return a
         elif t < a:
@@ -91,6 +145,8 @@ def squish_rate_func(
         else:
             return func((t - a) / (b - a))
 
+    if getattr(func, "elementwise", False):
+        elementwise(result)
     return result
 
 # Stylistically, should this take parameters (with default values)?
@@ -99,10 +155,12 @@ def squish_rate_func(
 # "lingering", different from squish_rate_func's default params
 
 
+@elementwise
 def lingering(t: float) -> float:
-    return squish_rate_func(lambda t: t, 0, 0.8)(t)
+    return squish_rate_func(linear, 0, 0.8)(t)
 
 
+@elementwise
 def exponential_decay(t: float, half_life: float = 0.1) -> float:
     # The half-life should be rather small to minimize
     # the cut-off error at the end
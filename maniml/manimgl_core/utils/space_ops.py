@@ -1,14 +1,10 @@
 from __future__ import annotations
 
-from functools import reduce
 import math
-import operator as op
-import platform
 
 from mapbox_earcut import triangulate_float32 as earcut
 import numpy as np
 from scipy.spatial.transform import Rotation
-from tqdm.auto import tqdm as ProgressDisplay
 
 from maniml.manimgl_core.constants import DOWN, OUT, RIGHT, UP
 from maniml.manimgl_core.constants import PI, TAU
@@ -437,16 +433,6 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
     ]
     epsilon = 1e-6
 
-    def is_in(point, ring_id):
-        return abs(abs(get_winding_number([i - point for i in verts[rings[ring_id]]])) - 1) < epsilon
-
-    def ring_area(ring_id):
-        ring = rings[ring_id]
-        s = 0
-        for i, j in zip(ring[1:], ring):
-            s += cross2d(verts[i], verts[j])
-        return abs(s) / 2
-
     # Points at the same position may cause problems
     for i in rings:
         if len(i) < 2:
@@ -455,54 +441,111 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
         verts[i[-1]] += (verts[i[-2]] - verts[i[-1]]) * epsilon
 
     # First, we should know which rings are directly contained in it for each ring
-
-    right = [max(verts[rings[i], 0]) for i in range(len(rings))]
-    left = [min(verts[rings[i], 0]) for i in range(len(rings))]
-    top = [max(verts[rings[i], 1]) for i in range(len(rings))]
-    bottom = [min(verts[rings[i], 1]) for i in range(len(rings))]
-    area = [ring_area(i) for i in range(len(rings))]
-
-    # The larger ring must be outside
-    rings_sorted = list(range(len(rings)))
-    rings_sorted.sort(key=lambda x: area[x], reverse=True)
-
-    def is_in_fast(ring_a, ring_b):
-        # Whether a is in b
-        return reduce(op.and_, (
-            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b],
-            bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b],
-            is_in(verts[rings[ring_a][0]], ring_b)
-        ))
-
-    chilren = [[] for i in rings]
-    ringenum = ProgressDisplay(
-        enumerate(rings_sorted),
-        total=len(rings),
-        leave=False,
-        ascii=True if platform.system() == 'Windows' else None,
-        dynamic_ncols=True,
-        desc="SVG Triangulation",
-        delay=3,
-    )
-    for idx, i in ringenum:
-        for j in rings_sorted[:idx][::-1]:
-            if is_in_fast(i, j):
-                chilren[j].append(i)
-                break
+    children = get_ring_children(verts, rings, epsilon)
 
     res = []
 
     # Then, we can use earcut for each part
     used = [False] * len(rings)
-    for i in rings_sorted:
+    for i in children:
         if used[i]:
             continue
         v = rings[i]
         ring_ends = [len(v)]
-        for j in chilren[i]:
+        for j in children[i]:
             used[j] = True
             v += rings[j]
             ring_ends.append(len(v))
-        res += [v[i] for i in earcut(verts[v, :2], ring_ends)]
+        tri_indices = earcut(
+            np.array(verts[v, :2], dtype=np.float32),
+            np.array(ring_ends, dtype=np.uint32),
+        )
+        res += [v[i] for i in tri_indices]
 
     return res
+
+
+def get_ring_children(
+    verts: Vect3Array | Vect2Array,
+    rings: list[list[int]],
+    epsilon: float = 1e-6
+) -> dict[int, list[int]]:
+    """
+    For each ring, listed from largest to smallest area, find the rings
+    directly inside it, i.e. those for which it is the smallest larger
+    ring whose bounding box holds theirs and which winds once around
+    their first vertex.
+
+    Candidate containers are looked up in a grid of cells, each listing
+    the rings whose bounding boxes overlap it, so each ring is only
+    tested against rings near it rather than against every larger one.
+    """
+    n_rings = len(rings)
+    if n_rings == 0:
+        return dict()
+    ring_verts = [verts[ring, :2] for ring in rings]
+
+    # The areas below leave out the closing edge of each ring, and are
+    # summed in order, matching how rings have always been sorted
+    left, bottom = np.array([rv.min(0) for rv in ring_verts]).T
+    right, top = np.array([rv.max(0) for rv in ring_verts]).T
+    area = np.array([
+        abs(np.cumsum(cross2d(rv[1:], rv[:-1]))[-1]) / 2 if len(rv) > 1 else 0
+        for rv in ring_verts
+    ])
+
+    # The larger ring must be outside
+    rings_sorted = sorted(range(n_rings), key=lambda x: area[x], reverse=True)
+    rank = np.zeros(n_rings, dtype=int)
+    rank[rings_sorted] = np.arange(n_rings)
+
+    # Spatial index: a grid of roughly one cell per ring over the bounding
+    # box of everything
+    grid_size = int(np.ceil(np.sqrt(n_rings)))
+    x0, y0 = left.min(), bottom.min()
+    cell_width = max(right.max() - x0, 1e-12) / grid_size
+    cell_height = max(top.max() - y0, 1e-12) / grid_size
+
+    def cell_index(x, y):
+        cx = np.clip(((x - x0) // cell_width).astype(int), 0, grid_size - 1)
+        cy = np.clip(((y - y0) // cell_height).astype(int), 0, grid_size - 1)
+        return cx, cy
+
+    cx0s, cy0s = cell_index(left, bottom)
+    cx1s, cy1s = cell_index(right, top)
+    cells = [[[] for _ in range(grid_size)] for _ in range(grid_size)]
+    for j in range(n_rings):
+        for cx in range(cx0s[j], cx1s[j] + 1):
+            for cy in range(cy0s[j], cy1s[j] + 1):
+                cells[cx][cy].append(j)
+    cells = [[np.array(cell, dtype=int) for cell in column] for column in cells]
+
+    first_points = np.array([rv[0] for rv in ring_verts])
+    pcxs, pcys = cell_index(first_points[:, 0], first_points[:, 1])
+
+    children = {i: [] for i in rings_sorted}
+    for i in rings_sorted[1:]:
+        js = cells[pcxs[i]][pcys[i]]
+        js = js[
+            (rank[js] < rank[i])
+            & (left[js] <= left[i]) & (right[i] <= right[js])
+            & (bottom[js] <= bottom[i]) & (top[i] <= top[js])
+        ]
+        # Check the smallest candidates first
+        for j in js[np.argsort(-rank[js])]:
+            winding = get_winding_number_around(ring_verts[j], first_points[i])
+            if abs(abs(winding) - 1) < epsilon:
+                children[j].append(i)
+                break
+    return children
+
+
+def get_winding_number_around(ring: Vect2Array, point: Vect2) -> float:
+    """
+    Vectorized get_winding_number for the closed polygon ring
+    around point
+    """
+    diffs = (ring - point).astype(np.float64)
+    angles = np.arctan2(diffs[:, 1], diffs[:, 0])
+    d_angles = ((np.roll(angles, -1) - angles + PI) % TAU) - PI
+    return np.cumsum(d_angles)[-1] / TAU
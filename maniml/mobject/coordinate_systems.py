@@ -148,11 +148,7 @@ class Axes(GLAxes):
         # GL uses get_parametric_curve with t_range parameter
         if t_range is None:
             t_range = [0, 1, 0.01]
-        elif len(t_range) == 2:
-            # CE allows 2-element t_range, GL needs 3 (min, max, step)
-            t_range = [t_range[0], t_range[1], 0.01]
-            
-        # GL expects t_range as a list/tuple with 3 elements
+        # A 2-element t_range (no step) is sampled adaptively by ParametricCurve
         return self.get_parametric_curve(function, t_range=t_range, **kwargs)
     
     def get_axis_labels(self, x_label=None, y_label=None, **kwargs):
@@ -10,8 +10,23 @@ import ast
 import hashlib
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set, Any
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileModifiedEvent
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler, FileModifiedEvent
+except ImportError:
+    # Only SceneFileWatcher needs watchdog, CodeAnalyzer works without it
+    Observer = None
+    FileSystemEventHandler = object
+    FileModifiedEvent = None
+
+
+def hash_node(node: ast.AST) -> str:
+    """
+    Hash of the code node parses, which, as positions aren't part of it, is
+    unchanged by edits to formatting or comments.
+    """
+    return hashlib.md5(ast.dump(node).encode()).hexdigest()
 
 
 class CodeAnalyzer:
@@ -19,6 +34,11 @@ class CodeAnalyzer:
     
     def __init__(self):
         self.animations: List[Tuple[int, int, str]] = []  # (start_line, end_line, code_hash)
+        # Top-level statements of construct, as (start_line, end_line, code_hash)
+        self.statements: List[Tuple[int, int, str]] = []
+        self.statement_nodes: List[ast.stmt] = []
+        # Hash of everything in the file outside the body of construct
+        self.module_hash: Optional[str] = None
         
     def analyze_file(self, filepath: str) -> None:
         """Parse file and extract animation calls with their line numbers."""
@@ -73,6 +93,74 @@ class CodeAnalyzer:
             
         return None
 
+    def analyze_construct(self, source: str, class_name: Optional[str] = None) -> None:
+        """
+        Parse source and map each top-level statement in the construct method
+        (of the class class_name, if given) to a hash of its code and its line span.
+        """
+        self.statements.clear()
+        self.statement_nodes.clear()
+        self.module_hash = None
+
+        try:
+            tree = ast.parse(source)
+        except SyntaxError as e:
+            print(f"Error analyzing code: {e}")
+            return
+
+        construct = None
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef) and class_name in (None, node.name):
+                construct = next((
+                    item for item in node.body
+                    if isinstance(item, ast.FunctionDef) and item.name == 'construct'
+                ), None)
+                if construct is not None:
+                    break
+        if construct is None:
+            return
+
+        for node in construct.body:
+            self.statements.append((node.lineno, node.end_lineno or node.lineno, hash_node(node)))
+            self.statement_nodes.append(node)
+
+        # Helpers, imports and the like can change what any statement does
+        body = construct.body
+        construct.body = []
+        self.module_hash = hash_node(tree)
+        construct.body = body
+
+    def get_statement_index(self, line: int) -> Optional[int]:
+        """Index of the top-level statement of construct spanning line, if any."""
+        for i, (start_line, end_line, code_hash) in enumerate(self.statements):
+            if start_line <= line <= end_line:
+                return i
+        return None
+
+    def find_changed_statements(self, other: 'CodeAnalyzer') -> Optional[Tuple[int, int]]:
+        """
+        Compare with another analyzer to find the indices of the first and last
+        statements of other's construct which differ from this one's, or None if
+        there are no changes. A change outside construct changes every statement.
+        """
+        hashes1 = [code_hash for _, _, code_hash in self.statements]
+        hashes2 = [code_hash for _, _, code_hash in other.statements]
+        if self.module_hash != other.module_hash:
+            return (0, len(hashes2) - 1)
+        if hashes1 == hashes2:
+            return None
+
+        # The first statement past the unchanged prefix
+        first = 0
+        while first < min(len(hashes1), len(hashes2)) and hashes1[first] == hashes2[first]:
+            first += 1
+        # The last statement before the unchanged suffix
+        last1, last2 = len(hashes1) - 1, len(hashes2) - 1
+        while last1 >= first and last2 >= first and hashes1[last1] == hashes2[last2]:
+            last1 -= 1
+            last2 -= 1
+        return (first, last2)
+
 
 class SceneFileWatcher(FileSystemEventHandler):
     """Watches the scene file for changes and triggers reloads."""
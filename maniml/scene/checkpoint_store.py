@@ -0,0 +1,664 @@
+"""
+Compact storage for the scene states recorded at animation checkpoints.
+
+Rather than a full copy of every mobject, each checkpoint state is kept
+as its changes from the state recorded before it: mobjects which haven't
+changed share the earlier copy, and those which have only store the data
+fields, uniforms and bounding box that differ, per family member. Every
+KEYFRAME_INTERVAL-th state is kept whole, as a SceneState (itself sharing
+the copies of unchanged mobjects), so rebuilding any state only has to
+replay the changes since the keyframe before it.
+
+A CheckpointStore holds the recorded states, keeping the arrays of those
+in memory within a byte budget. Past it, the least recently used states
+have their copies pickled, as Mobject.serialize does, into a spill file,
+which is memory-mapped to load them back when they're next restored.
+States can be discarded, e.g. those of checkpoints after an edit, and the
+spill file is rewritten once it's mostly their dead records.
+
+Alongside each state, a NamespaceSnapshot holds the variables of the code
+which played up to it, so that running on from a checkpoint only has to
+run the code after it.
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import mmap
+import pickle
+import tempfile
+import types
+from collections import OrderedDict
+
+import numpy as np
+
+from maniml.manimgl_core.mobject.mobject import Mobject
+from maniml.manimgl_core.scene.scene import SceneState
+from maniml.manimgl_core.utils.family_ops import extract_mobject_family_members
+from maniml.manimgl_core.utils.directories import get_temp_dir
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Union
+
+    from maniml.manimgl_core.scene.scene import Scene
+
+    CheckpointState = Union[SceneState, "SceneStateDelta"]
+
+
+# Number of states recorded in a row before one is stored whole, bounding
+# how many sets of changes restoring a state has to replay
+KEYFRAME_INTERVAL = 20
+
+# Bytes of arrays the states of a CheckpointStore can hold in memory
+DEFAULT_MEMORY_BUDGET = 512 * 2**20
+
+# Once the records of discarded states take up more than this many bytes,
+# and more than half, of a spill file, it's rewritten without them
+SPILL_COMPACTION_THRESHOLD = 16 * 2**20
+
+# Values of these types can't change, so keeping them by reference is as
+# good as keeping a copy
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, range, np.generic)
+
+# Attributes Mobject.become carries over which aren't part of the data or
+# uniforms, and are stored whole if they change
+BECOME_ATTRS = ("shader_folder", "texture_paths", "depth_test", "render_primitive")
+
+
+class SceneStateDelta(object):
+    """
+    The state of a scene stored as its changes from a previous state.
+    """
+    def __init__(
+        self,
+        state: SceneState,
+        previous: CheckpointState,
+        previous_state: SceneState,
+    ):
+        # previous_state is the SceneState which previous restores
+        self.time = state.time
+        self.num_plays = state.num_plays
+        self.previous = previous
+        self.depth = get_depth(previous) + 1
+        last_m2c = previous_state.mobjects_to_copies
+        mobjects = list(state.mobjects_to_copies)
+        # Most often the scene holds the same mobjects as before
+        self.mobjects = None if mobjects == list(last_m2c) else mobjects
+        # Maps each changed mobject either to a list of changes to its
+        # family, as given by get_family_changes, or to a whole new copy
+        self.changes: dict[Mobject, list | Mobject] = dict()
+        for mob, mob_copy in state.mobjects_to_copies.items():
+            last_copy = last_m2c.get(mob)
+            if last_copy is mob_copy:
+                continue
+            family_changes = None
+            if last_copy is not None:
+                family_changes = get_family_changes(last_copy, mob_copy)
+            if family_changes is None:
+                self.changes[mob] = mob_copy
+            elif family_changes:
+                self.changes[mob] = family_changes
+
+    def get_scene_state(self) -> SceneState:
+        """
+        Rebuild the full state, starting from the last keyframe and applying
+        each set of changes recorded since
+        """
+        deltas = []
+        keyframe = self
+        while isinstance(keyframe, SceneStateDelta):
+            deltas.append(keyframe)
+            keyframe = keyframe.previous
+
+        m2c = keyframe.mobjects_to_copies
+        # Copies made here, which can be changed in place by later deltas
+        # without touching those stored in the keyframe or deltas
+        own_copies: dict[int, Mobject] = dict()
+        for delta in reversed(deltas):
+            mobjects = m2c.keys() if delta.mobjects is None else delta.mobjects
+            new_m2c = OrderedDict()
+            for mob in mobjects:
+                change = delta.changes.get(mob)
+                if change is None:
+                    new_m2c[mob] = m2c[mob]
+                elif isinstance(change, Mobject):
+                    new_m2c[mob] = change
+                else:
+                    mob_copy = m2c[mob]
+                    if id(mob_copy) not in own_copies:
+                        mob_copy = mob_copy.copy()
+                        own_copies[id(mob_copy)] = mob_copy
+                    apply_family_changes(mob_copy, change)
+                    new_m2c[mob] = mob_copy
+            m2c = new_m2c
+
+        state = copy.copy(keyframe)
+        state.time = self.time
+        state.num_plays = self.num_plays
+        state.mobjects_to_copies = m2c
+        # The keyframe's versions don't describe the copies rebuilt here
+        state.content_versions = dict()
+        return state
+
+
+def get_depth(state: CheckpointState) -> int:
+    return state.depth if isinstance(state, SceneStateDelta) else 0
+
+
+def get_checkpoint_state(
+    state: SceneState,
+    previous: CheckpointState | None = None,
+    previous_state: SceneState | None = None,
+) -> CheckpointState:
+    """
+    What to store for state, recorded after previous, whose full state is
+    previous_state: the state itself if it's due to be a keyframe,
+    otherwise its changes from previous.
+    """
+    if previous is None or get_depth(previous) + 1 >= KEYFRAME_INTERVAL:
+        return state
+    return SceneStateDelta(state, previous, previous_state)
+
+
+class CheckpointStore(object):
+    """
+    Holds the states recorded at checkpoints, spilling the least recently
+    used to disk when those in memory hold more than memory_budget bytes
+    of arrays, and loading them back when they're restored.
+    """
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+        # States with their copies in memory, least recently used first
+        self.in_memory: OrderedDict[int, CheckpointState] = OrderedDict()
+        # States whose copies are only in the spill file
+        self.spilled: dict[int, CheckpointState] = dict()
+        # Where in the spill file each state's copies are, with the objects
+        # they refer to which aren't pickled along with them. States loaded
+        # back keep their place, so spilling them again needs no writing
+        self.spill_records: dict[int, tuple[int, int, list]] = dict()
+        # States whose copies couldn't be pickled, which stay in memory
+        self.unspillable: set[int] = set()
+        # Arrays held by each state in memory, as of when it was stored or
+        # loaded, and how many of those states hold each array, by id
+        self.state_arrays: dict[int, list[np.ndarray]] = dict()
+        self.array_counts: dict[int, int] = dict()
+        self.spill_file = None
+        self.spill_map = None
+        # Size of the spill file, and how much of it is records of states
+        # since discarded
+        self.spill_size = 0
+        self.dead_spill_size = 0
+
+    def record(
+        self,
+        state: SceneState,
+        previous: CheckpointState | None = None,
+        previous_state: SceneState | None = None,
+    ) -> CheckpointState:
+        """
+        Store state, recorded after previous, which restores to
+        previous_state, returning what's stored for it (see
+        get_checkpoint_state)
+        """
+        if previous is not None and previous_state is None:
+            previous_state = self.get_scene_state(previous)
+        recorded = get_checkpoint_state(state, previous, previous_state)
+        if recorded is state:
+            # Spilling a keyframe empties it, which mustn't happen to the
+            # state the caller has
+            recorded = copy.copy(state)
+        self.add_arrays(recorded)
+        self.in_memory[id(recorded)] = recorded
+        self.keep_within_budget(keep=[recorded])
+        return recorded
+
+    def get_scene_state(self, state: CheckpointState) -> SceneState:
+        """
+        The full SceneState which state restores to, loading whatever it's
+        stored as changes from back from disk if needed. States this store
+        didn't record are returned as they are.
+        """
+        chain = [state]
+        while isinstance(chain[-1], SceneStateDelta):
+            chain.append(chain[-1].previous)
+        for link in reversed(chain):
+            if id(link) in self.spilled:
+                self.load(link)
+            if id(link) in self.in_memory:
+                self.in_memory.move_to_end(id(link))
+        self.keep_within_budget(keep=chain)
+        if isinstance(state, SceneStateDelta):
+            return state.get_scene_state()
+        return copy.copy(state)
+
+    def keep_within_budget(self, keep: list[CheckpointState]) -> None:
+        keep_ids = set(map(id, keep))
+        for key in list(self.in_memory):
+            if self.memory_used <= self.memory_budget:
+                break
+            if key not in keep_ids and key not in self.unspillable:
+                self.spill(self.in_memory[key])
+
+    def spill(self, state: CheckpointState) -> None:
+        if id(state) not in self.spill_records:
+            try:
+                data, externals = dump_payload(get_payload(state))
+            except Exception:
+                self.unspillable.add(id(state))
+                return
+            if self.spill_file is None:
+                self.spill_file = open_spill_file()
+            offset = self.spill_file.seek(0, io.SEEK_END)
+            self.spill_file.write(data)
+            self.spill_file.flush()
+            self.spill_records[id(state)] = (offset, len(data), externals)
+            self.spill_size = offset + len(data)
+        self.remove_arrays(state)
+        set_payload(state, None)
+        del self.in_memory[id(state)]
+        self.spilled[id(state)] = state
+
+    def load(self, state: CheckpointState) -> None:
+        offset, length, externals = self.spill_records[id(state)]
+        if self.spill_map is None or len(self.spill_map) < offset + length:
+            # The file has grown since it was last mapped
+            if self.spill_map is not None:
+                self.spill_map.close()
+            self.spill_map = mmap.mmap(
+                self.spill_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        data = self.spill_map[offset:offset + length]
+        set_payload(state, load_payload(data, externals))
+        del self.spilled[id(state)]
+        self.in_memory[id(state)] = state
+        self.add_arrays(state)
+
+    def discard(self, state: CheckpointState) -> None:
+        """
+        Forget a recorded state, freeing its arrays and its record in the
+        spill file. States recorded after it may be stored as changes from
+        it, so they mustn't be restored afterwards either.
+        """
+        key = id(state)
+        if key in self.in_memory:
+            self.remove_arrays(state)
+            del self.in_memory[key]
+        self.spilled.pop(key, None)
+        self.unspillable.discard(key)
+        record = self.spill_records.pop(key, None)
+        if record is not None:
+            self.dead_spill_size += record[1]
+            if self.dead_spill_size > max(SPILL_COMPACTION_THRESHOLD, self.spill_size / 2):
+                self.compact_spill_file()
+
+    def compact_spill_file(self) -> None:
+        """
+        Rewrite the spill file with only the records of states still held
+        """
+        if self.spill_map is not None:
+            self.spill_map.close()
+            self.spill_map = None
+        old_file = self.spill_file
+        self.spill_file = None
+        self.spill_size = 0
+        self.dead_spill_size = 0
+        if self.spill_records:
+            self.spill_file = open_spill_file()
+            for key, (offset, length, externals) in self.spill_records.items():
+                old_file.seek(offset)
+                self.spill_records[key] = (self.spill_size, length, externals)
+                self.spill_file.write(old_file.read(length))
+                self.spill_size += length
+            self.spill_file.flush()
+        old_file.close()
+
+    def add_arrays(self, state: CheckpointState) -> None:
+        # Arrays shared between states only count towards the budget once
+        arrays = get_arrays(state)
+        self.state_arrays[id(state)] = arrays
+        for array in arrays:
+            if id(array) in self.array_counts:
+                self.array_counts[id(array)] += 1
+            else:
+                self.array_counts[id(array)] = 1
+                self.memory_used += array.nbytes
+
+    def remove_arrays(self, state: CheckpointState) -> None:
+        for array in self.state_arrays.pop(id(state)):
+            self.array_counts[id(array)] -= 1
+            if self.array_counts[id(array)] == 0:
+                del self.array_counts[id(array)]
+                self.memory_used -= array.nbytes
+
+    def close(self) -> None:
+        if self.spill_map is not None:
+            self.spill_map.close()
+            self.spill_map = None
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
+
+
+def open_spill_file():
+    return tempfile.TemporaryFile(prefix="maniml_checkpoints_", dir=get_temp_dir())
+
+
+class SpillPickler(pickle.Pickler):
+    """
+    Pickles the copies held by a state, leaving out any other mobjects,
+    e.g. those in the scene the copies are of, and functions, such as
+    updaters, which often can't be pickled. Those are instead referred to
+    by their place in externals.
+    """
+    def __init__(self, file, copies: list[Mobject]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.copy_ids = {id(sm) for mob in copies for sm in mob.get_family()}
+        self.externals: list = []
+        self.external_ids: dict[int, int] = dict()
+
+    def persistent_id(self, obj: Any) -> int | None:
+        if isinstance(obj, Mobject):
+            if id(obj) in self.copy_ids:
+                return None
+        elif not isinstance(obj, (types.FunctionType, types.MethodType)):
+            return None
+        return self.add_external(obj)
+
+    def add_external(self, obj: Any) -> int:
+        if id(obj) not in self.external_ids:
+            self.external_ids[id(obj)] = len(self.externals)
+            self.externals.append(obj)
+        return self.external_ids[id(obj)]
+
+
+class NamespacePickler(SpillPickler):
+    """
+    Pickles the values of a namespace, referring to every mobject, as well
+    as to functions, classes, modules, the scene and the objects with ids
+    in shared_ids, by their place in externals
+    """
+    def __init__(self, file, scene: Scene, shared_ids: set[int] = set()):
+        super().__init__(file, copies=[])
+        self.scene = scene
+        self.shared_ids = shared_ids
+
+    def persistent_id(self, obj: Any) -> int | None:
+        if obj is self.scene or id(obj) in self.shared_ids \
+                or isinstance(obj, (type, types.ModuleType)):
+            return self.add_external(obj)
+        return super().persistent_id(obj)
+
+
+class SpillUnpickler(pickle.Unpickler):
+    def __init__(self, file, externals: list):
+        super().__init__(file)
+        self.externals = externals
+
+    def persistent_load(self, pid: int) -> Any:
+        return self.externals[pid]
+
+
+def dump_payload(payload: dict) -> tuple[bytes, list]:
+    copies = [
+        value for value in payload.values()
+        if isinstance(value, Mobject)
+    ]
+    buffer = io.BytesIO()
+    pickler = SpillPickler(buffer, copies)
+    pickler.dump(payload)
+    return buffer.getvalue(), pickler.externals
+
+
+def load_payload(data: bytes, externals: list) -> dict:
+    return SpillUnpickler(io.BytesIO(data), externals).load()
+
+
+def dump_namespace(
+    namespace: dict[str, Any],
+    scene: Scene,
+    shared_ids: set[int] = set(),
+) -> tuple[bytes, list]:
+    buffer = io.BytesIO()
+    pickler = NamespacePickler(buffer, scene, shared_ids)
+    pickler.dump(namespace)
+    return buffer.getvalue(), pickler.externals
+
+
+def get_shared_ids(values: list[Any], mobjects: list[Mobject]) -> set[int]:
+    """
+    Ids of the objects which the functions and mobjects among values, and
+    the updaters of those mobjects and of mobjects, hold on to themselves:
+    the contents of closures and defaults, the objects methods are bound
+    to, and the mobjects' attributes. A pickled copy of one of these
+    wouldn't be what the function or mobject refers to once restored.
+    """
+    shared = set()
+    to_visit = []
+    for value in values:
+        if isinstance(value, Mobject):
+            shared.update(map(id, vars(value).values()))
+            to_visit.extend(value.updaters)
+        else:
+            to_visit.append(value)
+    for mob in mobjects:
+        to_visit.extend(mob.updaters)
+    visited = set()
+    while to_visit:
+        obj = to_visit.pop()
+        if id(obj) in visited:
+            continue
+        visited.add(id(obj))
+        if isinstance(obj, types.FunctionType):
+            held = [
+                *(obj.__defaults__ or ()),
+                *(obj.__kwdefaults__ or dict()).values(),
+            ]
+            for cell in obj.__closure__ or ():
+                try:
+                    held.append(cell.cell_contents)
+                except ValueError:
+                    # Empty cell
+                    pass
+            shared.update(map(id, held))
+            to_visit.extend(held)
+        elif isinstance(obj, types.MethodType):
+            shared.add(id(obj.__self__))
+            to_visit.append(obj.__func__)
+        elif isinstance(obj, types.BuiltinMethodType):
+            shared.add(id(obj.__self__))
+    return shared
+
+
+class NamespaceSnapshot(object):
+    """
+    The variables of the code which played the animation of a checkpoint,
+    as they were once it had played, so that running on from there needn't
+    re-run the code before it.
+
+    Values are pickled, leaving any mobjects they hold as references to the
+    live ones, which restoring the checkpoint's scene state puts back as
+    they were. Those which weren't in the scene have a copy kept to become
+    again. Values which can't be pickled, e.g. generators, are only kept by
+    reference, as are those which functions or mobjects also hold (see
+    get_shared_ids), so that they still share them once restored. Those
+    can have changed by the time the snapshot is restored, in which case
+    running on from it wouldn't match running the code before it again, so
+    such a snapshot is never resumable.
+    """
+    def __init__(
+        self,
+        namespace: dict[str, Any],
+        scene: Scene,
+        # Index of the top-level statement of construct the snapshot was
+        # taken in, -1 for before any of it, or None if not taken in it
+        statement: int | None = None,
+        # Whether the code after that statement can be run on from here,
+        # i.e. it's done once the animation it played has
+        resumable: bool = False,
+        # Snapshot whose copies to reuse for mobjects which haven't changed
+        previous: NamespaceSnapshot | None = None,
+    ):
+        self.statement = statement
+        self.resumable = resumable
+        self.references: dict[str, Any] = dict()
+        scene_family = extract_mobject_family_members(scene.mobjects)
+        shared_ids = get_shared_ids(list(namespace.values()), scene_family)
+        try:
+            self.data, self.externals = dump_namespace(namespace, scene, shared_ids)
+        except Exception:
+            picklable = dict()
+            for name, value in namespace.items():
+                try:
+                    dump_namespace({name: value}, scene, shared_ids)
+                    picklable[name] = value
+                except Exception:
+                    self.references[name] = value
+            self.data, self.externals = dump_namespace(picklable, scene, shared_ids)
+        if self.resumable:
+            self.resumable = all(map(is_immutable, self.references.values())) and all(
+                is_immutable(value) for value in self.externals
+                if value is not scene and not isinstance(value, (
+                    Mobject, type, types.ModuleType, types.FunctionType, types.MethodType
+                ))
+            )
+
+        in_scene = set(scene_family)
+        last_copies = previous.mobject_copies if previous else dict()
+        last_versions = previous.content_versions if previous else dict()
+        self.mobject_copies: dict[Mobject, Mobject] = dict()
+        self.content_versions: dict[Mobject, int] = dict()
+        for mob in self.externals:
+            if not isinstance(mob, Mobject) or mob in in_scene:
+                continue
+            if mob in last_copies and last_versions[mob] == mob._content_version:
+                self.mobject_copies[mob] = last_copies[mob]
+            else:
+                self.mobject_copies[mob] = mob.copy()
+            self.content_versions[mob] = mob._content_version
+
+    def restore(self) -> dict[str, Any]:
+        """
+        Put the mobjects outside the scene back as they were, and return
+        the variables of the namespace
+        """
+        for mob, mob_copy in self.mobject_copies.items():
+            mob.become(mob_copy)
+        namespace = SpillUnpickler(io.BytesIO(self.data), self.externals).load()
+        namespace.update(self.references)
+        return namespace
+
+
+def is_immutable(value: Any) -> bool:
+    if isinstance(value, (tuple, frozenset)):
+        return all(map(is_immutable, value))
+    return isinstance(value, IMMUTABLE_TYPES)
+
+
+def get_payload(state: CheckpointState) -> dict:
+    """
+    What a stored state holds which can be spilled to disk, keyed by
+    mobjects in the scene
+    """
+    if isinstance(state, SceneStateDelta):
+        return state.changes
+    return state.mobjects_to_copies
+
+
+def set_payload(state: CheckpointState, payload: dict | None) -> None:
+    if isinstance(state, SceneStateDelta):
+        state.changes = payload
+    else:
+        state.mobjects_to_copies = payload
+
+
+def get_arrays(state: CheckpointState) -> list[np.ndarray]:
+    """
+    Data arrays of the copies a stored state holds, and those holding the
+    data fields it changes
+    """
+    arrays = []
+    for value in get_payload(state).values():
+        if isinstance(value, Mobject):
+            arrays.extend(sm.data for sm in value.get_family())
+        else:
+            for index, fields, *_ in value:
+                arrays.extend(fields.values())
+    return arrays
+
+
+def get_family_layout(family: list[Mobject]) -> list[tuple[int, ...]]:
+    """
+    For each member of family, the positions in family of its submobjects
+    """
+    index = {id(mob): n for n, mob in enumerate(family)}
+    return [tuple(index[id(sm)] for sm in mob.submobjects) for mob in family]
+
+
+def uniforms_match(uniforms1: dict[str, Any], uniforms2: dict[str, Any]) -> bool:
+    return uniforms1.keys() == uniforms2.keys() and all(
+        np.array_equal(uniforms1[key], uniforms2[key])
+        for key in uniforms1
+    )
+
+
+def get_family_changes(old: Mobject, new: Mobject) -> list[tuple] | None:
+    """
+    For each member of new's family which differs from its counterpart in
+    old's family, a tuple of its position in the family, the data fields
+    which differ, its uniforms (or None if they match) and its bounding box.
+    Returns None if the families don't line up, with the same structure,
+    types and data sizes, so that new can't be rebuilt from old this way.
+    """
+    old_family = old.get_family()
+    new_family = new.get_family()
+    if len(old_family) != len(new_family):
+        return None
+    if get_family_layout(old_family) != get_family_layout(new_family):
+        return None
+
+    changes = []
+    for index, (sm1, sm2) in enumerate(zip(old_family, new_family)):
+        if type(sm1) is not type(sm2) \
+                or sm1.data.dtype != sm2.data.dtype \
+                or len(sm1.data) != len(sm2.data) \
+                or any(getattr(sm1, attr) != getattr(sm2, attr) for attr in BECOME_ATTRS):
+            return None
+        fields = dict()
+        if sm1.data is not sm2.data:
+            for name in sm2.data.dtype.names:
+                if not np.array_equal(sm1.data[name], sm2.data[name], equal_nan=True):
+                    fields[name] = sm2.data[name].copy()
+        uniforms = None
+        if not uniforms_match(sm1.uniforms, sm2.uniforms):
+            uniforms = {
+                key: value.copy() if isinstance(value, np.ndarray) else value
+                for key, value in sm2.uniforms.items()
+            }
+        bbox_changed = sm1._needs_new_bounding_box != sm2._needs_new_bounding_box \
+            or not np.array_equal(sm1.bounding_box, sm2.bounding_box)
+        if fields or uniforms is not None or bbox_changed:
+            changes.append((
+                index, fields, uniforms,
+                sm2.bounding_box.copy(), sm2._needs_new_bounding_box
+            ))
+    return changes
+
+
+def apply_family_changes(mobject: Mobject, changes: list[tuple]) -> None:
+    family = mobject.get_family()
+    for index, fields, uniforms, bounding_box, needs_new_bounding_box in changes:
+        sm = family[index]
+        if fields:
+            sm.unshare_data()
+            for name, values in fields.items():
+                sm.data[name] = values
+            sm.note_changed_data(recurse_up=False)
+        if uniforms is not None:
+            sm.uniforms = dict()
+            sm.set_uniforms(uniforms)
+        sm.bounding_box = bounding_box.copy()
+        sm._needs_new_bounding_box = needs_new_bounding_box
@@ -0,0 +1,91 @@
+"""
+Parallel headless rendering for the maniml CLI.
+
+A scene is split into contiguous ranges of play() calls. Each range is
+rendered by its own process, with its own standalone GL context, into
+per-animation partial movie files, and the pieces are then stitched
+together with ffmpeg's stream copy.
+"""
+
+import importlib.util
+import multiprocessing
+import os
+
+# Ranges handed out per worker process. More, smaller ranges balance
+# uneven animation lengths better, at the cost of each range having to
+# fast-forward (with animations skipped) through the plays before it.
+SEGMENTS_PER_PROCESS = 4
+
+
+def load_scene_class(script_file, scene_name):
+    """Import the user's script the same way the CLI does and fetch a Scene class."""
+    spec = importlib.util.spec_from_file_location("__main__", script_file)
+    module = importlib.util.module_from_spec(spec)
+    module.__name__ = "__main__"
+    spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def get_segments(n_plays, n_segments):
+    """Split play indices [0, n_plays) into n_segments contiguous (start, end) ranges."""
+    n_segments = max(1, min(n_segments, n_plays))
+    bounds = [(n_plays * i) // n_segments for i in range(n_segments + 1)]
+    return [
+        (start, end)
+        for start, end in zip(bounds[:-1], bounds[1:])
+        if end > start
+    ]
+
+
+def render_segment(script_file, scene_name, start, end, file_name):
+    """Worker entry point: render plays [start, end) as partial movie files."""
+    scene_class = load_scene_class(script_file, scene_name)
+    scene = scene_class(
+        start_at_animation_number=start,
+        end_at_animation_number=end,
+        file_writer_config=dict(
+            write_to_movie=True,
+            subdivide_output=True,
+            file_name=file_name,
+            quiet=True,
+        ),
+    )
+    scene._scene_filepath = os.path.abspath(script_file)
+    scene.run()
+
+
+def render_in_parallel(script_file, scene_name, scene_class, n_processes):
+    """
+    Render a scene across n_processes worker processes and stitch the
+    resulting partial movie files into a single movie.
+
+    Note that sounds added with Scene.add_sound are not carried over,
+    since each worker skips the plays outside its own range.
+    """
+    # Dry run with every animation skipped, just to count the plays
+    prerun = scene_class(
+        skip_animations=True,
+        file_writer_config=dict(
+            write_to_movie=False,
+            save_last_frame=False,
+            subdivide_output=True,
+        ),
+    )
+    prerun._scene_filepath = os.path.abspath(script_file)
+    prerun.run()
+    file_writer = prerun.file_writer
+    n_plays = prerun.num_plays
+    file_name = file_writer.get_output_file_name()
+
+    segments = get_segments(n_plays, n_processes * SEGMENTS_PER_PROCESS)
+    print(f"Rendering {n_plays} animations in {len(segments)} segments across {n_processes} processes")
+
+    # Spawn rather than fork, so no worker inherits this process's GL state
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(min(n_processes, len(segments))) as pool:
+        pool.starmap(render_segment, [
+            (script_file, scene_name, start, end, file_name)
+            for start, end in segments
+        ])
+
+    file_writer.combine_partial_movie_files(n_plays)
@@ -6,13 +6,16 @@ import maniml.manimgl_core
 from maniml.manimgl_core.scene.scene import Scene as GLScene
 from maniml.manimgl_core.scene.scene import ThreeDScene as GLThreeDScene
 from maniml.manimgl_core.scene.scene import SceneState as GLSceneState, EndScene
+from maniml.scene.checkpoint_store import CheckpointStore, DEFAULT_MEMORY_BUDGET
+from maniml.scene.checkpoint_store import NamespaceSnapshot
+from maniml.scene.auto_reload import CodeAnalyzer
+import ast
 import warnings
 import time
 import sys
 import inspect
 import pyperclip
 from pyglet.window import key as PygletWindowKeys
-import difflib
 import itertools as it
 import numpy as np
 import copy
@@ -95,6 +98,32 @@ ARROW_SYMBOLS = [
 
 ALL_MODIFIERS = PygletWindowKeys.MOD_CTRL | PygletWindowKeys.MOD_COMMAND | PygletWindowKeys.MOD_SHIFT
 
+# Methods which, called as a statement of construct of their own, leave
+# nothing of that statement to run once their animation has finished, so
+# that the code after it can be run on from its checkpoint. Assignments of
+# what they return aren't done by then, so they don't count
+RESUMABLE_CALLS = ("play", "wait")
+
+
+def is_resumable_statement(statement):
+    """Whether statement is a call to one of RESUMABLE_CALLS, and nothing more."""
+    return (
+        isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Call)
+        and isinstance(statement.value.func, ast.Attribute)
+        and statement.value.func.attr in RESUMABLE_CALLS
+    )
+
+
+def is_interactive_embed(statement):
+    """Whether statement is a call to self.interactive_embed()."""
+    return (
+        isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Call)
+        and isinstance(statement.value.func, ast.Attribute)
+        and statement.value.func.attr == 'interactive_embed'
+    )
+
 
 class Scene(GLScene):
     """
@@ -105,7 +134,8 @@ class Scene(GLScene):
     
     Checkpoint Navigation Implementation:
     - Uses IPython's InteractiveShellEmbed for persistent namespace execution
-    - Stores complete scene state at each checkpoint (before and after animation)
+    - Stores scene state at each checkpoint (before and after animation), as
+      the changes from the state recorded before it (see checkpoint_store)
     - Navigation works by:
       - Backward: Restore scene state from checkpoint
       - Forward: If checkpoint exists, restore it; otherwise execute next code
@@ -115,6 +145,9 @@ class Scene(GLScene):
     
     # Interaction settings
     scroll_sensitivity = 20  # From ManimGL's default
+    # Bytes of arrays checkpoint states can hold in memory, past which the
+    # least recently used are spilled to disk
+    checkpoint_memory_budget = DEFAULT_MEMORY_BUDGET
     drag_to_pan = False  # Disable by default, use Cmd/Ctrl + drag instead
     
     # InteractiveScene configuration
@@ -153,6 +186,9 @@ class Scene(GLScene):
         self.checkpoints = []
         self.current_checkpoint = -1
         self.tight = True  # True if we can execute directly, False if we need to reexecute
+        self.checkpoint_store = CheckpointStore(self.checkpoint_memory_budget)
+        # Last state recorded for a checkpoint, with the full SceneState it stores
+        self._last_checkpoint_state = (None, None)
         
         # Legacy checkpoint support (will be phased out)
         self.checkpoint_states = {}  # key -> SceneState
@@ -177,6 +213,11 @@ class Scene(GLScene):
         # Animation control for checkpoint navigation
         self._animations_to_play = 1  # How many animations to play
         self._animations_played = 0   # How many have been played so far
+        # Code from construct being run other than by construct itself,
+        # e.g. statements run on from a checkpoint
+        self._statement_code = None
+        # CodeAnalyzer of the scene file as last loaded
+        self._code_analyzer = None
         
         # InteractiveScene attributes
         self.selection = Group()
@@ -207,8 +248,14 @@ class Scene(GLScene):
         
         # Initialize IPython shell for code execution
         self.shell = None
-        self._initialize_ipython_shell()
-        
+        if self.window is not None:
+            self._initialize_ipython_shell()
+        else:
+            # Headless render: there is no navigation or reloading to drive,
+            # so play every animation straight through
+            self.auto_reload_enabled = False
+            self._animations_to_play = float('inf')
+
         # Enable auto-reload if requested
         if self.auto_reload_enabled:
             self.setup_auto_reload()
@@ -489,15 +536,35 @@ class Scene(GLScene):
         # Create initial blank checkpoint
         # For checkpoint 0, start and end state are the same (blank scene)
         # Use line 0 to indicate no lines should be executed before checkpoint 0
-        blank_state = self.get_state()
-        self.checkpoints = [(0, 0, blank_state, blank_state, {}, None)]
+        self.checkpoint_store.close()
+        self.checkpoint_store = CheckpointStore(self.checkpoint_memory_budget)
+        self._last_checkpoint_state = (None, None)
+        blank_state = self.record_checkpoint_state()
+        blank_namespace = NamespaceSnapshot(dict(), self, statement=-1, resumable=True)
+        self.checkpoints = [(0, 0, blank_state, blank_state, blank_namespace, None)]
         self.current_checkpoint = 0
         self.tight = True
         
         # Also update legacy system for compatibility
-        self.animation_checkpoints = [(0, 0, blank_state, {}, None)]
+        self.animation_checkpoints = [(0, 0, blank_state, blank_namespace, None)]
         self.current_animation_index = 0
     
+    def truncate_checkpoints(self, count):
+        """Keep only the first count checkpoints, discarding the states of the rest."""
+        kept = {id(state) for checkpoint in self.checkpoints[:count] for state in checkpoint[2:4]}
+        discarded = [
+            state
+            for checkpoint in self.checkpoints[count:]
+            for state in checkpoint[2:4]
+            if id(state) not in kept
+        ]
+        for state in discarded:
+            self.checkpoint_store.discard(state)
+        if any(state is self._last_checkpoint_state[0] for state in discarded):
+            self._last_checkpoint_state = (None, None)
+        self.checkpoints = self.checkpoints[:count]
+        self.animation_checkpoints = self.animation_checkpoints[:count]
+    
     def run_next_code(self):
         """Execute code to play the next animation."""
         if not hasattr(self, '_scene_filepath') or not self._scene_filepath:
@@ -505,6 +572,15 @@ class Scene(GLScene):
         
         # After reexecute(), the scene is at the current checkpoint state
         # We just need to play ONE more animation
+        statements = self.get_statements_after_checkpoint(self.current_checkpoint)
+        if statements is not None:
+            # Only the code after the checkpoint needs running
+            self._animations_to_play = 1
+            self._animations_played = 0
+            played_new = self.run_construct_statements(statements)
+            self._animations_played = 0
+            return played_new
+        
         # Set counters to skip animations we've already seen
         self._animations_to_play = self.current_checkpoint + 2  # Skip first N, play the (N+1)th
         self._animations_played = self.current_checkpoint + 1  # Start counting from where we are
@@ -563,32 +639,47 @@ class Scene(GLScene):
             return False
     
     def _execute_code(self, code, namespace):
-        """Helper to execute code using IPython or exec."""
-        # Inject line tracking before execution
-        tracked_code = self._inject_line_tracking(code)
+        """Helper to execute code from construct in the IPython or exec namespace."""
+        # Find the starting line number from the original file
+        if hasattr(self, '_construct_start_line'):
+            base_line = self._construct_start_line
+        else:
+            base_line = self._find_construct_start_line()
+        
+        # Give the code its line numbers in the file, so that checkpoints
+        # recorded while running it know which statement they're in
+        tree = ast.parse(code)
+        ast.increment_lineno(tree, base_line - 1)
+        compiled = compile(tree, self._scene_filepath, 'exec')
         
-        # Use IPython shell if available, otherwise fall back to exec
+        # Use the IPython shell's namespace if available
         if self.shell is not None:
             # Update the shell's namespace with the provided namespace
             self.shell.user_module.__dict__.update(namespace)
-            
-            # Execute using IPython's run_cell with tracked code
-            result = self.shell.run_cell(tracked_code, silent=True, store_history=False)
-            
-            # Check for errors
-            if result.error_in_exec:
-                print(f"Error in run_cell: {result.error_in_exec}")
-                raise result.error_in_exec
-        else:
-            # Fallback to exec if IPython is not available
-            compiled = compile(tracked_code, self._scene_filepath, 'exec')
+            namespace = self.shell.user_module.__dict__
+        
+        self._statement_code = compiled
+        try:
             exec(compiled, namespace)
+        finally:
+            self._statement_code = None
     
     def reexecute(self):
-        """Re-run all code up to current checkpoint by playing N animations."""
+        """
+        Bring the scene and namespace up to the current checkpoint, restoring
+        them from its snapshot where that can be run on from, and otherwise
+        re-running all code up to it by playing N animations.
+        """
         if not hasattr(self, '_scene_filepath') or not self._scene_filepath:
             return None
         
+        if self.get_statements_after_checkpoint(self.current_checkpoint) is not None:
+            checkpoint = self.checkpoints[self.current_checkpoint]
+            self.restore_state(checkpoint[3])
+            self.restore_namespace(checkpoint[4])
+            self.tight = True
+            return
+        
         # Clear the scene to ensure clean slate
         self.clear()
         
@@ -631,89 +722,102 @@ class Scene(GLScene):
     
     
     
-    def _inject_line_tracking(self, code):
-        """Inject line tracking statements before each code line."""
-        # If code is empty, return as is
-        if not code.strip():
-            return code
-        
+    def get_code_namespace(self):
+        """Namespace code from the scene file is run in."""
+        if self.shell is not None:
+            return self.shell.user_module.__dict__
+        return self.code_namespace
+    
+    def restore_namespace(self, snapshot):
+        """Reset the code namespace to the variables held by snapshot."""
+        namespace = self.get_code_namespace()
+        namespace.clear()
+        namespace['self'] = self
+        exec("from maniml import *", namespace)
+        namespace.update(snapshot.restore())
+    
+    def get_code_analyzer(self):
+        """
+        CodeAnalyzer of construct in the scene file as last loaded (or
+        edited), or None if there's no scene file.
+        """
+        if self._code_analyzer is None and self._scene_filepath:
+            content = getattr(self, '_updated_content', None) or self._original_content
+            if not content:
+                try:
+                    with open(self._scene_filepath, 'r') as f:
+                        content = f.readlines()
+                except OSError:
+                    return None
+            self._code_analyzer = CodeAnalyzer()
+            self._code_analyzer.analyze_construct(''.join(content), type(self).__name__)
+        return self._code_analyzer
+    
+    def get_construct_statement(self, frame):
+        """
+        Index of the top-level statement of construct which frame is in, or
+        which called the helper it's in, or None if it isn't running
+        construct. Also returns whether the code after that statement can be
+        run on from once frame is done with what it's calling, i.e. it's the
+        statement's own frame, and that statement is just the call (see
+        RESUMABLE_CALLS).
+        """
+        analyzer = self.get_code_analyzer()
+        caller = frame
+        while frame is not None and analyzer is not None:
+            code = frame.f_code
+            if code is self._statement_code or (
+                code.co_name == 'construct' and code.co_filename == self._scene_filepath
+            ):
+                index = analyzer.get_statement_index(frame.f_lineno)
+                if index is None:
+                    return None, False
+                resumable = frame is caller and is_resumable_statement(
+                    analyzer.statement_nodes[index]
+                )
+                return index, resumable
+            frame = frame.f_back
+        return None, False
+    
+    def get_statements_after_checkpoint(self, index):
+        """
+        Statements of construct to run on from checkpoint index, restored
+        from its namespace snapshot, or None if that can't be done, e.g.
+        for an animation played within a loop or helper method.
+        """
+        if not 0 <= index < len(self.checkpoints):
+            return None
+        snapshot = self.checkpoints[index][4]
+        analyzer = self.get_code_analyzer()
+        if not snapshot.resumable or analyzer is None or not analyzer.statements:
+            return None
+        return analyzer.statement_nodes[snapshot.statement + 1:]
+    
+    def run_construct_statements(self, statements):
+        """
+        Run statements of construct one at a time in the code namespace,
+        until self._animations_to_play animations have played. Returns
+        whether any did.
+        """
+        namespace = self.get_code_namespace()
         try:
-            # Find the starting line number from the original file
-            if hasattr(self, '_construct_start_line'):
-                base_line = self._construct_start_line
-            else:
-                # Try to find construct method start line
-                base_line = self._find_construct_start_line()
-            
-            # Simple line-by-line injection approach
-            lines = code.split('\n')
-            tracked_lines = []
-            
-            for i, line in enumerate(lines):
-                # Skip empty lines and comments
-                stripped = line.strip()
-                if not stripped or stripped.startswith('#'):
-                    tracked_lines.append(line)
+            for statement in statements:
+                if self._animations_played >= self._animations_to_play:
+                    break
+                if is_interactive_embed(statement):
                     continue
-                
-                # Calculate actual line number in the original file
-                actual_line = base_line + i
-                
-                # Get indentation of current line
-                indent = len(line) - len(line.lstrip())
-                indent_str = ' ' * indent
-                
-                # Check if this line might contain a play() call
-                # We inject tracking before lines that could have play()
-                # Avoid false positives on print statements
-                if any(keyword in line for keyword in ['self.play(', 'self.wait(']):
-                    # Add line tracking before this line
-                    tracked_lines.append(f"{indent_str}self._current_line_in_file = {actual_line}")
-                    tracked_lines.append(line)
-                    # Check if this is a multi-line statement
-                    if line.rstrip().endswith('('):
-                        # This starts a multi-line statement
-                        # We'll track the end when we see the closing parenthesis
-                        pass
-                    else:
-                        # Single line statement - track the line after
-                        tracked_lines.append(f"{indent_str}self._current_line_in_file = {actual_line + 1}")
-                elif i > 0 and ')' in line:
-                    # This might be the end of a multi-line play() call
-                    # Check if we're in a multi-line play context
-                    # Look back to find if there's an open play() call
-                    in_play_call = False
-                    open_parens = 0
-                    for j in range(i-1, max(0, i-10), -1):
-                        if 'self.play(' in lines[j]:
-                            in_play_call = True
-                            break
-                        # Count parentheses to ensure we're still in the same call
-                        open_parens += lines[j].count('(') - lines[j].count(')')
-                        if open_parens < 0:
-                            break
-                    
-                    if in_play_call and line.strip() == ')':
-                        # This is the closing parenthesis of a play() call
-                        tracked_lines.append(line)
-                        # Add tracking after the closing parenthesis with the correct line number
-                        # The actual line in the file is base_line + i (current line in extracted code)
-                        tracked_lines.append(f"{indent_str}self._current_line_in_file = {actual_line + 1}")
-                    else:
-                        tracked_lines.append(line)
-                else:
-                    tracked_lines.append(line)
-            
-            tracked_code = '\n'.join(tracked_lines)
-            
-            return tracked_code
-            
+                module = ast.Module(body=[statement], type_ignores=[])
+                self._statement_code = compile(module, self._scene_filepath, 'exec')
+                exec(self._statement_code, namespace)
+        except EndScene:
+            raise
         except Exception as e:
-            print(f"[DEBUG] Failed to inject line tracking: {e}")
+            print(f"Error in run_construct_statements: {e}")
             import traceback
             traceback.print_exc()
-            # If injection fails, return original code
-            return code
+        finally:
+            self._statement_code = None
+        return self._animations_played > 0
     
     def _find_construct_start_line(self):
         """Find the line number where construct method starts."""
@@ -774,6 +878,9 @@ class Scene(GLScene):
                         dedented = line[base_indent:] if len(line) > base_indent else line
                     
                     code_lines.append(dedented)
+                else:
+                    # Keep its place, so later lines keep their numbers
+                    code_lines.append('\n')
         
         return ''.join(code_lines)
     
@@ -881,8 +988,21 @@ class Scene(GLScene):
             prev_checkpoint = self.checkpoints[n - 2]
             self.restore_state(prev_checkpoint[3])  # end_state
             
+            # Run on from the namespace snapshot if it allows, so that only
+            # the code after the checkpoint is run
+            statements = self.get_statements_after_checkpoint(n - 2)
+            if statements is not None:
+                self.restore_namespace(prev_checkpoint[4])
+                self._animations_to_play = 1
+                self._animations_played = 0
+                played = self.run_construct_statements(statements)
+                if played:
+                    self.current_checkpoint = n - 1
+                self._animations_played = 0
+                return played
+            
             # Also restore the namespace from that checkpoint
-            stored_locals = prev_checkpoint[4]  # caller_locals
+            stored_locals = prev_checkpoint[4].restore()
             if stored_locals and self.shell is not None:
                 # Update namespace with stored variables
                 self.shell.user_module.__dict__.update(stored_locals)
@@ -949,9 +1069,8 @@ class Scene(GLScene):
         
         # Add stored locals from current checkpoint
         if 0 <= self.current_checkpoint < len(self.checkpoints):
-            stored_locals = self.checkpoints[self.current_checkpoint][4]  # locals are now at index 4
-            if stored_locals:
-                namespace.update(stored_locals)
+            stored_namespace = self.checkpoints[self.current_checkpoint][4]  # locals are now at index 4
+            namespace.update(stored_namespace.restore())
         
         return namespace
     
@@ -1395,7 +1514,7 @@ class Scene(GLScene):
         
         # Delete all checkpoints after this index
         if restore_checkpoint_index >= 0:
-            self.animation_checkpoints = self.animation_checkpoints[:restore_checkpoint_index + 1]
+            self.truncate_checkpoints(restore_checkpoint_index + 1)
             # Restore to this checkpoint's state
             checkpoint = self.animation_checkpoints[restore_checkpoint_index]
             self.restore_state(checkpoint[2])
@@ -1474,18 +1593,25 @@ class Scene(GLScene):
         with open(self._scene_filepath, 'r') as f:
             new_content = f.readlines()
         
-        # Find changed line ranges
-        changes = self._find_changed_line_ranges(self._original_content, new_content)
-        if not changes:
+        # Find the changed statements of construct
+        analyzer = CodeAnalyzer()
+        analyzer.analyze_construct(''.join(new_content), type(self).__name__)
+        changes = self.get_code_analyzer().find_changed_statements(analyzer)
+        # Edits to formatting or comments alone can still move statements
+        self._updated_content = new_content
+        self._code_analyzer = analyzer
+        if changes is None:
             print("No changes detected")
             return
         
-        smallest_edit = min(start for start, end in changes)
+        first_changed, last_changed = changes
         
-        # Find last unedited checkpoint
+        # Find the last checkpoint with none of the statements up to its
+        # own changed
         last_safe_checkpoint = -1
         for i in range(len(self.checkpoints) - 1, -1, -1):
-            if self.checkpoints[i][1] < smallest_edit:  # line_number is still at index 1
+            statement = self.checkpoints[i][4].statement
+            if statement is not None and statement < first_changed:
                 last_safe_checkpoint = i
                 break
         
@@ -1497,31 +1623,27 @@ class Scene(GLScene):
         
         # Truncate checkpoints after the safe point
         if last_safe_checkpoint >= 0:
-            self.checkpoints = self.checkpoints[:last_safe_checkpoint + 1]
-            self.animation_checkpoints = self.animation_checkpoints[:last_safe_checkpoint + 1]
+            self.truncate_checkpoints(last_safe_checkpoint + 1)
             # Restore to safe checkpoint
             self.jump_to(last_safe_checkpoint)
         else:
-            # No safe checkpoint, clear everything
+            # No safe checkpoint, clear everything (start replaces the
+            # checkpoint store, so there's nothing to discard)
             self.checkpoints = []
             self.animation_checkpoints = []
             self.clear()
             self.start()  # Reinitialize with blank checkpoint
         
-        # Store updated content
-        self._updated_content = new_content
-        
         # Re-execute if needed
         if last_safe_checkpoint >= 0:
             self.reexecute()
         
-        # Run animations until past the edited region
-        largest_edit = max(end for start, end in changes)
+        # Run animations until past the edited statements
         while True:
             # Check current position
             if self.current_checkpoint >= 0 and self.current_checkpoint < len(self.checkpoints):
-                current_line = self.checkpoints[self.current_checkpoint][1]
-                if current_line > largest_edit:
+                statement = self.checkpoints[self.current_checkpoint][4].statement
+                if statement is not None and statement > last_changed:
                     break
             
             # Run next animation
@@ -1572,59 +1694,6 @@ class Scene(GLScene):
         
         return None
     
-    def _find_changed_line_ranges(self, old_content, new_content):
-        """Find all line ranges that changed using proper diff algorithm."""
-        import difflib
-        
-        # Use difflib to get a proper diff
-        differ = difflib.SequenceMatcher(None, old_content, new_content)
-        changed_ranges = []
-        
-        # Get the opcodes which tell us what changed
-        for tag, i1, i2, j1, j2 in differ.get_opcodes():
-            if tag == 'equal':
-                # Lines are the same, skip
-                continue
-            elif tag == 'replace':
-                # Lines were replaced - these are actual content changes
-                # Use the line numbers from the NEW content
-                start = j1 + 1  # Convert to 1-based
-                end = j2  # j2 is exclusive, so it's already correct
-                changed_ranges.append((start, end))
-            elif tag == 'insert':
-                # Lines were inserted
-                # The inserted lines themselves are "changed"
-                start = j1 + 1
-                end = j2
-                changed_ranges.append((start, end))
-            elif tag == 'delete':
-                # Lines were deleted
-                # We need to handle this carefully - the deletion point matters
-                # Use the line number where deletion occurred in the new content
-                deletion_point = j1 + 1
-                # For deletions, we often want to re-run the animation at that line
-                # if it exists (e.g., if we deleted a wait() between animations)
-                if deletion_point <= len(new_content):
-                    changed_ranges.append((deletion_point, deletion_point))
-        
-        # Merge overlapping or adjacent ranges
-        if changed_ranges:
-            merged = []
-            current_start, current_end = changed_ranges[0]
-            
-            for start, end in changed_ranges[1:]:
-                if start <= current_end + 1:  # Adjacent or overlapping
-                    current_end = max(current_end, end)
-                else:
-                    merged.append((current_start, current_end))
-                    current_start, current_end = start, end
-            
-            merged.append((current_start, current_end))
-            changed_ranges = merged
-        
-        return changed_ranges
-    
-    
     def _extract_construct_body(self, content):
         """Extract the body of the construct method as executable code."""
         in_construct = False
@@ -1864,7 +1933,7 @@ class Scene(GLScene):
         # Get the line number after which to start executing
         if self.animation_checkpoints:
             start_after_line = self.animation_checkpoints[-1][1]
-            stored_locals = self.animation_checkpoints[-1][3]
+            stored_locals = self.animation_checkpoints[-1][3].restore()
             current_checkpoint_index = len(self.animation_checkpoints) - 1
         else:
             start_after_line = 0
@@ -1970,11 +2039,11 @@ class Scene(GLScene):
     def play(self, *animations, **kwargs):
         """Play animations with checkpoint support.
         
-        Checkpoint structure: (index, line_no, state, caller_locals, animation_info)
+        Checkpoint structure: (index, line_no, state, namespace, animation_info)
         - index: Animation index
         - line_no: Line number where play() was called
-        - state: SceneState object with mobject copies
-        - caller_locals: Dict of local variables (deepcopied when possible)
+        - state: SceneState, or SceneStateDelta of its changes from the previous one
+        - namespace: NamespaceSnapshot of the caller's local variables
         - animation_info: Dict with animation details for replay
         """
         # Skip animations if we're in skip mode OR if we're doing animation counting
@@ -2011,9 +2080,11 @@ class Scene(GLScene):
             return animations[0] if animations else None
         
         is_navigating = hasattr(self, '_navigating_animations') and self._navigating_animations
+        # Checkpoints only serve arrow-key navigation, which needs a window
+        record_checkpoint = not is_navigating and self.window is not None
         
         # If this is the very first animation, print navigation tip
-        if self.current_animation_index == -1 and not is_navigating:
+        if self.current_animation_index == -1 and record_checkpoint:
             print("\n[Navigation] Use arrow keys to control animations:")
             print("  → Play next animation")
             print("  ↓ Jump to next animation")
@@ -2021,15 +2092,21 @@ class Scene(GLScene):
             print("  ↑ Jump to previous animation")
         
         # Capture the animation info BEFORE playing
-        if not is_navigating:
+        if record_checkpoint:
             # Store the local variables from the calling frame
             # DON'T copy mobjects here - we want to maintain references to the originals
             # The scene state will handle copying for restoration
             frame = inspect.currentframe().f_back
+            maniml_names = vars(maniml)
             caller_locals = {}
             for name, obj in frame.f_locals.items():
-                if not name.startswith('_') and name != 'self':
-                    caller_locals[name] = obj
+                if name.startswith('_') or name == 'self':
+                    continue
+                # Names from "from maniml import *" are imported again when
+                # the namespace is restored, so needn't be snapshotted
+                if name in maniml_names and maniml_names[name] is obj:
+                    continue
+                caller_locals[name] = obj
             
             # Convert any _AnimationBuilder objects to actual animations
             from maniml.manimgl_core.mobject.mobject import _AnimationBuilder
@@ -2051,27 +2128,21 @@ class Scene(GLScene):
             }
         
         # Capture start state BEFORE playing animation
-        if not is_navigating:
-            start_state = self.get_state()
+        if record_checkpoint:
+            start_state = self.record_checkpoint_state(
+                self.checkpoints[-1][3] if self.checkpoints else None
+            )
             
             # Get the actual line number from the calling frame
+            # (code run from the scene file keeps its line numbers)
             frame = inspect.currentframe().f_back
             line_no = frame.f_lineno
-            
-            # Try to get the real line number from IPython's context
-            # IPython stores the original line number mapping
-            if hasattr(self, '_current_line_in_file'):
-                line_no = self._current_line_in_file
-            
-            # For multi-line play() calls, we need to find where the statement ends
-            # We'll store the start line and use a heuristic to find the end
-            play_start_line = line_no
         
         # Always play the animation normally
         result = super().play(*animations, **kwargs)
         
         # Only save checkpoints if we're NOT navigating with arrow keys
-        if not is_navigating:
+        if record_checkpoint:
             # Get the line number AFTER play completes
             # We need to look at the calling frame to get the actual line in the user's code
             frame = inspect.currentframe()
@@ -2091,15 +2162,19 @@ class Scene(GLScene):
                 # Fallback
                 line_no_after = line_no
             
-            # Debug: Show which line we're recording for this checkpoint
-            if hasattr(self, '_current_line_in_file'):
-                print(f"[Checkpoint {self.current_checkpoint + 1}] Animation at line {self._current_line_in_file}")
-            
             # Always create a new checkpoint when playing forward
             # Never replay existing checkpoints
             self.current_animation_index += 1
             self.current_checkpoint += 1
-            end_state = self.get_state()
+            end_state = self.record_checkpoint_state(start_state)
+            last_namespace = self.checkpoints[-1][4] if self.checkpoints else None
+            statement, resumable = self.get_construct_statement(inspect.currentframe().f_back)
+            namespace = NamespaceSnapshot(
+                caller_locals, self,
+                statement=statement,
+                resumable=resumable,
+                previous=last_namespace,
+            )
             
             # Store in new system with both start and end states
             self.checkpoints.append((
@@ -2107,7 +2182,7 @@ class Scene(GLScene):
                 line_no_after,  # Store line number after play completes
                 start_state,    # State before animation
                 end_state,      # State after animation
-                caller_locals,
+                namespace,
                 animation_info
             ))
             
@@ -2116,17 +2191,9 @@ class Scene(GLScene):
                 self.current_animation_index, 
                 line_no_after,  # Store line number after play completes
                 end_state,      # Legacy system only stores end state
-                caller_locals,
+                namespace,
                 animation_info if animation_info else None
             ))
-            
-            # Keep only last 50 checkpoints to avoid memory issues
-            if len(self.checkpoints) > 50:
-                self.checkpoints.pop(0)
-                self.animation_checkpoints.pop(0)
-                # Adjust indices
-                self.current_checkpoint = min(self.current_checkpoint, len(self.checkpoints) - 1)
-                self.current_animation_index = min(self.current_animation_index, len(self.animation_checkpoints) - 1)
         
         return result
     
@@ -2278,9 +2345,7 @@ class Scene(GLScene):
                 if current_checkpoint >= 0 and current_checkpoint < len(self.animation_checkpoints):
                     checkpoint = self.animation_checkpoints[current_checkpoint]
                     if len(checkpoint) > 3:
-                        stored_locals = checkpoint[3]
-                        for name, obj in stored_locals.items():
-                            namespace[name] = obj
+                        namespace.update(checkpoint[3].restore())
             else:
                 # In edit mode, we need to execute code up to the checkpoint to define variables
                 # but WITHOUT playing animations
@@ -2892,14 +2957,31 @@ class Scene(GLScene):
 
     # Override get_state to ignore interactive elements
     
-    def get_state(self):
+    def get_state(self, last_state=None):
         return GLSceneState(self, ignore=[
             self.selection_highlight,
             self.selection_rectangle,
             self.crosshair,
-        ])
+        ], last_state=last_state)
+
+    def record_checkpoint_state(self, previous=None):
+        """
+        State of the scene to store in a checkpoint recorded after previous,
+        kept as its changes from previous (see checkpoint_store).
+        """
+        last_recorded, last_state = self._last_checkpoint_state
+        if previous is not last_recorded:
+            last_state = None
+            if previous is not None:
+                last_state = self.checkpoint_store.get_scene_state(previous)
+        state = self.get_state(last_state=last_state)
+        recorded = self.checkpoint_store.record(state, previous, last_state)
+        self._last_checkpoint_state = (recorded, state)
+        return recorded
 
     def restore_state(self, scene_state):
+        # Checkpoint states may be stored as changes, or spilled to disk
+        scene_state = self.checkpoint_store.get_scene_state(scene_state)
         # Special handling for checkpoint 0 (blank state)
         # When restoring to the initial blank checkpoint, ensure we clear all mobjects
         if self.current_animation_index == 0 or (hasattr(self, '_restoring_to_zero') and self._restoring_to_zero):
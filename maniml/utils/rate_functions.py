@@ -5,25 +5,30 @@ Rate functions - re-export from GL.
 from maniml.manimgl_core.utils.rate_functions import *
 
 # CE has some additional rate functions we can define
+@elementwise
 def ease_in_sine(t):
     """CE compatibility."""
     import numpy as np
     return 1 - np.cos((t * np.pi) / 2)
 
+@elementwise
 def ease_out_sine(t):
     """CE compatibility."""
     import numpy as np
     return np.sin((t * np.pi) / 2)
 
+@elementwise
 def ease_in_out_sine(t):
     """CE compatibility."""
     import numpy as np
     return -(np.cos(np.pi * t) - 1) / 2
 
+@elementwise
 def ease_in_quad(t):
     """CE compatibility."""
     return t * t
 
+@elementwise
 def ease_out_quad(t):
     """CE compatibility."""
     return 1 - (1 - t) * (1 - t)
@@ -32,10 +37,12 @@ def ease_in_out_quad(t):
     """CE compatibility."""
     return 2 * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 2) / 2
 
+@elementwise
 def ease_in_cubic(t):
     """CE compatibility."""
     return t * t * t
 
+@elementwise
 def ease_out_cubic(t):
     """CE compatibility."""
     return 1 - pow(1 - t, 3)
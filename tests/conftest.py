@@ -0,0 +1,5 @@
+import sys
+
+# maniml reads its configuration from the command line when imported, so
+# present it with the one a headless render would have rather than pytest's
+sys.argv = [sys.argv[0], "--render"]
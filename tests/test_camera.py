@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.camera.camera import Camera
+from maniml.manimgl_core.mobject.geometry import Square
+
+
+def reference_pixel_array(camera):
+    # get_pixel_array as it was before it could read into a buffer
+    raw = camera.get_raw_fbo_data(dtype='f4')
+    flat_arr = np.frombuffer(raw, dtype='f4')
+    arr = flat_arr.reshape([*reversed(camera.draw_fbo.size), camera.n_channels])
+    arr = arr[::-1]
+    return (camera.rgb_max_val * arr).astype(camera.pixel_array_dtype)
+
+
+@pytest.fixture(params=[np.uint8, np.uint16])
+def camera(request):
+    camera = Camera(resolution=(64, 48), pixel_array_dtype=request.param)
+    # Off center, so that flipping the rows would show
+    camera.capture(Square(side_length=3).set_fill(opacity=0.7).shift(2 * np.array([1, 1, 0])))
+    return camera
+
+
+def test_pixel_array_matches_reference(camera):
+    expected = reference_pixel_array(camera)
+    assert expected.any()
+    result = camera.get_pixel_array()
+    assert result.dtype == camera.pixel_array_dtype
+    assert np.array_equal(result, expected)
+
+
+def test_pixel_array_reads_into_out(camera):
+    expected = reference_pixel_array(camera)
+    buffer = camera.get_pixel_array_buffer()
+    result = camera.get_pixel_array(out=buffer)
+    assert np.shares_memory(result, buffer)
+    assert np.array_equal(result, expected)
+    # Reading again into the same buffer gives the same frame
+    assert np.array_equal(camera.get_pixel_array(out=buffer), expected)
+
+
+def test_pixel_array_rejects_mismatched_out(camera):
+    shape = camera.get_pixel_array_shape()
+    for bad_out in [
+        np.empty(shape, dtype=np.float32),
+        np.empty((shape[0] + 1, *shape[1:]), dtype=camera.pixel_array_dtype),
+        np.empty(shape[::-1], dtype=camera.pixel_array_dtype).T,
+    ]:
+        with pytest.raises(ValueError):
+            camera.get_pixel_array(out=bad_out)
@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.mobject.geometry import Circle
+from maniml.manimgl_core.mobject.geometry import Square
+from maniml.manimgl_core.mobject.mobject import Group
+from maniml.manimgl_core.scene.scene import SceneState
+import maniml.scene.checkpoint_store as checkpoint_store
+from maniml.scene.checkpoint_store import CheckpointStore
+from maniml.scene.checkpoint_store import SceneStateDelta
+from maniml.scene.checkpoint_store import get_checkpoint_state
+
+
+def get_scene():
+    # All SceneState reads from a scene
+    circle = Circle().set_fill(opacity=0.5)
+    group = Group(Square(), Square().shift(2 * np.array([1, 0, 0])))
+    return SimpleNamespace(time=0, num_plays=0, mobjects=[circle, group], undo_stack=[])
+
+
+def advance(scene, n):
+    circle, group = scene.mobjects[:2]
+    scene.time = n
+    scene.num_plays = n
+    circle.shift(0.1 * np.array([1, 1, 0]))
+    if n % 3 == 0:
+        group[1].set_color("#FF0000")
+        group[1].rotate(0.2)
+    if n % 7 == 0:
+        scene.mobjects.append(Circle(radius=0.1 * n))
+    if n % 11 == 0:
+        scene.mobjects.pop()
+
+
+def assert_states_match(state, expected):
+    assert state.time == expected.time
+    assert state.num_plays == expected.num_plays
+    assert list(state.mobjects_to_copies) == list(expected.mobjects_to_copies)
+    for mob, expected_copy in expected.mobjects_to_copies.items():
+        mob_copy = state.mobjects_to_copies[mob]
+        family, expected_family = mob_copy.get_family(), expected_copy.get_family()
+        assert len(family) == len(expected_family)
+        for sm, expected_sm in zip(family, expected_family):
+            assert sm.data.tobytes() == expected_sm.data.tobytes()
+            assert sm.uniforms.keys() == expected_sm.uniforms.keys()
+            for key in sm.uniforms:
+                assert np.all(sm.uniforms[key] == expected_sm.uniforms[key])
+
+
+def restructure(scene, n):
+    # Changes which deltas can't express as changes to data fields
+    circle, group = scene.mobjects[:2]
+    if n % 4 == 1:
+        group.add(Square(side_length=0.1 * n))
+    if n % 5 == 2:
+        circle.insert_n_curves(2)
+    if n % 6 == 3 and len(scene.mobjects) > 3:
+        scene.mobjects.insert(2, scene.mobjects.pop())
+    if n % 9 == 4:
+        circle.set_shading(reflectiveness=0.01 * n)
+
+
+def record_states(store, scene, n_states):
+    """
+    Record n_states states of scene in store, returning what's stored for
+    each along with a whole SceneState of its own, as was kept for every
+    checkpoint before CheckpointStore
+    """
+    recorded, expected = [], []
+    for n in range(n_states):
+        advance(scene, n)
+        state = SceneState(scene, last_state=None)
+        expected.append(SceneState(scene, last_state=None))
+        previous = recorded[-1] if recorded else None
+        recorded.append(store.record(state, previous))
+    return recorded, expected
+
+
+def test_deltas_round_trip():
+    scene = get_scene()
+    checkpoint = last_state = None
+    checkpoints, expected = [], []
+    for n in range(50):
+        advance(scene, n)
+        restructure(scene, n)
+        # Sharing the copies of unchanged mobjects, as states of a scene do
+        state = SceneState(scene, last_state=last_state)
+        expected.append(SceneState(scene, last_state=None))
+        checkpoint = get_checkpoint_state(state, checkpoint, last_state)
+        checkpoints.append(checkpoint)
+        last_state = state
+    deltas = [cp for cp in checkpoints if isinstance(cp, SceneStateDelta)]
+    assert 0 < len(deltas) < len(checkpoints)
+    assert max(delta.depth for delta in deltas) == checkpoint_store.KEYFRAME_INTERVAL - 1
+    for cp, expected_state in zip(checkpoints, expected):
+        state = cp.get_scene_state() if isinstance(cp, SceneStateDelta) else cp
+        assert_states_match(state, expected_state)
+
+
+@pytest.fixture
+def store():
+    store = CheckpointStore()
+    yield store
+    store.close()
+
+
+@pytest.mark.parametrize("memory_budget", [0, 20000, checkpoint_store.DEFAULT_MEMORY_BUDGET])
+def test_states_round_trip(store, memory_budget):
+    store.memory_budget = memory_budget
+    recorded, expected = record_states(store, get_scene(), 45)
+    if memory_budget == 0:
+        assert store.spilled and store.spill_size > 0
+    # Restore them out of order, so that states move in and out of memory
+    order = [*range(0, 45, 4), *range(44, -1, -1), *range(1, 45, 3)]
+    for i in order:
+        assert_states_match(store.get_scene_state(recorded[i]), expected[i])
+
+
+def test_restored_states_are_independent(store):
+    store.memory_budget = 0
+    recorded, expected = record_states(store, get_scene(), 5)
+    state = store.get_scene_state(recorded[3])
+    for mob_copy in state.mobjects_to_copies.values():
+        mob_copy.shift(np.array([5, 0, 0]))
+    assert_states_match(store.get_scene_state(recorded[3]), expected[3])
+
+
+def test_discarded_states_are_compacted_away(store, monkeypatch):
+    monkeypatch.setattr(checkpoint_store, "SPILL_COMPACTION_THRESHOLD", 0)
+    store.memory_budget = 0
+    recorded, expected = record_states(store, get_scene(), 30)
+    full_size = store.spill_size
+    # As when the checkpoints after an edit are dropped
+    for state in recorded[10:]:
+        store.discard(state)
+    assert store.spill_size < full_size
+    assert store.dead_spill_size <= store.spill_size / 2
+    assert set(store.spill_records) <= set(map(id, recorded[:10]))
+    for state, expected_state in zip(recorded[:10], expected[:10]):
+        assert_states_match(store.get_scene_state(state), expected_state)
+
+    for state in recorded[:10]:
+        store.discard(state)
+    assert store.memory_used == 0
+    assert not store.in_memory and not store.spilled and not store.spill_records
@@ -0,0 +1,97 @@
+import difflib
+
+import pytest
+
+from maniml.scene.auto_reload import CodeAnalyzer
+
+SOURCE = '''\
+from maniml import *
+
+RADIUS = 1
+
+
+class Demo(Scene):
+    def construct(self):
+        circle = Circle(radius=RADIUS)
+        square = Square()
+        self.play(Create(circle))
+        self.play(
+            Transform(circle, square),
+            run_time=2,
+        )
+        for n in range(3):
+            self.play(circle.animate.shift(RIGHT))
+        self.wait()
+        self.play(FadeOut(circle))
+
+
+class Other(Scene):
+    def construct(self):
+        self.wait()
+'''
+
+
+def reference_first_changed_line(old_source, new_source):
+    # The first line of new_source in a change found by diffing lines, as
+    # edits used to be located
+    matcher = difflib.SequenceMatcher(
+        None, old_source.splitlines(True), new_source.splitlines(True)
+    )
+    lines = [j1 + 1 for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal']
+    return min(lines) if lines else None
+
+
+def find_changes(old_source, new_source, class_name="Demo"):
+    old, new = CodeAnalyzer(), CodeAnalyzer()
+    old.analyze_construct(old_source, class_name)
+    new.analyze_construct(new_source, class_name)
+    return new, old.find_changed_statements(new)
+
+
+@pytest.mark.parametrize("old,new,expected", [
+    ("square = Square()", "square = Square(side_length=3)", (1, 1)),
+    ("run_time=2,", "run_time=3,", (3, 3)),
+    ("range(3)", "range(4)", (4, 4)),
+    ("        self.wait()\n        self.play(FadeOut", "        self.wait(2)\n        self.play(FadeOut", (5, 5)),
+    ("        self.wait()\n        self.play(FadeOut", "        self.play(FadeOut", (5, 4)),
+    ("        self.wait()\n        self.play(FadeOut", "        self.wait()\n        self.wait()\n        self.play(FadeOut", (6, 6)),
+    ("circle = Circle(radius=RADIUS)", "circle = Circle(radius=2)", (0, 0)),
+])
+def test_changed_statements_match_line_diff(old, new, expected):
+    new_source = SOURCE.replace(old, new, 1)
+    assert new_source != SOURCE
+    analyzer, changes = find_changes(SOURCE, new_source)
+    assert changes == expected
+    # The line diff found the same first edit, give or take lines which
+    # belong to the statement before it, as with a deletion
+    first_line = reference_first_changed_line(SOURCE, new_source)
+    assert analyzer.get_statement_index(first_line) in (changes[0] - 1, changes[0])
+
+
+@pytest.mark.parametrize("old,new", [
+    ("        square = Square()\n", "        square = Square()  # A comment\n\n"),
+    ("Transform(circle, square),\n            run_time=2,\n        )", "Transform(circle, square), run_time=2)"),
+    ("self.wait()\n        self.play(FadeOut", "self.wait( )\n        self.play(FadeOut"),
+])
+def test_formatting_and_comments_change_nothing(old, new):
+    new_source = SOURCE.replace(old, new, 1)
+    assert new_source != SOURCE
+    # Which the line diff would have counted as edits
+    assert reference_first_changed_line(SOURCE, new_source) is not None
+    assert find_changes(SOURCE, new_source)[1] is None
+
+
+def test_changes_outside_construct_change_everything():
+    new_source = SOURCE.replace("RADIUS = 1", "RADIUS = 2")
+    analyzer, changes = find_changes(SOURCE, new_source)
+    assert changes == (0, len(analyzer.statements) - 1)
+
+
+def test_statement_spans():
+    analyzer = CodeAnalyzer()
+    analyzer.analyze_construct(SOURCE, "Demo")
+    assert [(start, end) for start, end, _ in analyzer.statements] == [
+        (8, 8), (9, 9), (10, 10), (11, 14), (15, 16), (17, 17), (18, 18),
+    ]
+    assert analyzer.get_statement_index(12) == 3
+    assert analyzer.get_statement_index(7) is None
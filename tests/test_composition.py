@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.animation.composition import AnimationGroup
+from maniml.manimgl_core.animation.composition import LaggedStart
+from maniml.manimgl_core.animation.fading import FadeIn
+from maniml.manimgl_core.animation.rotation import Rotating
+from maniml.manimgl_core.constants import PI
+from maniml.manimgl_core.constants import RIGHT
+from maniml.manimgl_core.mobject.geometry import Dot
+from maniml.manimgl_core.mobject.geometry import Square
+from maniml.manimgl_core.mobject.types.vectorized_mobject import VGroup
+from maniml.manimgl_core.utils.simple_functions import clip
+
+
+def shared_square_animations():
+    square = Square()
+    return square, [
+        square.animate(run_time=2).shift(RIGHT).set_color("#FF0000"),
+        Rotating(square, angle=PI / 3, run_time=1),
+    ]
+
+
+def shared_dot_animations():
+    dots = VGroup(*(Dot(RIGHT * n) for n in range(6)))
+    return dots, [
+        *(FadeIn(dot, shift=RIGHT) for dot in dots),
+        dots[2].animate(run_time=3).shift(RIGHT),
+    ]
+
+
+def interpolate_every_member(group, alpha):
+    time = alpha * group.max_end_time
+    for anim, start_time, end_time in group.anims_with_timings:
+        anim_time = end_time - start_time
+        anim.interpolate(0 if anim_time == 0 else clip((time - start_time) / anim_time, 0, 1))
+
+
+@pytest.mark.parametrize("get_animations,group_type,lag_ratio", [
+    (shared_square_animations, AnimationGroup, 0),
+    (shared_dot_animations, AnimationGroup, 0),
+    (shared_dot_animations, LaggedStart, 0.3),
+])
+def test_group_matches_interpolating_every_member(get_animations, group_type, lag_ratio):
+    mobject, animations = get_animations()
+    group = group_type(*animations, lag_ratio=lag_ratio)
+    ref_mobject, ref_animations = get_animations()
+    ref_group = group_type(*ref_animations, lag_ratio=lag_ratio)
+    group.begin()
+    ref_group.begin()
+    for alpha in np.linspace(0, 1, 31):
+        group.interpolate(alpha)
+        interpolate_every_member(ref_group, alpha)
+        for mob, ref_mob in zip(mobject.get_family(), ref_mobject.get_family()):
+            assert np.allclose(mob.get_points(), ref_mob.get_points())
+            assert np.allclose(mob.data["fill_rgba"], ref_mob.data["fill_rgba"])
+            assert np.allclose(mob.data["stroke_rgba"], ref_mob.data["stroke_rgba"])
+
+
+def test_group_leaves_members_without_shared_mobjects_alone():
+    dots = VGroup(*(Dot(RIGHT * n) for n in range(6)))
+    group = LaggedStart(*(FadeIn(dot) for dot in dots), lag_ratio=0.5)
+    assert all(len(indices) == 0 for indices in group.get_shared_indices())
+    _, animations = shared_dot_animations()
+    shared_indices = AnimationGroup(*animations).get_shared_indices()
+    assert list(shared_indices[2]) == [2, 6]
+    assert list(shared_indices[6]) == [2, 6]
+    assert len(shared_indices[0]) == 0
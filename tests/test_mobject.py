@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.camera.camera import Camera
+from maniml.manimgl_core.mobject.geometry import Circle
+from maniml.manimgl_core.mobject.geometry import Square
+from maniml.manimgl_core.mobject.types.dot_cloud import DotCloud
+from maniml.manimgl_core.mobject.types.vectorized_mobject import VGroup
+
+
+def get_mobjects():
+    return [
+        Circle().set_fill(opacity=0.5),
+        VGroup(Square(), Circle().shift(np.array([2, 0, 0]))),
+        DotCloud(np.random.default_rng(0).random((10, 3))),
+    ]
+
+
+def shares_data(mob1, mob2):
+    return all(
+        np.shares_memory(sm1.data, sm2.data)
+        for sm1, sm2 in zip(mob1.family_members_with_points(), mob2.family_members_with_points())
+    )
+
+
+@pytest.mark.parametrize("mob", get_mobjects())
+def test_copies_share_data_through_queries_and_rendering(mob):
+    # Copy-on-write data: a copy shares its original's data until one
+    # of the two changes it
+    camera = Camera(resolution=(64, 48))
+    camera.capture(mob)
+    mob_copy = mob.copy()
+    mob_copy.has_points()
+    mob_copy.get_num_points()
+    mob_copy.get_center()
+    mob_copy.get_width()
+    mob_copy.get_points()
+    mob_copy.get_all_points()
+    camera.capture(mob_copy)
+    assert shares_data(mob, mob_copy)
+    mob_copy.shift(np.array([1, 0, 0]))
+    assert not shares_data(mob, mob_copy)
+    assert np.allclose(mob_copy.get_center(), mob.get_center() + [1, 0, 0])
+
+
+def test_saved_state_shares_data_until_changed():
+    circle = Circle()
+    circle.save_state()
+    circle.get_points()
+    assert shares_data(circle, circle.saved_state)
+    circle.scale(2)
+    assert not shares_data(circle, circle.saved_state)
+    circle.restore()
+    assert np.isclose(circle.get_width(), 2)
+
+
+def test_points_are_read_only():
+    circle = Circle()
+    with pytest.raises(ValueError):
+        circle.get_points()[0] = [1, 1, 0]
+    with pytest.raises(ValueError):
+        circle.get_fill_opacities()[:] = 0
+
+
+def test_writable_points_unshare_and_count_as_changed():
+    circle = Circle()
+    circle_copy = circle.copy()
+    version = circle_copy._data_version
+    width = circle.get_width()
+    circle_copy.get_writable_points()[:, 0] *= 2
+    assert circle_copy._data_version != version
+    assert np.isclose(circle_copy.get_width(), 2 * width)
+    # The original keeps its own points
+    assert np.isclose(circle.get_width(), width)
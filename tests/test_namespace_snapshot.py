@@ -0,0 +1,146 @@
+import ast
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.mobject.geometry import Circle
+from maniml.manimgl_core.mobject.geometry import Square
+from maniml.manimgl_core.mobject.mobject import Group
+from maniml.manimgl_core.scene.scene import EndScene
+from maniml.scene.checkpoint_store import NamespaceSnapshot
+from maniml.scene.scene import Scene
+from maniml.scene.scene import is_resumable_statement
+
+
+def get_scene(*mobjects):
+    return SimpleNamespace(mobjects=list(mobjects))
+
+
+def test_restore_gives_values_as_snapshotted():
+    in_scene = Circle()
+    off_scene = Square().shift(np.array([1, 0, 0]))
+    scene = get_scene(in_scene)
+    namespace = dict(
+        count=3,
+        points=[np.array([1.0, 2.0, 3.0])],
+        labels={"a": [1, 2]},
+        mobs=Group(in_scene, off_scene),
+        off_scene=off_scene,
+        scene=scene,
+        np=np,
+    )
+    snapshot = NamespaceSnapshot(namespace, scene)
+    # Rerunning construct up to here would have rebuilt these
+    expected_center = off_scene.get_center().copy()
+
+    namespace["labels"]["a"].append(3)
+    namespace["points"][0][:] = 0
+    off_scene.shift(np.array([0, 4, 0]))
+
+    restored = snapshot.restore()
+    assert restored["count"] == 3
+    assert restored["labels"] == {"a": [1, 2]}
+    assert np.array_equal(restored["points"][0], [1.0, 2.0, 3.0])
+    # Mobjects, the scene and modules stay the live objects
+    assert restored["mobs"] is namespace["mobs"]
+    assert restored["off_scene"] is off_scene
+    assert restored["scene"] is scene
+    assert restored["np"] is np
+    assert np.allclose(off_scene.get_center(), expected_center)
+
+
+def test_restore_keeps_values_shared_with_functions():
+    history = [0]
+    mob = Circle()
+    trail = []
+
+    def step():
+        history.append(history[-1] + 1)
+
+    def record_trail(m):
+        trail.append(m.get_center())
+
+    mob.add_updater(record_trail)
+    scene = get_scene(mob)
+    namespace = dict(history=history, step=step, trail=trail, mob=mob)
+    snapshot = NamespaceSnapshot(namespace, scene)
+
+    restored = snapshot.restore()
+    # Pickled copies of these would no longer be what step and the
+    # updater change
+    assert restored["history"] is history
+    assert restored["trail"] is trail
+    restored["step"]()
+    assert restored["history"] == [0, 1]
+
+
+def test_restore_keeps_unpicklable_values_by_reference():
+    numbers = (n for n in range(3))
+    snapshot = NamespaceSnapshot(dict(numbers=numbers, count=1), get_scene())
+    restored = snapshot.restore()
+    assert restored["numbers"] is numbers
+    assert restored["count"] == 1
+
+
+def test_snapshots_share_copies_of_unchanged_mobjects():
+    off_scene = Square()
+    scene = get_scene()
+    first = NamespaceSnapshot(dict(mob=off_scene), scene)
+    second = NamespaceSnapshot(dict(mob=off_scene), scene, previous=first)
+    assert second.mobject_copies[off_scene] is first.mobject_copies[off_scene]
+
+    off_scene.shift(np.array([0, 1, 0]))
+    third = NamespaceSnapshot(dict(mob=off_scene), scene, previous=second)
+    assert third.mobject_copies[off_scene] is not second.mobject_copies[off_scene]
+    first.restore()
+    assert np.allclose(off_scene.get_center(), 0)
+    third.restore()
+    assert np.allclose(off_scene.get_center(), [0, 1, 0])
+
+
+def test_snapshots_holding_only_restorable_values_are_resumable():
+    mob = Circle()
+    mob.add_updater(lambda m: m.rotate(0.1))
+    namespace = dict(count=3, name="a", pair=(1, 2.0), mob=mob, group=Group(mob), np=np)
+    snapshot = NamespaceSnapshot(namespace, get_scene(mob), resumable=True)
+    assert snapshot.resumable
+
+
+def test_snapshots_sharing_mutable_values_are_not_resumable():
+    # The updater goes on adding to trail, which restoring the snapshot
+    # doesn't undo
+    trail = []
+    mob = Circle()
+    mob.add_updater(lambda m: trail.append(m.get_center()))
+    namespace = dict(trail=trail, mob=mob, count=1)
+    assert not NamespaceSnapshot(namespace, get_scene(mob), resumable=True).resumable
+    # Nor can a generator be put back as it was
+    namespace = dict(numbers=(n for n in range(3)))
+    assert not NamespaceSnapshot(namespace, get_scene(), resumable=True).resumable
+
+
+@pytest.mark.parametrize("code,resumable", [
+    ("self.play(FadeIn(circle))", True),
+    ("self.wait()", True),
+    ("x = self.play(FadeIn(circle))", False),
+    ("x += self.play(FadeIn(circle))", False),
+    ("print(self.play(FadeIn(circle)))", False),
+    ("for n in range(3):\n    self.play(FadeIn(circle))", False),
+])
+def test_statements_resumable_after_their_animation(code, resumable):
+    assert is_resumable_statement(ast.parse(code).body[0]) == resumable
+
+
+def test_running_statements_lets_the_scene_end():
+    scene = SimpleNamespace(
+        get_code_namespace=lambda: dict(EndScene=EndScene, counts=[]),
+        _animations_played=0,
+        _animations_to_play=1,
+        _scene_filepath="<scene>",
+        _statement_code=None,
+    )
+    statements = ast.parse("counts.append(1)\nraise EndScene()\ncounts.append(2)").body
+    with pytest.raises(EndScene):
+        Scene.run_construct_statements(scene, statements)
+    assert scene._statement_code is None
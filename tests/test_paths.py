@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.mobject.geometry import Circle
+from maniml.manimgl_core.mobject.geometry import Square
+from maniml.manimgl_core.utils.bezier import interpolate
+from maniml.manimgl_core.utils.paths import path_along_arc
+from maniml.manimgl_core.utils.paths import straight_path
+
+ALPHAS = [0, 1e-9, 0.25, 0.5, 0.75, 1 - 1e-9, 1, -0.3, 1.3]
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(100, 3)), rng.normal(size=(100, 3))
+
+
+@pytest.mark.parametrize("alpha", ALPHAS)
+def test_straight_path_into_out_matches_interpolate(points, alpha):
+    start, end = points
+    out = np.empty_like(start)
+    result = straight_path(start, end, alpha, out=out)
+    assert result is out
+    assert np.allclose(out, interpolate(start, end, alpha), rtol=0, atol=1e-12)
+
+
+def test_straight_path_into_out_ends_on_endpoints(points):
+    start, end = points
+    out = np.empty_like(start)
+    assert np.array_equal(straight_path(start, end, 0, out=out), start)
+    assert np.array_equal(straight_path(start, end, 1, out=out), end)
+
+
+@pytest.mark.parametrize("alpha", [0.2, 0.8])
+def test_straight_path_into_an_input(points, alpha):
+    start, end = points
+    expected = interpolate(start, end, alpha)
+    start = start.copy()
+    assert np.allclose(straight_path(start, end, alpha, out=start), expected)
+    assert np.allclose(start, expected)
+
+
+def test_straight_path_into_float32_out(points):
+    start, end = (arr.astype(np.float32) for arr in points)
+    out = np.empty_like(start)
+    straight_path(start, end, 0.3, out=out)
+    assert np.allclose(out, interpolate(start, end, 0.3), atol=1e-6)
+
+
+def test_arc_path_into_out(points):
+    start, end = points
+    path = path_along_arc(np.pi / 3)
+    out = np.empty_like(start)
+    assert np.allclose(path(start, end, 0.4, out=out), path(start, end, 0.4))
+    assert np.allclose(out, path(start, end, 0.4))
+
+
+@pytest.mark.parametrize("alpha", ALPHAS[:7])
+def test_mobject_interpolate_matches_reference(alpha):
+    mob1 = Circle().set_fill(opacity=0.5)
+    mob2 = Square().set_color("#FF0000").set_stroke(width=8)
+    mob2.align_data_and_family(mob1)
+    result = mob1.copy()
+    result.interpolate(mob1, mob2, alpha)
+    for key in mob1.data.dtype.names:
+        expected = interpolate(mob1.data[key], mob2.data[key], alpha)
+        assert np.allclose(result.data[key], expected, atol=1e-6), key
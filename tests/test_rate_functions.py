@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.animation.animation import Animation
+from maniml.manimgl_core.mobject.mobject import Group
+from maniml.manimgl_core.mobject.mobject import Mobject
+import maniml.manimgl_core.utils.rate_functions as gl_rate_functions
+from maniml.manimgl_core.utils.rate_functions import evaluate_rate_func
+from maniml.manimgl_core.utils.rate_functions import linear
+from maniml.manimgl_core.utils.rate_functions import not_quite_there
+from maniml.manimgl_core.utils.rate_functions import smooth
+from maniml.manimgl_core.utils.rate_functions import squish_rate_func
+import maniml.utils.rate_functions as rate_functions
+
+ALPHAS = np.hstack([np.linspace(0, 1, 101), [1 / 3, 0.5 - 1 / 6, 0.5 + 1 / 6]])
+
+
+def get_elementwise_rate_funcs():
+    funcs = {
+        name: func
+        for module in [gl_rate_functions, rate_functions]
+        for name, func in vars(module).items()
+        if getattr(func, "elementwise", False)
+    }
+    funcs.pop("elementwise", None)
+    funcs.update({
+        "squish_rate_func(smooth)": squish_rate_func(smooth, 0.2, 0.7),
+        "squish_rate_func(smooth, 0.5, 0.5)": squish_rate_func(smooth, 0.5, 0.5),
+        "not_quite_there(smooth)": not_quite_there(smooth),
+    })
+    return funcs
+
+
+ELEMENTWISE_RATE_FUNCS = get_elementwise_rate_funcs()
+
+
+@pytest.mark.parametrize("name", list(ELEMENTWISE_RATE_FUNCS))
+def test_elementwise_rate_func_matches_scalar_calls(name):
+    func = ELEMENTWISE_RATE_FUNCS[name]
+    expected = np.array([func(alpha) for alpha in ALPHAS], dtype=float)
+    result = evaluate_rate_func(func, ALPHAS)
+    assert result.shape == ALPHAS.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_wrappers_stay_unmarked_around_plain_functions():
+    func = squish_rate_func(lambda t: t**2)
+    assert not getattr(func, "elementwise", False)
+    assert not getattr(not_quite_there(lambda t: t**2), "elementwise", False)
+    assert np.allclose(evaluate_rate_func(func, ALPHAS), [func(a) for a in ALPHAS])
+
+
+@pytest.mark.parametrize("rate_func", [smooth, linear, lambda t: t**2])
+@pytest.mark.parametrize("n_mobjects", [3, 40])
+def test_sub_alphas_match_get_sub_alpha(rate_func, n_mobjects):
+    group = Group(*(Mobject() for _ in range(n_mobjects)))
+    animation = Animation(group, lag_ratio=0.1, rate_func=rate_func)
+    for alpha in np.linspace(0, 1, 11):
+        expected = [
+            animation.get_sub_alpha(alpha, index, n_mobjects)
+            for index in range(n_mobjects)
+        ]
+        result = animation.get_sub_alphas(alpha, n_mobjects)
+        assert np.allclose(result, expected, rtol=0, atol=1e-12)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.constants import PI
+from maniml.manimgl_core.constants import RIGHT
+from maniml.manimgl_core.mobject.geometry import Circle
+from maniml.manimgl_core.mobject.geometry import Square
+from maniml.manimgl_core.scene.scene import Scene
+
+
+def get_scene():
+    scene = Scene(
+        camera_config=dict(resolution=(64, 48)),
+        file_writer_config=dict(write_to_movie=False, save_last_frame=False),
+    )
+    square = Square().set_fill(opacity=0.5)
+    circle = Circle(radius=1.5).shift(RIGHT)
+    scene.add(square, circle)
+    return scene, square, circle
+
+
+def render(scene):
+    scene.camera.capture(*scene.render_groups)
+    return scene.camera.get_pixel_array()
+
+
+CHANGES = dict(
+    nothing=lambda scene, square, circle: None,
+    shift=lambda scene, square, circle: square.shift(0.5 * RIGHT),
+    set_color=lambda scene, square, circle: circle.set_color("#FF0000"),
+    set_stroke_width=lambda scene, square, circle: circle.set_stroke(width=12),
+    set_fill_opacity=lambda scene, square, circle: square.set_fill(opacity=1),
+    reorder=lambda scene, square, circle: scene.bring_to_back(circle),
+    remove=lambda scene, square, circle: scene.remove(circle),
+    move_camera=lambda scene, square, circle: scene.camera.frame.rotate(PI / 6),
+)
+
+
+@pytest.mark.parametrize("change", CHANGES.values(), ids=CHANGES.keys())
+def test_frame_key_changes_with_the_rendered_frame(change):
+    scene, square, circle = get_scene()
+    pixels = render(scene)
+    key = scene.get_frame_key()
+    change(scene, square, circle)
+    new_key = scene.get_frame_key()
+    new_pixels = render(scene)
+    assert (new_key == key) == np.array_equal(new_pixels, pixels)
+
+
+def test_unchanged_frames_are_not_captured_again():
+    scene, square, circle = get_scene()
+    captures = []
+    capture = scene.camera.capture
+    scene.camera.capture = lambda *mobjects: captures.append(capture(*mobjects))
+    for n in range(3):
+        scene.update_frame(dt=0.1)
+    assert len(captures) == 1
+    square.shift(RIGHT)
+    scene.update_frame(dt=0.1)
+    scene.update_frame(dt=0.1)
+    assert len(captures) == 2
+    # What was left on the frame buffer is what rendering afresh gives
+    pixels = scene.camera.get_pixel_array()
+    assert np.array_equal(pixels, render(scene))
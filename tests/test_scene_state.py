@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.mobject.geometry import Circle
+from maniml.manimgl_core.mobject.geometry import Square
+from maniml.manimgl_core.mobject.types.vectorized_mobject import VGroup
+from maniml.manimgl_core.scene.scene import SceneState
+
+
+def get_scene():
+    group = VGroup(Square(), Circle().shift(np.array([2, 0, 0])))
+    return SimpleNamespace(time=0, num_plays=0, mobjects=[Circle(), group], undo_stack=[])
+
+
+def write_points(scene):
+    scene.mobjects[0].get_writable_points()[:, 0] += 1
+
+
+def shift_submobject(scene):
+    scene.mobjects[1][1].shift(np.array([0, 1, 0]))
+
+
+def set_uniform(scene):
+    scene.mobjects[1][0].set_joint_type("bevel")
+
+
+def set_color(scene):
+    scene.mobjects[0].set_stroke(color="#FF0000")
+
+
+def do_nothing(scene):
+    pass
+
+
+@pytest.mark.parametrize("change", [write_points, shift_submobject, set_uniform, set_color, do_nothing])
+def test_copies_are_reused_only_when_unchanged(change):
+    scene = get_scene()
+    state = SceneState(scene)
+    change(scene)
+    new_state = SceneState(scene, last_state=state)
+    for mob in scene.mobjects:
+        old_copy = state.mobjects_to_copies[mob]
+        new_copy = new_state.mobjects_to_copies[mob]
+        # Comparing data, as scene states used to, agrees with versions
+        assert (new_copy is old_copy) == old_copy.looks_identical(mob)
+        assert new_copy.looks_identical(mob)
+
+
+def test_state_after_writing_points_in_place():
+    scene = get_scene()
+    circle = scene.mobjects[0]
+    state = SceneState(scene)
+    points = circle.get_writable_points()
+    points[:, 0] += 1
+    new_state = SceneState(scene, last_state=state)
+    assert np.allclose(new_state.mobjects_to_copies[circle].get_points(), points)
+    state.restore_scene(scene)
+    assert np.allclose(circle.get_points()[:, 0], points[:, 0] - 1)
+
+
+def test_points_cant_be_changed_unnoticed():
+    scene = get_scene()
+    state = SceneState(scene)
+    with pytest.raises(ValueError):
+        scene.mobjects[0].get_points()[:, 0] += 1
+    assert SceneState(scene, last_state=state).mobjects_to_copies == state.mobjects_to_copies
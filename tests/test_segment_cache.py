@@ -0,0 +1,88 @@
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+
+from maniml.manimgl_core.animation.creation import ShowCreation
+from maniml.manimgl_core.mobject.geometry import Circle
+from maniml.manimgl_core.scene.segment_cache import get_segment_key
+from maniml.manimgl_core.scene.segment_cache import is_library_class
+from maniml.manimgl_core.scene.segment_cache import is_library_file
+from maniml.manimgl_core.utils.rate_functions import smooth
+
+SCENE_FILE = '''
+import numpy as np
+
+SPEED = {speed}
+
+
+def drift(mob, dt):
+    mob.shift({step} * SPEED * dt * np.array([1, 0, 0]))
+
+
+class Marker:
+    size = 2
+'''
+
+
+def load_scene_file(tmp_path, name, **values):
+    """
+    Run a scene file the way `python -m maniml` does, as a module named
+    __main__ which isn't the one in sys.modules
+    """
+    path = tmp_path / f"{name}.py"
+    path.write_text(SCENE_FILE.format(**values))
+    namespace = {"__name__": "__main__", "__file__": str(path)}
+    exec(compile(path.read_text(), str(path), "exec"), namespace)
+    return namespace
+
+
+def get_key(updater, *inputs):
+    circle = Circle()
+    circle.add_updater(updater)
+    scene = SimpleNamespace(mobjects=[circle], time=0)
+    return get_segment_key(scene, ShowCreation(circle, rate_func=smooth), *inputs)
+
+
+def test_scene_file_code_is_not_library_code(tmp_path):
+    assert sys.modules["__main__"].__name__ == "__main__"
+    namespace = load_scene_file(tmp_path, "scene", speed=1, step=0.1)
+    assert not is_library_file(namespace["drift"].__code__.co_filename)
+    assert not is_library_class(namespace["Marker"])
+    assert is_library_file(smooth.__code__.co_filename)
+    assert is_library_class(Circle)
+
+
+def test_key_follows_updater_code(tmp_path):
+    # Keys only depend on what the code says, not on which file has it
+    first = load_scene_file(tmp_path, "first", speed=1, step=0.1)
+    same = load_scene_file(tmp_path, "same", speed=1, step=0.1)
+    edited = load_scene_file(tmp_path, "edited", speed=1, step=0.2)
+    assert get_key(first["drift"]) == get_key(same["drift"])
+    assert get_key(first["drift"]) != get_key(edited["drift"])
+
+
+def test_key_follows_globals_read_by_updaters(tmp_path):
+    first = load_scene_file(tmp_path, "first", speed=1, step=0.1)
+    faster = load_scene_file(tmp_path, "faster", speed=3, step=0.1)
+    assert get_key(first["drift"]) != get_key(faster["drift"])
+    first["SPEED"] = 3
+    assert get_key(first["drift"]) == get_key(faster["drift"])
+
+
+def test_key_follows_scene_file_classes(tmp_path):
+    first = load_scene_file(tmp_path, "first", speed=1, step=0.1)
+    same = load_scene_file(tmp_path, "same", speed=1, step=0.1)
+    key = get_key(first["drift"], first["Marker"])
+    assert key == get_key(same["drift"], same["Marker"])
+    same["Marker"].size = 3
+    assert key != get_key(same["drift"], same["Marker"])
+
+
+def test_key_follows_mobject_data():
+    def updater(mob):
+        pass
+
+    key = get_key(updater)
+    assert key == get_key(updater)
+    assert key != get_key(updater, np.array([1, 2]))
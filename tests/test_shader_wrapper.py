@@ -0,0 +1,38 @@
+import numpy as np
+
+from maniml.manimgl_core.camera.camera import Camera
+from maniml.manimgl_core.constants import PI
+from maniml.manimgl_core.constants import RIGHT
+from maniml.manimgl_core.constants import UP
+from maniml.manimgl_core.mobject.geometry import Square
+from maniml.manimgl_core.mobject.types.vectorized_mobject import VGroup
+
+
+CHANGES = [
+    lambda squares: None,
+    lambda squares: squares[3].shift(0.2 * UP),
+    lambda squares: (squares[0].set_color("#FF0000"), squares[5].set_color("#00FF00")),
+    lambda squares: squares[-1].rotate(PI / 5),
+    lambda squares: squares[4:7].set_stroke(width=8),
+    lambda squares: squares[2].set_points(squares[2].get_points()[::-1]),
+    lambda squares: squares.shift(0.1 * RIGHT),
+    lambda squares: squares[6].get_writable_points().__iadd__(0.2 * UP),
+    lambda squares: squares[1].set_points(squares[1].get_points()[:7]),
+]
+
+
+def test_vbo_matches_full_rewrite_as_mobjects_change():
+    camera = Camera(resolution=(64, 48))
+    squares = VGroup(*(Square(side_length=0.5).shift((n - 4) * RIGHT) for n in range(9)))
+    squares.set_fill(opacity=0.5)
+    for change in CHANGES:
+        change(squares)
+        camera.capture(squares)
+        pixels = camera.get_pixel_array()
+        assert len(squares.shader_wrappers) == 1
+        wrapper = squares.shader_wrappers[0]
+        expected = np.concatenate([sm.get_shader_data() for sm in squares.family_members_with_points()])
+        assert wrapper.vbo.read() == expected.tobytes()
+        # A copy has fresh wrappers, so renders from a full write
+        camera.capture(squares.copy())
+        assert np.array_equal(pixels, camera.get_pixel_array())
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.animation.fading import FadeIn
+from maniml.manimgl_core.animation.transform import Transform
+from maniml.manimgl_core.constants import RIGHT
+from maniml.manimgl_core.constants import UP
+from maniml.manimgl_core.mobject.geometry import Circle
+from maniml.manimgl_core.mobject.geometry import Dot
+from maniml.manimgl_core.mobject.geometry import Square
+from maniml.manimgl_core.mobject.mobject import Group
+from maniml.manimgl_core.mobject.types.dot_cloud import DotCloud
+from maniml.manimgl_core.mobject.types.vectorized_mobject import VGroup
+from maniml.manimgl_core.utils.rate_functions import there_and_back
+
+
+def squares_to_circles():
+    squares = VGroup(*(Square(side_length=0.5).shift(n * RIGHT) for n in range(6)))
+    circles = VGroup(*(Circle(radius=0.3).shift(n * UP) for n in range(6)))
+    circles.set_fill("#FF0000", opacity=0.8).set_stroke(width=6)
+    return Transform(squares, circles, lag_ratio=0.2, rate_func=there_and_back)
+
+
+def nested_family():
+    start = VGroup(*(VGroup(Square(), Circle()).shift(n * RIGHT) for n in range(3)))
+    target = start.copy().arrange(UP).set_color("#00FF00")
+    return Transform(start, target)
+
+
+def mixed_dtypes():
+    start = Group(*(Dot(n * RIGHT) for n in range(3)), DotCloud(np.random.default_rng(0).random((20, 3))))
+    target = start.copy().shift(UP).set_opacity(0.3)
+    # Every key of the cloud changes
+    target[-1].set_radius(0.2)
+    return Transform(start, target, lag_ratio=0.1)
+
+
+def fade_in():
+    return FadeIn(VGroup(*(Dot(n * RIGHT) for n in range(5))), shift=UP, lag_ratio=0.3)
+
+
+@pytest.mark.parametrize("get_animation", [squares_to_circles, nested_family, mixed_dtypes, fade_in])
+def test_packed_interpolation_matches_per_member(get_animation):
+    anim = get_animation()
+    ref_anim = get_animation()
+    anim.begin()
+    ref_anim.begin()
+    assert len(anim.packs) > 0
+    # Without packs, Transform interpolates member by member
+    ref_anim.packs = []
+    for alpha in np.linspace(0, 1, 17):
+        anim.interpolate(alpha)
+        ref_anim.interpolate(alpha)
+        for mob, ref_mob in zip(anim.mobject.get_family(), ref_anim.mobject.get_family()):
+            assert np.array_equal(mob.data, ref_mob.data)
+            assert np.array_equal(mob.get_bounding_box(), ref_mob.get_bounding_box())
+    anim.finish()
+    ref_anim.finish()
+    for mob, ref_mob in zip(anim.mobject.get_family(), ref_anim.mobject.get_family()):
+        assert np.array_equal(mob.data, ref_mob.data)
+
+
+def test_packed_interpolation_falls_back_when_data_is_replaced():
+    anim = squares_to_circles()
+    ref_anim = squares_to_circles()
+    anim.begin()
+    ref_anim.begin()
+    ref_anim.packs = []
+    for alpha in np.linspace(0, 1, 9):
+        if alpha > 0.5:
+            for mob in (anim.mobject[2], ref_anim.mobject[2]):
+                mob.data = mob.data.copy()
+        anim.interpolate(alpha)
+        ref_anim.interpolate(alpha)
+        for mob, ref_mob in zip(anim.mobject.get_family(), ref_anim.mobject.get_family()):
+            assert np.array_equal(mob.data, ref_mob.data)
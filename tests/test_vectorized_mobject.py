@@ -0,0 +1,197 @@
+import numpy as np
+import pytest
+
+from maniml.manimgl_core.constants import OUT
+from maniml.manimgl_core.constants import PI
+from maniml.manimgl_core.constants import RIGHT
+from maniml.manimgl_core.constants import TAU
+from maniml.manimgl_core.mobject.geometry import Arc
+from maniml.manimgl_core.mobject.geometry import Circle
+from maniml.manimgl_core.mobject.geometry import Polygon
+from maniml.manimgl_core.mobject.geometry import Square
+from maniml.manimgl_core.mobject.types.vectorized_mobject import VMobject
+from maniml.manimgl_core.utils.bezier import inverse_interpolate
+from maniml.manimgl_core.utils.bezier import partial_quadratic_bezier_points
+from maniml.manimgl_core.utils.space_ops import get_norm
+from maniml.manimgl_core.utils.space_ops import rotation_between_vectors
+
+
+def reference_curve_and_prop_of_partial_point(vmob, alpha):
+    # point_from_proportion's lookup as it was before the arc length table
+    if alpha == 0:
+        return (0, 0.0)
+    partials = [0]
+    for tup in vmob.get_bezier_tuples():
+        if vmob.consider_points_equal(tup[0], tup[1]):
+            arclen = 0
+        else:
+            arclen = get_norm(tup[2] - tup[0])
+        partials.append(partials[-1] + arclen)
+    full = partials[-1]
+    if full == 0:
+        return len(partials), 1.0
+    index = next(
+        (i for i, x in enumerate(partials) if x >= full * alpha),
+        len(partials) - 1
+    )
+    residue = float(inverse_interpolate(
+        partials[index - 1] / full, partials[index] / full, alpha
+    ))
+    return index - 1, residue
+
+
+def reference_point_from_proportion(vmob, alpha):
+    if alpha <= 0:
+        return vmob.get_start()
+    elif alpha >= 1:
+        return vmob.get_end()
+    index, residue = reference_curve_and_prop_of_partial_point(vmob, alpha)
+    return vmob.get_nth_curve_function(index)(residue)
+
+
+def get_test_paths():
+    wave = VMobject()
+    xs = np.linspace(-5, 5, 121)
+    wave.set_points_smoothly(np.array([xs, np.sin(xs), 0 * xs]).T)
+    # A path with a null curve in the middle of it
+    kinked = VMobject()
+    kinked.set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 0, 0], [1, 2, 0]])
+    return [Circle(), Polygon([0, 0, 0], [3, 0, 0], [1, 1, 0]), wave, kinked]
+
+
+@pytest.mark.parametrize("vmob", get_test_paths())
+def test_points_from_proportions_matches_reference(vmob):
+    alphas = np.hstack([[-0.5, 0, 1, 1.5], np.linspace(0, 1, 257)])
+    expected = [reference_point_from_proportion(vmob, a) for a in alphas]
+    assert np.allclose(vmob.points_from_proportions(alphas), expected, atol=1e-6)
+    for alpha, point in zip(alphas, expected):
+        assert np.allclose(vmob.point_from_proportion(alpha), point, atol=1e-6)
+
+
+@pytest.mark.parametrize("vmob", get_test_paths())
+def test_arc_length_table_matches_reference(vmob):
+    lengths = [
+        0 if vmob.consider_points_equal(tup[0], tup[1]) else get_norm(tup[2] - tup[0])
+        for tup in vmob.get_bezier_tuples()
+    ]
+    assert np.allclose(vmob.get_arc_length_table(), np.cumsum([0, *lengths]))
+
+
+def test_arc_length_table_follows_changes():
+    vmob = Circle(radius=1)
+    full = vmob.get_arc_length_table()[-1]
+    vmob.scale(2)
+    assert np.isclose(vmob.get_arc_length_table()[-1], 2 * full)
+    assert np.allclose(
+        vmob.points_from_proportions([0.3]),
+        [reference_point_from_proportion(vmob, 0.3)],
+    )
+
+
+def test_arc_length_table_follows_points_written_in_place():
+    vmob = get_test_paths()[2]
+    vmob.get_arc_length_table()
+    vmob.get_writable_points()[:len(vmob.get_points()) // 2, 1] *= 3
+    alphas = np.linspace(0, 1, 33)
+    expected = [reference_point_from_proportion(vmob, a) for a in alphas]
+    assert np.allclose(vmob.points_from_proportions(alphas), expected, atol=1e-6)
+    assert np.allclose(vmob.point_from_proportion(0.3), reference_point_from_proportion(vmob, 0.3))
+
+
+def reference_insertions_per_curve(n, norms):
+    # align_points' loop, giving one insertion at a time to the curve
+    # whose pieces are longest
+    norms = list(norms)
+    ipc = np.zeros(len(norms), dtype=int)
+    for _ in range(n):
+        index = np.argmax(norms)
+        ipc[index] += 1
+        norms[index] *= ipc[index] / (ipc[index] + 1)
+    return ipc
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("n", [0, 1, 7, 50, 333])
+def test_insertions_per_curve_matches_reference(seed, n):
+    rng = np.random.default_rng(seed)
+    norms = rng.uniform(0, 3, rng.integers(1, 40))
+    norms[rng.random(len(norms)) < 0.2] = 0
+    ipc = VMobject.get_insertions_per_curve(n, norms)
+    expected = reference_insertions_per_curve(n, norms)
+    assert (ipc == expected).all()
+
+
+def test_insertions_per_curve_on_equal_lengths():
+    # Exact ties may be broken differently from the loop's, but always
+    # leave the same longest piece
+    norms = np.ones(4)
+    ipc = VMobject.get_insertions_per_curve(6, norms)
+    assert sorted(ipc) == [1, 1, 2, 2]
+    assert (VMobject.get_insertions_per_curve(8, norms) == 2).all()
+
+
+@pytest.mark.parametrize("n", [0, 3, 40])
+def test_insert_n_curves_matches_reference(n):
+    vmob = get_test_paths()[2]
+    points = vmob.get_points()
+    ipc = VMobject.get_insertions_per_curve(n, np.linalg.norm(points[2::2] - points[0:-1:2], axis=1))
+    expected = [points[0]]
+    for tup, n_inserts in zip(vmob.get_bezier_tuples_from_points(points), ipc):
+        alphas = np.linspace(0, 1, n_inserts + 2)
+        for a1, a2 in zip(alphas, alphas[1:]):
+            expected.extend(partial_quadratic_bezier_points(tup, a1, a2)[1:])
+    assert np.allclose(vmob.insert_n_curves_to_point_list(n, points), expected)
+
+
+def reference_joint_angles(vmob):
+    # get_joint_angles as it was before joint angles were batched
+    points = vmob.get_points() @ rotation_between_vectors(OUT, vmob.get_unit_normal())
+    if len(points) < 3:
+        return vmob.data["joint_angle"][:, 0].copy()
+    a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
+    v_in = np.zeros(points.shape)
+    v_out = np.zeros(points.shape)
+    v_in[1::2] = h - a0
+    v_in[2::2] = a1 - h
+    v_out[0:-1:2] = h - a0
+    v_out[1::2] = a1 - h
+    ends = vmob.get_subpath_end_indices()
+    starts = [0, *(e + 2 for e in ends[:-1])]
+    for start, end in zip(starts, ends):
+        if start == end:
+            continue
+        if (points[start] == points[end]).all():
+            v_in[start] = v_out[end - 1]
+            v_out[end] = v_in[start + 1]
+        else:
+            v_in[start] = v_out[start]
+            v_out[end] = v_in[end]
+    angle_diffs = np.arctan2(v_out[:, 1], v_out[:, 0]) - np.arctan2(v_in[:, 1], v_in[:, 0])
+    angle_diffs[angle_diffs < -PI] += TAU
+    angle_diffs[angle_diffs > PI] -= TAU
+    return angle_diffs
+
+
+def get_joint_angle_test_family():
+    # Two subpaths, one closed and one open
+    two_paths = Square()
+    two_paths.append_vectorized_mobject(Arc(angle=PI).shift(3 * RIGHT))
+    short = VMobject()
+    short.set_points([[0, 0, 0]])
+    return VMobject().add(
+        *get_test_paths(),
+        Arc(start_angle=PI / 4, angle=3 * PI / 2),
+        two_paths,
+        short,
+        Square().rotate(PI / 3, axis=RIGHT),
+    )
+
+
+def test_batched_joint_angles_match_reference():
+    family = get_joint_angle_test_family()
+    expected = [reference_joint_angles(vmob) for vmob in family.get_family()]
+    family.update_family_joint_angles(refresh=True)
+    for vmob, angles in zip(family.get_family(), expected):
+        stored = vmob.data["joint_angle"][:, 0]
+        assert np.array_equal(stored, angles.astype(stored.dtype))
+        assert not vmob.needs_new_joint_angles